@@ -0,0 +1,292 @@
+import argparse
+import functools
+import gc
+import linecache
+import os
+import sys
+import tracemalloc
+
+from alphabet import Alphabet
+from game_manager import GameManager
+from letter import Letter
+from menu_bar import MenuBar
+from old_man import OldMan
+from phrase import Phrase
+from popup import Popup
+from score import Score
+from shop import Shop
+from strikes import Strikes
+from topic import Topic
+
+
+# Draw methods measured individually. Nested ones (Letter.draw inside
+# Phrase.draw, _build_item_rows inside Shop.draw) are reported on their own
+# and also count towards their caller.
+INSTRUMENTED = [
+    (GameManager, 'draw'), (Phrase, 'draw'), (Letter, 'draw'), (Alphabet, 'draw'),
+    (Strikes, 'draw'), (Topic, 'draw'), (Score, 'draw'), (MenuBar, 'draw'),
+    (Shop, 'draw'), (Shop, '_build_item_rows'), (Popup, 'draw'), (OldMan, 'draw'),
+]
+
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class AllocTracker:
+    """
+    Per-frame allocation report built on tracemalloc.
+
+    Three numbers are kept for every frame:
+      transient — peak Python memory above the frame's starting point, i.e.
+                  the short-lived garbage the frame creates. Also kept per
+                  instrumented draw method.
+      gc        — garbage collections that ran during the frame.
+
+    Over the whole measuring window it also keeps
+      retained  — memory allocated from this project's files since the
+                  window started and still held, grouped by source line.
+                  In a steady-state screen this should stay close to zero
+                  (pygame's freelists add a little noise); steady growth is
+                  a cache growing or a leak.
+
+    tracemalloc only sees memory allocated through Python, so surface pixel
+    buffers (allocated by SDL) don't show up, but the Surface objects, Rects
+    and strings wrapped around them do.
+
+    Call begin_frame() before drawing and end_frame() after, and reset() to
+    start a new window (e.g. after warm-up frames). instrument()
+    wraps the draw methods in INSTRUMENTED so they can be measured
+    separately; uninstrument() puts them back.
+    """
+
+    def __init__(self):
+        self.frames      = 0
+        self.transient   = []   # Per-frame transient peak, bytes
+        self.collections = []   # Per-frame GC runs
+        self.widgets     = {}   # {name: [transient peak per call]}
+
+        self._stack      = []   # [start, peak so far] for each draw call in progress
+        self._gc_runs    = 0
+        self._originals  = []
+        self._baseline   = None  # Snapshot taken when the window started
+
+    # --- Setup ---
+
+    def start(self):
+        tracemalloc.start()
+        gc.callbacks.append(self._on_gc)
+        self.reset()
+
+    def stop(self):
+        gc.callbacks.remove(self._on_gc)
+        tracemalloc.stop()
+
+    def instrument(self):
+        for cls, name in INSTRUMENTED:
+            original = cls.__dict__[name]
+            self._originals.append((cls, name, original))
+            setattr(cls, name, self._wrap(f'{cls.__name__}.{name}', original))
+
+    def uninstrument(self):
+        for cls, name, original in self._originals:
+            setattr(cls, name, original)
+        self._originals = []
+
+    def _wrap(self, label, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            self._enter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.widgets.setdefault(label, []).append(self._exit())
+        return wrapper
+
+    def _on_gc(self, phase, info):
+        if phase == 'start':
+            self._gc_runs += 1
+
+    # --- Peak bookkeeping ---
+    # tracemalloc has one global peak, so nested measurements save the
+    # caller's peak so far before resetting it, and hand theirs back on exit.
+
+    def _enter(self):
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            self._stack[-1][1] = max(self._stack[-1][1], peak)
+        self._stack.append([current, current])
+        tracemalloc.reset_peak()
+
+    def _exit(self):
+        _, peak = tracemalloc.get_traced_memory()
+        start, saved = self._stack.pop()
+        peak = max(saved, peak)
+        if self._stack:
+            self._stack[-1][1] = max(self._stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        return peak - start
+
+    # --- Frames ---
+
+    def begin_frame(self):
+        self._gc_runs = 0
+        self._enter()
+
+    def end_frame(self):
+        self.transient.append(self._exit())
+        self.collections.append(self._gc_runs)
+        self.frames += 1
+
+    def _take_snapshot(self):
+        """Snapshot of allocations made from this project's source files only."""
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(True, os.path.join(SOURCE_DIR, '*')),
+            tracemalloc.Filter(False, __file__),
+        ])
+
+    def reset(self):
+        """Discard everything measured so far and start a new window."""
+        self.frames      = 0
+        self.transient   = []
+        self.collections = []
+        self.widgets     = {}
+        self._baseline   = self._take_snapshot()
+
+    # --- Report ---
+
+    def retained_sites(self):
+        """Return {'file:line': bytes} allocated since the window started and still held."""
+        sites = {}
+        for stat in self._take_snapshot().compare_to(self._baseline, 'lineno'):
+            if stat.size_diff:
+                frame = stat.traceback[0]
+                sites[f'{os.path.relpath(frame.filename, SOURCE_DIR)}:{frame.lineno}'] = stat.size_diff
+        return sites
+
+    def summary(self):
+        """Return per-frame means of transient bytes, retained bytes and GC runs."""
+        frames = max(self.frames, 1)
+        return {
+            'transient': sum(self.transient) / frames,
+            'retained':  sum(self.retained_sites().values()) / frames,
+            'gc':        sum(self.collections) / frames,
+        }
+
+    def report(self, top=10):
+        s     = self.summary()
+        lines = [
+            f'{self.frames} frames — per frame: transient {s["transient"]:,.0f} B, '
+            f'retained {s["retained"]:+,.0f} B, {s["gc"]:.2f} GC runs',
+            '',
+            f'  {"draw call":<28}{"calls/frame":>12}{"mean B":>10}{"max B":>10}',
+        ]
+        frames = max(self.frames, 1)
+        for label, sizes in sorted(self.widgets.items(), key=lambda kv: -sum(kv[1])):
+            lines.append(f'  {label:<28}{len(sizes) / frames:>12.1f}'
+                         f'{sum(sizes) / len(sizes):>10,.0f}{max(sizes):>10,}')
+
+        sites = sorted(self.retained_sites().items(), key=lambda kv: -abs(kv[1]))[:top]
+        if sites:
+            lines += ['', '  retained by call site (whole window)']
+            for site, size in sites:
+                filename, lineno = site.rsplit(':', 1)
+                source = linecache.getline(os.path.join(SOURCE_DIR, filename), int(lineno)).strip()
+                lines.append(f'  {size:>+10,} B  {site:<22} {source}')
+        return '\n'.join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Budgets for steady-state screens
+# ---------------------------------------------------------------------------
+# Run `python alloc_tracker.py` (headless is fine) after touching draw code.
+# It exits non-zero if any screen goes over budget; test_alloc_tracker.py
+# runs the same check under pytest, for CI. Numbers are per frame,
+# measured after warm-up, so lazily built caches don't count.
+
+BUDGETS = {
+    #  screen         transient B         retained B       GC runs
+    'idle_board':  {'transient': 2_000, 'retained': 32, 'gc': 0.05},
+    'shop_open':   {'transient': 3_000, 'retained': 32, 'gc': 0.05},
+    'win_popup':   {'transient': 2_000, 'retained': 32, 'gc': 0.05},
+    'old_man':     {'transient': 2_000, 'retained': 32, 'gc': 0.05},
+}
+
+
+def build_screen(name):
+    """Return a draw() callable that renders one frame of the named screen the way main.py does."""
+    import pygame
+    from constants import SCREEN_SIZE
+
+    screen   = pygame.display.get_surface() or pygame.display.set_mode(SCREEN_SIZE)
+    font     = pygame.font.SysFont('Arial', 32)
+    shop     = Shop(font, *SCREEN_SIZE)
+    score    = Score(font)
+    menu_bar = MenuBar(font, SCREEN_SIZE[0], shop)
+    manager  = GameManager(font, shop, seed=0)
+    shop.manager = score.manager = menu_bar.manager = manager
+    old_man  = OldMan(font, *SCREEN_SIZE)
+    popup    = None
+
+    for letter in 'ETAON':
+        manager.guess(letter)
+    if name == 'shop_open':
+        manager.money = 10_000
+        manager.mark_changed()
+        shop.visible  = True
+    elif name == 'win_popup':
+        popup = Popup('You Win!', font, *SCREEN_SIZE, phrase=manager.phrase.word)
+    elif name == 'old_man':
+        old_man.visible = True
+
+    def draw():
+        screen.fill('black')
+        manager.draw(screen)
+        score.draw(screen)
+        menu_bar.draw(screen)
+        shop.draw(screen)
+        if popup:
+            popup.draw(screen)
+        old_man.draw(screen)
+        pygame.display.update()
+    return draw
+
+
+def check_budgets(warmup=60, frames=300, verbose=False):
+    """Measure every screen in BUDGETS. Returns a list of (screen, metric, measured, budget) overruns."""
+    import pygame
+    pygame.init()
+
+    overruns = []
+    for name, budget in BUDGETS.items():
+        draw    = build_screen(name)
+        tracker = AllocTracker()
+        tracker.start()
+        tracker.instrument()
+        try:
+            for i in range(warmup + frames):
+                if i == warmup:
+                    tracker.reset()
+                tracker.begin_frame()
+                draw()
+                tracker.end_frame()
+            measured = tracker.summary()
+            failed   = [(name, k, measured[k], budget[k]) for k in budget if measured[k] > budget[k]]
+            report   = tracker.report() if verbose or failed else None
+        finally:
+            tracker.uninstrument()
+            tracker.stop()
+
+        overruns += failed
+        print(f'{name:<12} {"OVER BUDGET" if failed else "ok":<12}'
+              + '  '.join(f'{k} {measured[k]:,.2f}/{budget[k]:,}' for k in budget))
+        if report:
+            print(report)
+            print()
+    pygame.quit()
+    return overruns
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Check per-frame allocation budgets for steady-state screens')
+    parser.add_argument('--verbose', action='store_true', help='Print the full report for every screen')
+    args = parser.parse_args()
+    sys.exit(1 if check_budgets(verbose=args.verbose) else 0)
\ No newline at end of file
@@ -2,10 +2,46 @@ import pygame
 from constants import LETTER_SLOT_WIDTH, LETTER_SLOT_HEIGHT, GAP
 
 
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Glyph colours for the two atlas rows
+UNGUESSED_COLOR = 'white'
+GUESSED_COLOR   = '#333333'
+
+# One atlas per font, shared by every Alphabet built from it (a new one is built each round)
+_atlases = {}
+
+# Letter slot rects per screen size, shared read-only by every Alphabet of that size
+_slot_layouts = {}
+
+
+def _get_atlas(font):
+    """
+    Return the glyph atlas for font, rendering it on first use.
+    Row 0 holds the 26 unguessed glyphs, row 1 the 26 guessed glyphs, each
+    centred in a LETTER_SLOT_WIDTH × LETTER_SLOT_HEIGHT cell.
+    """
+    atlas = _atlases.get(font)
+    if atlas is None:
+        atlas = pygame.Surface((26 * LETTER_SLOT_WIDTH, 2 * LETTER_SLOT_HEIGHT), pygame.SRCALPHA)
+        for row, color in enumerate((UNGUESSED_COLOR, GUESSED_COLOR)):
+            for i, char in enumerate(ALPHABET):
+                cell = pygame.Rect(i * LETTER_SLOT_WIDTH, row * LETTER_SLOT_HEIGHT,
+                                   LETTER_SLOT_WIDTH, LETTER_SLOT_HEIGHT)
+                surface = font.render(char, True, color)
+                atlas.blit(surface, surface.get_rect(center=cell.center))
+        _atlases[font] = atlas
+    return atlas
+
+
 class Alphabet:
     """
     Displays the full A-Z alphabet at the bottom of the screen.
     Letters darken when guessed to show the player what has already been tried.
+
+    Glyphs come from a shared two-row atlas (white and dark grey) and are
+    composed into a bar surface on first draw. guess() then only patches
+    that letter's cell, so each frame costs a single blit.
     """
 
     def __init__(self, font, screen_width, screen_height):
@@ -19,25 +55,50 @@ class Alphabet:
         start_x = (screen_width - total_width) // 2
         y = screen_height - LETTER_SLOT_HEIGHT - 20
 
-        # Build a rect for each letter to use as a position reference when drawing
-        self.letter_slots = {}
-        for i, char in enumerate('ABCDEFGHIJKLMNOPQRSTUVWXYZ'):
-            x = start_x + i * (LETTER_SLOT_WIDTH + GAP)
-            self.letter_slots[char] = pygame.Rect(x, y, LETTER_SLOT_WIDTH, LETTER_SLOT_HEIGHT)
+        # A rect for each letter to use as a position reference when drawing
+        layout = _slot_layouts.get((screen_width, screen_height))
+        if layout is None:
+            layout = {
+                char: pygame.Rect(start_x + i * (LETTER_SLOT_WIDTH + GAP), y, LETTER_SLOT_WIDTH, LETTER_SLOT_HEIGHT)
+                for i, char in enumerate(ALPHABET)
+            }
+            _slot_layouts[(screen_width, screen_height)] = layout
+        self.letter_slots = layout
+
+        # Composed bar — built lazily in draw() so headless play never renders
+        self.bar_rect = pygame.Rect(start_x, y, total_width, LETTER_SLOT_HEIGHT)
+        self._bar = None
+        self._dirty = []  # Letters guessed since the bar was last patched
 
     def guess(self, letter):
         """Mark a letter as guessed. Accepts upper or lowercase."""
-        self.guessed.add(letter.upper())
+        letter = letter.upper()
+        if letter not in self.guessed:
+            self.guessed.add(letter)
+            self._dirty.append(letter)
+
+    def _blit_cell(self, atlas, char):
+        """Copy char's atlas cell (guessed or unguessed row) into its slot on the bar."""
+        rect = self.letter_slots[char].move(-self.bar_rect.left, -self.bar_rect.top)
+        row = 1 if char in self.guessed else 0
+        area = pygame.Rect(ALPHABET.index(char) * LETTER_SLOT_WIDTH, row * LETTER_SLOT_HEIGHT,
+                           LETTER_SLOT_WIDTH, LETTER_SLOT_HEIGHT)
+        self._bar.fill((0, 0, 0, 0), rect)
+        self._bar.blit(atlas, rect, area)
 
     def draw(self, screen):
         """
         Draw all 26 letters. Guessed letters render in dark grey to fade
         into the background, unguessed letters render in white.
         """
-        for char, rect in self.letter_slots.items():
-            if char in self.guessed:
-                surface = self.font.render(char, True, '#333333')
-            else:
-                surface = self.font.render(char, True, 'white')
-            letter_rect = surface.get_rect(center=rect.center)
-            screen.blit(surface, letter_rect)
\ No newline at end of file
+        atlas = _get_atlas(self.font)
+        if self._bar is None:
+            self._bar = pygame.Surface(self.bar_rect.size, pygame.SRCALPHA)
+            for char in ALPHABET:
+                self._blit_cell(atlas, char)
+            self._dirty = []
+        elif self._dirty:
+            for char in self._dirty:
+                self._blit_cell(atlas, char)
+            self._dirty = []
+        screen.blit(self._bar, self.bar_rect)
\ No newline at end of file
@@ -0,0 +1,142 @@
+import random
+
+from difficulty import SCRABBLE
+from shop_items import UPGRADES, PRESTIGE_ITEMS
+
+
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Letters from most to least common in English text
+ENGLISH_FREQUENCY = 'ETAOINSHRDLCUMWFGYPBVKJXQZ'
+
+
+class Strategy:
+    """
+    Interface for automated players. A strategy reads state from the manager
+    the same way the widgets do and acts only through the public game
+    calls: GameManager.guess/prestige and the Shop purchase handlers.
+
+    Subclasses override pick_letter and optionally shop and should_prestige.
+    Each instance owns a seeded random.Random so a bot plays identically
+    for the same game seed and bot seed.
+    """
+
+    name = 'strategy'
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def pick_letter(self, manager):
+        """Return the next letter to guess. Must not already be in manager.alphabet.guessed."""
+        raise NotImplementedError
+
+    def shop(self, manager, shop):
+        """
+        Make any purchases before the next guess. Called once per guess.
+        Return True if a purchase took the guess's place: the guess is
+        skipped and shop is called again.
+        """
+
+    def should_prestige(self, manager):
+        """Called between rounds while manager.can_prestige is True."""
+        return True
+
+
+class FrequencyBot(Strategy):
+    """Guesses letters in English frequency order and never shops."""
+
+    name = 'frequency'
+
+    def pick_letter(self, manager):
+        guessed = manager.alphabet.guessed
+        return next(c for c in ENGLISH_FREQUENCY if c not in guessed)
+
+
+class RarityAwareBot(Strategy):
+    """
+    Guesses in ascending Scrabble value (frequency breaks ties), so common
+    letters go first. Once only rare letters (value 4+) are left to try, it
+    spends money on Reveal Consonant instead of risking a strike on them.
+    """
+
+    name = 'rarity'
+
+    ORDER = sorted(ALPHABET, key=lambda c: (SCRABBLE[c], ENGLISH_FREQUENCY.index(c)))
+
+    def pick_letter(self, manager):
+        guessed = manager.alphabet.guessed
+        return next(c for c in self.ORDER if c not in guessed)
+
+    def shop(self, manager, shop):
+        return SCRABBLE[self.pick_letter(manager)] >= 4 and shop._try_purchase_consumable('reveal_consonant')
+
+
+class GreedyShopperBot(FrequencyBot):
+    """
+    Frequency-order guesser that buys every upgrade it can afford, cheapest
+    first, recovers used strikes with Bonus Strike, and spends stars on
+    prestige items as soon as they are affordable.
+    """
+
+    name = 'greedy_shopper'
+
+    def shop(self, manager, shop):
+        for item_list in (UPGRADES, PRESTIGE_ITEMS):
+            affordable = [
+                item for item in shop._visible_items(item_list)
+                if shop._item_available(item, item_list)
+            ]
+            for item in sorted(affordable, key=lambda item: shop._next_cost(item, item_list)):
+                shop._try_purchase_item(item['id'], item_list)
+
+        if manager.strikes.count > 0:
+            shop._try_purchase_consumable('bonus_strike')
+
+
+class OracleBot(Strategy):
+    """
+    Cheating solver that only ever guesses letters in the phrase, in
+    frequency order. Every round is a win, which makes it useful for
+    fast-forwarding to late-game states. It never shops.
+    """
+
+    name = 'oracle'
+
+    def pick_letter(self, manager):
+        guessed = manager.alphabet.guessed
+        word    = manager.phrase.word
+        return next(c for c in ENGLISH_FREQUENCY if c in word and c not in guessed)
+
+
+STRATEGIES = {cls.name: cls for cls in (FrequencyBot, RarityAwareBot, GreedyShopperBot, OracleBot)}
+
+
+def play_round(manager, shop, strategy):
+    """
+    Play the current round to the end with strategy, resolving it the way
+    main.py's popups do: a win calls win(), a loss or a cleared puzzle set
+    calls lose(). A prestige is taken first if the strategy wants one.
+    Returns 'won', 'lost', 'complete' or 'prestige'.
+    """
+    if manager.can_prestige and strategy.should_prestige(manager):
+        manager.prestige()
+        return 'prestige'
+
+    while True:
+        bought_instead = strategy.shop(manager, shop)
+        if manager.solved_by_consumable:
+            manager.solved_by_consumable = False
+            result = 'solved'
+        elif bought_instead:
+            continue
+        else:
+            result = manager.guess(strategy.pick_letter(manager))
+
+        if result == 'solved':
+            if manager.win():
+                return 'won'
+            manager.lose()
+            return 'complete'
+        if result == 'game_over':
+            manager.lose()
+            return 'lost'
\ No newline at end of file
@@ -0,0 +1,208 @@
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from bots import ENGLISH_FREQUENCY
+from difficulty import calculate_difficulty
+from paths import app_dir
+from puzzles import PUZZLES
+
+
+# Bump whenever the solver changes so every cached result is re-simulated
+SOLVER_VERSION = 2
+
+# Chance the solver picks one of its runner-up letters instead of the best one.
+# Gives each trial a slightly different path so the mean is an expectation.
+EXPLORATION = 0.15
+
+CACHE_PATH      = os.path.join(app_dir(), 'calibration_cache.json')
+TABLE_PATH      = os.path.join(app_dir(), 'difficulty_table.py')
+VOCABULARY_PATH = os.path.join(app_dir(), 'calibration_vocabulary.py')
+
+
+class ReferenceSolver:
+    """
+    Word-pattern solver used to measure how hard a puzzle really is.
+
+    For every partly hidden word it lists the vocabulary words that fit the
+    revealed letters and don't use any letter already ruled out, then guesses
+    the letter found in the most candidates. With no candidates it falls back
+    to English frequency order. The vocabulary is a {word: count} word list
+    (see calibration_vocabulary.py); the puzzle's own words are subtracted
+    from the counts, so the solver cannot just recognise the answer.
+    """
+
+    def __init__(self, word_counts):
+        self.word_counts = word_counts
+        self.by_length   = defaultdict(list)
+        for word in self.word_counts:
+            self.by_length[len(word)].append(word)
+
+    def wrong_guesses(self, text, rng):
+        """Play text to completion and return how many guesses missed."""
+        words   = text.split()
+        own     = Counter(words)
+        letters = set(text.replace(' ', ''))
+        guessed = set()
+        wrong   = 0
+
+        while not letters <= guessed:
+            letter = self._pick(words, own, guessed, rng)
+            guessed.add(letter)
+            if letter not in letters:
+                wrong += 1
+        return wrong
+
+    def _pick(self, words, own, guessed, rng):
+        scores  = defaultdict(float)
+        blocked = '[^' + ''.join(sorted(guessed)) + ']' if guessed else '.'
+
+        # Sorted so the float sums, and so the results, don't depend on string hashing
+        for word in sorted(set(words)):
+            if set(word) <= guessed:
+                continue
+            pattern    = re.compile(''.join(c if c in guessed else blocked for c in word))
+            candidates = [w for w in self.by_length[len(word)]
+                          if self.word_counts[w] > own[w] and pattern.fullmatch(w)]
+            for candidate in candidates:
+                for c in sorted(set(candidate) - guessed):
+                    scores[c] += 1 / len(candidates)
+
+        if not scores:
+            return next(c for c in ENGLISH_FREQUENCY if c not in guessed)
+
+        ranked = sorted(scores, key=lambda c: (-scores[c], ENGLISH_FREQUENCY.index(c)))
+        if len(ranked) > 1 and rng.random() < EXPLORATION:
+            return rng.choice(ranked[1:3])
+        return ranked[0]
+
+
+def puzzle_hash(text, category, trials):
+    """Seed for one puzzle's simulation — changes if the puzzle, trial count or solver changes."""
+    return hashlib.sha1(f'{SOLVER_VERSION}|{trials}|{category}|{text}'.encode()).hexdigest()
+
+
+def corpus_vocabulary(puzzles):
+    """{word: count} over every word in puzzles."""
+    return dict(Counter(word for text, _ in puzzles for word in text.split()))
+
+
+def load_vocabulary():
+    """
+    Return (version, {word: count}) from calibration_vocabulary.py, or None
+    if it hasn't been generated. The word list is frozen rather than taken
+    from the puzzles being calibrated, so adding or editing a puzzle leaves
+    every other puzzle's cached result valid.
+    """
+    try:
+        from calibration_vocabulary import VOCABULARY, VOCABULARY_VERSION
+    except ImportError:
+        return None
+    return VOCABULARY_VERSION, VOCABULARY
+
+
+def write_vocabulary(vocabulary, version, path=VOCABULARY_PATH):
+    """Write the solver's word list as an importable module, like write_table."""
+    with open(path, 'w') as f:
+        f.write('# Generated by calibrate.py --new-vocabulary — do not edit by hand.\n')
+        f.write('# Word list the calibration solver guesses from; cached results are keyed by its version.\n\n')
+        f.write(f'VOCABULARY_VERSION = {version}\n\n')
+        f.write('VOCABULARY = {\n')
+        for word in sorted(vocabulary):
+            f.write(f'    {word!r}: {vocabulary[word]},\n')
+        f.write('}')
+
+
+# Solver shared by every task in a worker process, built once by _init_worker
+_solver = None
+
+
+def _init_worker(word_counts):
+    global _solver
+    _solver = ReferenceSolver(word_counts)
+
+
+def _simulate(job):
+    """Return the mean wrong guesses for one puzzle over trials seeded solver runs."""
+    text, category, trials = job
+    rng = random.Random(puzzle_hash(text, category, trials))
+    return sum(_solver.wrong_guesses(text, rng) for _ in range(trials)) / trials
+
+
+def measure(puzzles, trials=16, workers=None, cache_path=CACHE_PATH, vocabulary=None):
+    """
+    Return {text: expected wrong guesses} for every puzzle. vocabulary is
+    (version, {word: count}) and defaults to load_vocabulary(). Results are
+    cached in cache_path by puzzle hash plus vocabulary version, so only new
+    or changed puzzles are re-simulated; a new vocabulary re-simulates all.
+    """
+    version, word_counts = vocabulary if vocabulary is not None else load_vocabulary()
+    cache = {}
+    if os.path.exists(cache_path):
+        with open(cache_path) as f:
+            cache = json.load(f)
+
+    keys    = {text: f'{puzzle_hash(text, category, trials)}:{version}' for text, category in puzzles}
+    pending = [(text, category, trials) for text, category in puzzles if keys[text] not in cache]
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(word_counts,)) as pool:
+            for (text, _, _), result in zip(pending, pool.map(_simulate, pending, chunksize=16)):
+                cache[keys[text]] = result
+
+        # Drop entries for puzzles that no longer exist
+        live = set(keys.values())
+        cache = {k: v for k, v in cache.items() if k in live}
+        with open(cache_path, 'w') as f:
+            json.dump(cache, f)
+
+    return {text: cache[keys[text]] for text, _ in puzzles}
+
+
+def build_table(puzzles, wrong_guesses):
+    """
+    Map measured hardness onto the formula's scale by quantile matching:
+    the puzzle ranked k-th by wrong guesses gets the k-th smallest formula
+    score. The difficulty windows in GameManager._get_difficulty_range keep
+    their meaning, and pools stay the same size, but the ordering now
+    follows simulated play. Ties fall back to the formula order.
+    """
+    formula = {text: calculate_difficulty(text, category) for text, category in puzzles}
+    ranked  = sorted(formula, key=lambda text: (wrong_guesses[text], formula[text]))
+    return dict(zip(ranked, sorted(formula.values())))
+
+
+def write_table(table, path=TABLE_PATH):
+    """Write the table as an importable module so PyInstaller bundles it like puzzles.py."""
+    with open(path, 'w') as f:
+        f.write('# Generated by calibrate.py — do not edit by hand.\n')
+        f.write('# Simulation-calibrated puzzle difficulty on the same scale as the formula in difficulty.py.\n\n')
+        f.write('DIFFICULTY_TABLE = {\n')
+        for text in sorted(table):
+            f.write(f'    {text!r}: {table[text]!r},\n')
+        f.write('}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Simulate every puzzle and write difficulty_table.py')
+    parser.add_argument('--trials', type=int, default=16, help='Solver runs per puzzle')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--new-vocabulary', action='store_true',
+                        help="Rebuild the solver's word list from the current puzzles (re-simulates every puzzle)")
+    args = parser.parse_args()
+
+    vocabulary = load_vocabulary()
+    if vocabulary is None or args.new_vocabulary:
+        version    = vocabulary[0] + 1 if vocabulary is not None else 1
+        vocabulary = version, corpus_vocabulary(PUZZLES)
+        write_vocabulary(vocabulary[1], version)
+        print(f'Wrote {VOCABULARY_PATH} (version {version}, {len(vocabulary[1])} words)')
+
+    measured = measure(PUZZLES, args.trials, args.workers, vocabulary=vocabulary)
+    write_table(build_table(PUZZLES, measured))
+    print(f'Wrote {TABLE_PATH} ({len(measured)} puzzles)')
\ No newline at end of file
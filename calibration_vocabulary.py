@@ -0,0 +1,1487 @@
+# Generated by calibrate.py --new-vocabulary — do not edit by hand.
+# Word list the calibration solver guesses from; cached results are keyed by its version.
+
+VOCABULARY_VERSION = 1
+
+VOCABULARY = {
+    'A': 43,
+    'ABANDONED': 2,
+    'ABRAHAM': 1,
+    'ACADEMY': 1,
+    'ACADIA': 1,
+    'ACCEPTANCE': 1,
+    'ACCOUNTANT': 1,
+    'ACTIONS': 1,
+    'ACTOR': 1,
+    'ADAMS': 1,
+    'ADD': 1,
+    'AGATHA': 1,
+    'AGENT': 1,
+    'AIR': 1,
+    'ALAN': 1,
+    'ALARM': 2,
+    'ALASKA': 1,
+    'ALBERT': 1,
+    'ALCATRAZ': 1,
+    'ALEXANDER': 2,
+    'ALFRED': 1,
+    'ALL': 4,
+    'ALLAN': 1,
+    'ALLEY': 2,
+    'ALPHABETIZING': 1,
+    'ALPS': 1,
+    'AMAZON': 2,
+    'AMBULANCE': 1,
+    'AMELIA': 1,
+    'AN': 4,
+    'ANCIENT': 1,
+    'AND': 11,
+    'ANDREW': 1,
+    'ANGEL': 2,
+    'ANIMAL': 1,
+    'ANNE': 2,
+    'ANNOUNCER': 1,
+    'ANTHONY': 1,
+    'ANTIQUE': 1,
+    'ANTOINETTE': 1,
+    'APPALACHIAN': 1,
+    'APPLE': 1,
+    'APPLES': 2,
+    'ARC': 1,
+    'ARCHES': 1,
+    'AREA': 2,
+    'ARLINGTON': 1,
+    'ARM': 1,
+    'ARMSTRONG': 2,
+    'AROUND': 2,
+    'ARRABBIATA': 1,
+    'ARTIST': 4,
+    'ASSEMBLING': 1,
+    'AT': 3,
+    'ATTIC': 2,
+    'AUCTION': 2,
+    'AVALANCHE': 1,
+    'AVOCADO': 1,
+    'AVOIDING': 1,
+    'AWARDS': 2,
+    'B': 2,
+    'BABY': 1,
+    'BACHELOR': 1,
+    'BACK': 21,
+    'BACKYARD': 1,
+    'BACON': 1,
+    'BAG': 3,
+    'BAIKAL': 1,
+    'BAKE': 1,
+    'BAKED': 1,
+    'BAKING': 1,
+    'BALANCING': 1,
+    'BALL': 1,
+    'BALLOON': 1,
+    'BALLROOM': 1,
+    'BALM': 1,
+    'BANANA': 2,
+    'BANDWAGON': 1,
+    'BANGERS': 1,
+    'BANK': 1,
+    'BANQUET': 1,
+    'BAR': 1,
+    'BARBECUE': 1,
+    'BARBERSHOP': 1,
+    'BARKING': 1,
+    'BARN': 2,
+    'BARREL': 1,
+    'BARRIER': 1,
+    'BARTON': 1,
+    'BASE': 1,
+    'BASEBALL': 1,
+    'BASEMENT': 4,
+    'BASES': 1,
+    'BASKET': 1,
+    'BASKETBALL': 1,
+    'BATH': 4,
+    'BATHROOM': 2,
+    'BATHTUB': 1,
+    'BATHWATER': 1,
+    'BATTERY': 1,
+    'BAY': 1,
+    'BAYOU': 1,
+    'BE': 1,
+    'BEACH': 2,
+    'BEAN': 1,
+    'BEANS': 1,
+    'BEAR': 1,
+    'BEAT': 1,
+    'BEATING': 1,
+    'BED': 3,
+    'BEDROOM': 4,
+    'BEE': 1,
+    'BEECHER': 1,
+    'BEEF': 4,
+    'BEER': 1,
+    'BEHIND': 4,
+    'BELL': 1,
+    'BELLY': 1,
+    'BELT': 1,
+    'BENCH': 1,
+    'BENEDICT': 1,
+    'BENJAMIN': 1,
+    'BESSIE': 1,
+    'BEST': 1,
+    'BETTER': 1,
+    'BETWEEN': 1,
+    'BIKE': 4,
+    'BILL': 2,
+    'BIN': 1,
+    'BIOLOGIST': 1,
+    'BIRD': 1,
+    'BIRDS': 1,
+    'BIRTHDAY': 2,
+    'BISCUITS': 1,
+    'BISMARCK': 1,
+    'BISQUE': 2,
+    'BITE': 4,
+    'BLACK': 2,
+    'BLACKENED': 1,
+    'BLACKWELL': 1,
+    'BLANC': 1,
+    'BLANKET': 2,
+    'BLESSING': 1,
+    'BLOCK': 1,
+    'BLOOD': 3,
+    'BLOWER': 1,
+    'BLOWING': 1,
+    'BLUE': 1,
+    'BLUEBERRY': 1,
+    'BOARD': 5,
+    'BOAT': 2,
+    'BOILER': 1,
+    'BOLEYN': 1,
+    'BOLIVAR': 1,
+    'BOMB': 1,
+    'BONAPARTE': 1,
+    'BOOK': 6,
+    'BOOKCASE': 1,
+    'BOOKER': 1,
+    'BOOTH': 4,
+    'BORA': 2,
+    'BORDER': 1,
+    'BOTH': 2,
+    'BOTTLE': 1,
+    'BOTTOM': 6,
+    'BOURBON': 2,
+    'BOURGUIGNON': 1,
+    'BOWL': 1,
+    'BOWLING': 1,
+    'BOX': 6,
+    'BOXING': 1,
+    'BRAM': 1,
+    'BREAD': 6,
+    'BREAK': 2,
+    'BREAKFAST': 3,
+    'BRIDESMAID': 1,
+    'BRIDGE': 4,
+    'BRIDGES': 1,
+    'BROKE': 1,
+    'BROKEN': 1,
+    'BROWNIE': 1,
+    'BRULEE': 1,
+    'BRUSSELS': 1,
+    'BRYCE': 1,
+    'BUBBLE': 2,
+    'BUBBLES': 1,
+    'BUCKINGHAM': 1,
+    'BUCKLE': 1,
+    'BUFFALO': 1,
+    'BUILDING': 4,
+    'BUILT': 1,
+    'BULL': 3,
+    'BULLET': 1,
+    'BULLETIN': 1,
+    'BUNK': 1,
+    'BURN': 1,
+    'BURNING': 3,
+    'BUS': 2,
+    'BUSH': 1,
+    'BUSY': 1,
+    'BUTTER': 1,
+    'BUTTERSCOTCH': 1,
+    'BY': 2,
+    'CABINET': 2,
+    'CADDIE': 1,
+    'CAESAR': 2,
+    'CAKE': 8,
+    'CALCULATING': 1,
+    'CALL': 1,
+    'CALLING': 2,
+    'CAMELS': 1,
+    'CAN': 1,
+    'CANAL': 2,
+    'CANAVERAL': 1,
+    'CANDLE': 2,
+    'CANT': 2,
+    'CANYON': 2,
+    'CAPE': 5,
+    'CAPRI': 1,
+    'CAPTAIN': 1,
+    'CAR': 2,
+    'CARPETS': 1,
+    'CARRIER': 1,
+    'CARROT': 1,
+    'CARTOONIST': 1,
+    'CASE': 2,
+    'CASSEROLE': 1,
+    'CAT': 2,
+    'CATALOGUING': 1,
+    'CATCHES': 1,
+    'CATCHING': 1,
+    'CAUGHT': 2,
+    'CAULKING': 1,
+    'CAUTION': 1,
+    'CAVE': 2,
+    'CEILING': 2,
+    'CELEBRATION': 2,
+    'CELEBRITY': 1,
+    'CELLAR': 3,
+    'CEMETERY': 2,
+    'CENTER': 1,
+    'CENTRAL': 1,
+    'CEREMONY': 7,
+    'CHAIN': 2,
+    'CHAIR': 1,
+    'CHAMPION': 1,
+    'CHAMPIONSHIP': 5,
+    'CHANGING': 1,
+    'CHANNEL': 1,
+    'CHARGER': 1,
+    'CHARITY': 1,
+    'CHARLES': 3,
+    'CHARLIE': 1,
+    'CHARRED': 1,
+    'CHASE': 1,
+    'CHASER': 1,
+    'CHASING': 1,
+    'CHECK': 1,
+    'CHECKBOOK': 1,
+    'CHECKING': 1,
+    'CHECKPOINT': 1,
+    'CHEESE': 5,
+    'CHEF': 1,
+    'CHESAPEAKE': 1,
+    'CHESS': 2,
+    'CHEST': 1,
+    'CHEW': 1,
+    'CHICKEN': 6,
+    'CHICKENS': 1,
+    'CHILD': 1,
+    'CHILDRENS': 1,
+    'CHILI': 2,
+    'CHIME': 1,
+    'CHINA': 1,
+    'CHIP': 1,
+    'CHIPS': 1,
+    'CHOCOLATE': 2,
+    'CHOP': 1,
+    'CHORAL': 1,
+    'CHOREOGRAPHER': 1,
+    'CHOWDER': 1,
+    'CHRISTENING': 1,
+    'CHRISTIE': 1,
+    'CHRISTMAS': 2,
+    'CHRISTOPHER': 1,
+    'CHURCH': 1,
+    'CHURCHILL': 1,
+    'CHUTE': 1,
+    'CIDER': 1,
+    'CINCO': 1,
+    'CITY': 2,
+    'CLAM': 1,
+    'CLARA': 1,
+    'CLEANER': 1,
+    'CLEANING': 3,
+    'CLEARING': 1,
+    'CLEOPATRA': 1,
+    'CLIFF': 1,
+    'CLIFFS': 1,
+    'CLOCK': 1,
+    'CLOSET': 6,
+    'CLOTHING': 1,
+    'CLOUD': 1,
+    'CLUB': 1,
+    'COACH': 1,
+    'COASTER': 1,
+    'COAT': 6,
+    'COBB': 1,
+    'COBBLER': 1,
+    'COBWEBS': 1,
+    'COD': 1,
+    'CODE': 1,
+    'COFFEE': 2,
+    'COIN': 1,
+    'COLEMAN': 1,
+    'COLLECTION': 1,
+    'COLONIAL': 1,
+    'COLOSSEUM': 1,
+    'COLUMBUS': 1,
+    'COME': 1,
+    'COMMANDER': 1,
+    'COMPARING': 1,
+    'COMPETITIVE': 5,
+    'COMPLICATED': 1,
+    'COMPOSTING': 1,
+    'COMPUTER': 1,
+    'CONCERT': 1,
+    'CONDUCTOR': 1,
+    'CONFIT': 1,
+    'CONFLICT': 1,
+    'CONSTRUCTOR': 1,
+    'CONTACT': 1,
+    'CONTEST': 1,
+    'CONTROL': 1,
+    'CONTROLLER': 1,
+    'CONVERTED': 1,
+    'COOK': 2,
+    'COOKIE': 1,
+    'COOKIES': 1,
+    'COOKOFF': 1,
+    'COOKOUT': 1,
+    'COORDINATOR': 1,
+    'COPERNICUS': 1,
+    'CORKBOARD': 1,
+    'CORN': 2,
+    'CORNER': 7,
+    'CORPORATE': 1,
+    'COST': 1,
+    'COSTUME': 1,
+    'COUCH': 2,
+    'COUNT': 1,
+    'COUNTDOWN': 1,
+    'COUNTER': 1,
+    'COUNTING': 1,
+    'COUNTRY': 1,
+    'COUNTY': 1,
+    'COURSE': 1,
+    'COURT': 2,
+    'COVER': 2,
+    'COVERED': 1,
+    'CRAB': 1,
+    'CRACKED': 1,
+    'CRAFT': 1,
+    'CRATER': 1,
+    'CRAWL': 1,
+    'CRAZY': 1,
+    'CREAM': 1,
+    'CREDIT': 2,
+    'CREME': 1,
+    'CREST': 1,
+    'CRIME': 1,
+    'CRISTO': 1,
+    'CRITIC': 1,
+    'CROP': 1,
+    'CROSS': 1,
+    'CROSSWORD': 2,
+    'CROWS': 1,
+    'CUDDLER': 1,
+    'CUP': 2,
+    'CURIE': 1,
+    'CUSHION': 1,
+    'CUT': 1,
+    'CUTTING': 1,
+    'DA': 1,
+    'DAM': 1,
+    'DANCE': 2,
+    'DANCING': 1,
+    'DARWIN': 1,
+    'DAVID': 1,
+    'DAWN': 1,
+    'DAY': 7,
+    'DAYTONA': 1,
+    'DE': 2,
+    'DEAD': 3,
+    'DEAN': 1,
+    'DEATH': 1,
+    'DEBRIS': 1,
+    'DEBUGGING': 1,
+    'DECK': 2,
+    'DECLUTTERING': 1,
+    'DEEP': 2,
+    'DEFENDING': 1,
+    'DELTA': 1,
+    'DEMOLITION': 2,
+    'DENALI': 1,
+    'DERBY': 3,
+    'DESERT': 3,
+    'DESIGNER': 1,
+    'DETECTOR': 1,
+    'DEVIL': 1,
+    'DEVILS': 1,
+    'DIANA': 1,
+    'DICKENS': 1,
+    'DICKINSON': 1,
+    'DIGGING': 1,
+    'DINER': 1,
+    'DINING': 1,
+    'DINNER': 2,
+    'DIPLOMATIC': 1,
+    'DIRECTOR': 1,
+    'DISGUISE': 1,
+    'DISH': 2,
+    'DISHES': 1,
+    'DISPOSAL': 1,
+    'DIVER': 1,
+    'DIVING': 2,
+    'DOCK': 2,
+    'DOCTORAL': 1,
+    'DOCUMENTARY': 1,
+    'DOG': 7,
+    'DOGS': 1,
+    'DOING': 1,
+    'DONT': 3,
+    'DONUT': 1,
+    'DOOR': 11,
+    'DOROTHY': 1,
+    'DOSTOEVSKY': 1,
+    'DOUBLE': 1,
+    'DOUGLASS': 1,
+    'DOVER': 1,
+    'DOWN': 1,
+    'DOWNTOWN': 1,
+    'DRAWER': 2,
+    'DRAWING': 1,
+    'DRIVE': 3,
+    'DRIVER': 2,
+    'DRIVEWAY': 1,
+    'DRY': 1,
+    'DUCK': 3,
+    'DUCKS': 1,
+    'DUE': 1,
+    'DUST': 1,
+    'DUSTER': 1,
+    'DUSTY': 2,
+    'DWIGHT': 1,
+    'EARHART': 1,
+    'EARLY': 1,
+    'EAT': 1,
+    'EATING': 3,
+    'EAVESDROPPING': 1,
+    'ECLIPSE': 1,
+    'EDGAR': 1,
+    'EDGE': 2,
+    'EDISON': 1,
+    'EFFECTS': 1,
+    'EGG': 1,
+    'EGGS': 2,
+    'EGGSHELLS': 1,
+    'EIFFEL': 1,
+    'EINSTEIN': 1,
+    'EISENHOWER': 1,
+    'ELEANOR': 1,
+    'ELECTRIC': 1,
+    'ELIZABETH': 1,
+    'ELLA': 1,
+    'EMERSON': 1,
+    'EMILY': 1,
+    'EMPIRE': 1,
+    'EMPTY': 1,
+    'END': 6,
+    'ENDS': 1,
+    'ENGLISH': 1,
+    'ENTOMOLOGIST': 1,
+    'ERIE': 1,
+    'ERNEST': 1,
+    'ESCAPE': 2,
+    'ETHICAL': 1,
+    'EVE': 1,
+    'EVEREST': 1,
+    'EVERGLADES': 1,
+    'EVERY': 2,
+    'EVERYTHING': 2,
+    'EXAM': 1,
+    'EXERCISE': 1,
+    'EXHAUST': 1,
+    'EXPLAINING': 1,
+    'EXTINGUISHER': 1,
+    'EYE': 1,
+    'EYES': 1,
+    'F': 1,
+    'FAIR': 5,
+    'FALLS': 3,
+    'FAN': 3,
+    'FAUCET': 1,
+    'FEAR': 1,
+    'FEEDING': 1,
+    'FEEDS': 1,
+    'FENCE': 2,
+    'FERRIS': 1,
+    'FESTIVAL': 4,
+    'FIELD': 1,
+    'FIESTA': 1,
+    'FIFTY': 1,
+    'FIGHT': 1,
+    'FILING': 2,
+    'FILM': 1,
+    'FINAL': 1,
+    'FINALE': 1,
+    'FINDING': 1,
+    'FINISH': 1,
+    'FIRE': 7,
+    'FIREFLIES': 1,
+    'FIREPLACE': 1,
+    'FIREWORKS': 2,
+    'FIRST': 1,
+    'FISH': 4,
+    'FISHING': 1,
+    'FITZGERALD': 1,
+    'FIXTURE': 1,
+    'FJORDS': 1,
+    'FLAT': 1,
+    'FLICKERING': 1,
+    'FLIP': 1,
+    'FLOOR': 3,
+    'FLOORBOARD': 1,
+    'FLOORS': 1,
+    'FLOPS': 1,
+    'FLORENCE': 1,
+    'FLORIDA': 2,
+    'FLOWER': 2,
+    'FLY': 1,
+    'FLYING': 1,
+    'FOLDING': 1,
+    'FOLEY': 1,
+    'FOLLOWING': 1,
+    'FOOD': 4,
+    'FOR': 4,
+    'FORBIDDEN': 1,
+    'FORECASTER': 1,
+    'FORENSIC': 3,
+    'FOREST': 2,
+    'FORGOTTEN': 3,
+    'FORK': 1,
+    'FORT': 2,
+    'FOUND': 1,
+    'FOUNTAIN': 1,
+    'FOURTH': 1,
+    'FRAME': 1,
+    'FRANK': 2,
+    'FRANKLIN': 1,
+    'FREDERICK': 1,
+    'FRENCH': 3,
+    'FREUD': 1,
+    'FRIDA': 1,
+    'FRIDGE': 2,
+    'FRIES': 1,
+    'FROM': 3,
+    'FRONT': 4,
+    'FRY': 1,
+    'FRYING': 1,
+    'FUEL': 1,
+    'FUJI': 1,
+    'FUNDRAISER': 2,
+    'FUNERAL': 1,
+    'FURNITURE': 1,
+    'FYODOR': 1,
+    'GALA': 2,
+    'GALAPAGOS': 1,
+    'GALILEI': 1,
+    'GALILEO': 1,
+    'GAME': 2,
+    'GANDHI': 1,
+    'GARAGE': 7,
+    'GARDEN': 7,
+    'GATE': 3,
+    'GATES': 1,
+    'GAULLE': 1,
+    'GENEALOGIST': 1,
+    'GENGHIS': 1,
+    'GEORGE': 2,
+    'GERMAN': 1,
+    'GERONIMO': 1,
+    'GIBRALTAR': 1,
+    'GIFT': 2,
+    'GINGER': 1,
+    'GIVE': 2,
+    'GLACIER': 1,
+    'GLASS': 1,
+    'GLOBE': 1,
+    'GNOME': 1,
+    'GO': 1,
+    'GOBI': 1,
+    'GOGH': 1,
+    'GOLDEN': 1,
+    'GOLF': 3,
+    'GOOD': 2,
+    'GOUDA': 1,
+    'GRADUATION': 1,
+    'GRAFFITI': 1,
+    'GRAND': 3,
+    'GRANDMASTER': 1,
+    'GRANT': 1,
+    'GRAS': 1,
+    'GRAVY': 1,
+    'GREASY': 1,
+    'GREAT': 4,
+    'GREEN': 2,
+    'GRILLED': 2,
+    'GRINDER': 1,
+    'GROUNDBREAKING': 1,
+    'GROUNDHOG': 1,
+    'GROUP': 1,
+    'GRUDGE': 1,
+    'GUARD': 1,
+    'GUEST': 1,
+    'GUIDE': 1,
+    'GUITAR': 1,
+    'GULF': 1,
+    'GUN': 1,
+    'GUTTER': 1,
+    'HACKER': 1,
+    'HAIR': 1,
+    'HALF': 1,
+    'HALL': 4,
+    'HALLOWEEN': 1,
+    'HALLWAY': 1,
+    'HAM': 1,
+    'HAMILTON': 1,
+    'HAND': 4,
+    'HANGER': 1,
+    'HARBOR': 1,
+    'HARD': 1,
+    'HARDWOOD': 1,
+    'HARRIET': 2,
+    'HARVEST': 1,
+    'HAS': 2,
+    'HATCH': 1,
+    'HATTERAS': 1,
+    'HAUNTED': 1,
+    'HAVE': 1,
+    'HAY': 1,
+    'HAYSTACK': 1,
+    'HEAD': 2,
+    'HEART': 1,
+    'HELEN': 1,
+    'HELENS': 1,
+    'HEMINGWAY': 1,
+    'HENRY': 1,
+    'HIDDEN': 1,
+    'HIGH': 1,
+    'HIGHLANDS': 1,
+    'HILL': 2,
+    'HIT': 3,
+    'HITCHCOCK': 1,
+    'HOLE': 2,
+    'HOLLANDAISE': 1,
+    'HOME': 3,
+    'HOMECOMING': 1,
+    'HOMER': 1,
+    'HOOK': 1,
+    'HOOP': 1,
+    'HOOVER': 1,
+    'HOP': 1,
+    'HOPE': 1,
+    'HORN': 1,
+    'HORNS': 1,
+    'HORSE': 5,
+    'HOSE': 1,
+    'HOSPITAL': 1,
+    'HOSTAGE': 1,
+    'HOT': 4,
+    'HOUSE': 2,
+    'HUDSON': 1,
+    'HUGHES': 1,
+    'HURON': 1,
+    'ICE': 1,
+    'ICEBERG': 1,
+    'ICED': 1,
+    'ILLUSTRATOR': 1,
+    'IMMANUEL': 1,
+    'IN': 29,
+    'INAUGURATION': 1,
+    'INCA': 1,
+    'INSPECTOR': 1,
+    'INTERNATIONAL': 2,
+    'INTERPRETER': 1,
+    'INTO': 1,
+    'INVESTIGATOR': 1,
+    'IRON': 1,
+    'IRONING': 1,
+    'IS': 5,
+    'ISAAC': 1,
+    'ISLAND': 2,
+    'ISLANDS': 1,
+    'ISLE': 1,
+    'IT': 6,
+    'ITS': 2,
+    'JACKSON': 1,
+    'JAR': 1,
+    'JEFFERSON': 1,
+    'JELLY': 1,
+    'JEWELRY': 1,
+    'JOAN': 1,
+    'JOHN': 3,
+    'JOHNSON': 1,
+    'JOSEPH': 1,
+    'JOURNAL': 1,
+    'JOUSTING': 1,
+    'JUDGE': 2,
+    'JULIUS': 1,
+    'JULY': 1,
+    'JUMP': 3,
+    'JUMPER': 1,
+    'JUNK': 2,
+    'KAHLO': 1,
+    'KANT': 1,
+    'KEEPER': 1,
+    'KELLER': 1,
+    'KENNEDY': 1,
+    'KETTLE': 1,
+    'KEY': 2,
+    'KEYS': 1,
+    'KHAN': 1,
+    'KHRUSHCHEV': 1,
+    'KILIMANJARO': 1,
+    'KILL': 1,
+    'KING': 1,
+    'KITCHEN': 4,
+    'KITE': 1,
+    'KNITTING': 1,
+    'KNIVES': 1,
+    'KNOCKER': 1,
+    'LAKE': 6,
+    'LAMB': 1,
+    'LAMINATING': 1,
+    'LAMP': 2,
+    'LANDING': 3,
+    'LANGSTON': 1,
+    'LANGUAGE': 1,
+    'LARGE': 1,
+    'LAST': 3,
+    'LATE': 1,
+    'LAUNDRY': 3,
+    'LAVA': 1,
+    'LAWN': 1,
+    'LEAF': 1,
+    'LEAGUE': 1,
+    'LEAKY': 1,
+    'LEARNING': 2,
+    'LEAVES': 1,
+    'LEDGE': 1,
+    'LEEK': 1,
+    'LEG': 3,
+    'LENTILS': 1,
+    'LEONARDO': 1,
+    'LET': 2,
+    'LIBERTY': 2,
+    'LIBRARY': 1,
+    'LIE': 1,
+    'LIFE': 1,
+    'LIFEGUARD': 1,
+    'LIGHT': 1,
+    'LIGHTHOUSE': 3,
+    'LIGHTING': 1,
+    'LIGHTS': 1,
+    'LIKE': 1,
+    'LINCOLN': 2,
+    'LINE': 3,
+    'LINEN': 1,
+    'LINING': 1,
+    'LIP': 1,
+    'LITTLE': 1,
+    'LIVING': 1,
+    'LLOYD': 1,
+    'LOADING': 1,
+    'LOAF': 1,
+    'LOBSTER': 1,
+    'LOCK': 1,
+    'LOCKED': 1,
+    'LOOK': 1,
+    'LOOKOUT': 1,
+    'LOST': 2,
+    'LOT': 1,
+    'LOUDER': 1,
+    'LOUIS': 1,
+    'LOUISIANA': 1,
+    'LUCK': 1,
+    'LUGGAGE': 2,
+    'LUNCH': 2,
+    'LUTHER': 1,
+    'LYNDON': 1,
+    'MACARONI': 1,
+    'MACHU': 1,
+    'MAGNIFYING': 1,
+    'MAHAL': 1,
+    'MAHATMA': 1,
+    'MAIL': 4,
+    'MAKING': 2,
+    'MANDELA': 1,
+    'MANGO': 1,
+    'MANTLE': 1,
+    'MANUSCRIPT': 1,
+    'MAO': 1,
+    'MAP': 1,
+    'MAPLE': 1,
+    'MARATHON': 2,
+    'MARCO': 1,
+    'MARDI': 1,
+    'MARIE': 2,
+    'MARINE': 1,
+    'MARK': 2,
+    'MARSALA': 1,
+    'MARSHALL': 1,
+    'MARTIN': 2,
+    'MASALA': 1,
+    'MASH': 1,
+    'MASTER': 3,
+    'MAT': 3,
+    'MATCH': 2,
+    'MAYO': 1,
+    'MAZE': 1,
+    'MEAT': 2,
+    'MEATBALLS': 1,
+    'MEDIATOR': 1,
+    'MEDICINE': 1,
+    'MEDIEVAL': 1,
+    'MEETING': 1,
+    'MEETINGS': 1,
+    'MELON': 1,
+    'MEMORIAL': 2,
+    'MERYL': 1,
+    'MESSENGER': 2,
+    'METER': 1,
+    'MEXICO': 1,
+    'MIC': 1,
+    'MICHELANGELO': 1,
+    'MICHIGAN': 1,
+    'MIDNIGHT': 3,
+    'MIRROR': 3,
+    'MISS': 1,
+    'MISSISSIPPI': 2,
+    'MOCK': 1,
+    'MODEL': 1,
+    'MOJAVE': 1,
+    'MOLEHILL': 1,
+    'MOM': 1,
+    'MONITOR': 1,
+    'MONT': 1,
+    'MONTE': 1,
+    'MONUMENT': 2,
+    'MOON': 3,
+    'MORE': 1,
+    'MOSES': 1,
+    'MOTHER': 1,
+    'MOUNT': 8,
+    'MOUNTAIN': 3,
+    'MOUNTAINS': 2,
+    'MOURNER': 1,
+    'MOUSE': 1,
+    'MOUTH': 2,
+    'MOVING': 1,
+    'MOWING': 1,
+    'MOZZARELLA': 1,
+    'MUDDY': 1,
+    'MUDROOM': 2,
+    'MUG': 1,
+    'MY': 1,
+    'NAIL': 1,
+    'NAP': 1,
+    'NAPOLEON': 1,
+    'NARRATING': 1,
+    'NATIONAL': 12,
+    'NEEDLE': 1,
+    'NEGOTIATING': 1,
+    'NEIGHBORHOOD': 4,
+    'NEIGHBORS': 1,
+    'NEIL': 2,
+    'NELSON': 1,
+    'NEST': 1,
+    'NEVER': 1,
+    'NEW': 3,
+    'NEWTON': 1,
+    'NIAGARA': 1,
+    'NIGHT': 5,
+    'NIGHTINGALE': 1,
+    'NIKITA': 1,
+    'NIKOLA': 1,
+    'NILE': 1,
+    'NINE': 3,
+    'NIXON': 1,
+    'NOODLE': 2,
+    'NOOK': 2,
+    'NORTH': 1,
+    'NORWEGIAN': 1,
+    'NOTE': 1,
+    'NUCLEAR': 1,
+    'OBSERVATION': 1,
+    'OCEAN': 1,
+    'OF': 53,
+    'OFF': 3,
+    'OFFICER': 1,
+    'OIL': 1,
+    'OLD': 5,
+    'OLYMPIC': 1,
+    'OLYMPUS': 1,
+    'ON': 10,
+    'ONCE': 1,
+    'ONE': 4,
+    'ONION': 2,
+    'OPEN': 1,
+    'OPENER': 1,
+    'OPENING': 3,
+    'OPERA': 1,
+    'OPERATOR': 1,
+    'OPRAH': 1,
+    'ORANGES': 1,
+    'ORGANIZER': 1,
+    'ORWELL': 1,
+    'OTTO': 1,
+    'OUT': 5,
+    'OUTDOOR': 1,
+    'OVER': 2,
+    'OVERFLOW': 1,
+    'OVERGROWN': 2,
+    'OVERHAULING': 1,
+    'OVERTHINKING': 1,
+    'OWN': 1,
+    'PABLO': 1,
+    'PACIFIC': 1,
+    'PACK': 1,
+    'PACKING': 1,
+    'PAD': 1,
+    'PAINT': 1,
+    'PAINTER': 1,
+    'PAINTING': 1,
+    'PALACE': 2,
+    'PALM': 1,
+    'PAN': 1,
+    'PANAMA': 1,
+    'PANCAKE': 1,
+    'PANCAKES': 1,
+    'PANTRY': 2,
+    'PAPER': 1,
+    'PAPRIKA': 1,
+    'PARADE': 3,
+    'PARALLEL': 1,
+    'PARK': 13,
+    'PARKER': 1,
+    'PARKING': 4,
+    'PARKS': 1,
+    'PARMESAN': 1,
+    'PARTHENON': 1,
+    'PARTY': 5,
+    'PATAGONIA': 1,
+    'PATH': 1,
+    'PATHOLOGIST': 1,
+    'PATROL': 1,
+    'PAUL': 1,
+    'PAWNSHOP': 1,
+    'PAY': 1,
+    'PAYPHONE': 1,
+    'PEA': 2,
+    'PEACH': 2,
+    'PEANUT': 1,
+    'PEAR': 1,
+    'PEAS': 1,
+    'PEELING': 1,
+    'PEKING': 1,
+    'PENALTY': 1,
+    'PENCIL': 1,
+    'PENNE': 1,
+    'PENNY': 1,
+    'PEP': 1,
+    'PEPPER': 1,
+    'PEPPERCORN': 1,
+    'PERFORMER': 1,
+    'PERFORMING': 1,
+    'PERISCOPE': 1,
+    'PETER': 1,
+    'PETTING': 1,
+    'PHILLIS': 1,
+    'PHONE': 2,
+    'PHOTO': 1,
+    'PHOTOGRAPHER': 2,
+    'PHYSICS': 1,
+    'PIANO': 1,
+    'PICASSO': 1,
+    'PICCHU': 1,
+    'PICKING': 1,
+    'PICKLED': 1,
+    'PICTURE': 1,
+    'PIE': 5,
+    'PIECE': 1,
+    'PIER': 1,
+    'PIGGY': 1,
+    'PIGS': 1,
+    'PILL': 1,
+    'PILLOW': 1,
+    'PILOT': 1,
+    'PIT': 2,
+    'PITA': 1,
+    'PLACE': 1,
+    'PLANTING': 1,
+    'PLANTS': 1,
+    'PLATFORM': 1,
+    'PLATO': 1,
+    'PLAY': 2,
+    'PLAYER': 2,
+    'PLAYOFF': 1,
+    'PLUNGE': 1,
+    'POACHED': 1,
+    'POCAHONTAS': 1,
+    'POCKET': 1,
+    'POD': 1,
+    'POE': 1,
+    'POKER': 1,
+    'POLAR': 1,
+    'POLE': 2,
+    'POLITICAL': 1,
+    'POLO': 1,
+    'POND': 1,
+    'POOL': 4,
+    'PORCH': 6,
+    'PORK': 2,
+    'POT': 3,
+    'POTATO': 2,
+    'POUND': 1,
+    'POWDER': 1,
+    'POWER': 1,
+    'PRACTICING': 1,
+    'PRESIDENTIAL': 1,
+    'PRESSING': 1,
+    'PRETENDING': 2,
+    'PRETZEL': 1,
+    'PRIME': 1,
+    'PRIVATE': 1,
+    'PROFESSIONAL': 12,
+    'PROM': 1,
+    'PROSCIUTTO': 1,
+    'PUDDING': 2,
+    'PUFF': 1,
+    'PULL': 2,
+    'PULLED': 1,
+    'PULLING': 1,
+    'PURSE': 1,
+    'PUT': 2,
+    'PUZZLE': 2,
+    'QUANTUM': 1,
+    'QUARTER': 1,
+    'QUEEN': 1,
+    'RACER': 1,
+    'RACK': 3,
+    'RAG': 1,
+    'RAILING': 1,
+    'RAIN': 2,
+    'RAINBOW': 1,
+    'RAKING': 1,
+    'RALLY': 1,
+    'RALPH': 1,
+    'RANGER': 1,
+    'RATATOUILLE': 1,
+    'READING': 2,
+    'RECIPE': 1,
+    'RECITAL': 1,
+    'RECORD': 1,
+    'RECYCLING': 2,
+    'RED': 2,
+    'REEF': 1,
+    'REENACTMENT': 1,
+    'REFINISHING': 1,
+    'REMOVAL': 1,
+    'REORGANIZING': 1,
+    'REPORTER': 1,
+    'REPOTTING': 1,
+    'RESCUE': 1,
+    'RESTORING': 1,
+    'RETIREMENT': 1,
+    'REUNION': 1,
+    'REWATCHING': 1,
+    'REWIRING': 1,
+    'RIB': 1,
+    'RIBBON': 1,
+    'RICE': 1,
+    'RICHARD': 1,
+    'RIDE': 1,
+    'RIDING': 1,
+    'RIND': 1,
+    'RING': 2,
+    'RISOTTO': 1,
+    'RIVER': 5,
+    'RIVERBANK': 1,
+    'ROAD': 5,
+    'ROAST': 1,
+    'ROASTED': 1,
+    'ROBBING': 1,
+    'ROBOTICS': 1,
+    'ROCK': 1,
+    'ROCKING': 1,
+    'ROCKY': 2,
+    'ROLL': 2,
+    'ROLLER': 2,
+    'ROLLING': 1,
+    'ROOFTOP': 1,
+    'ROOM': 14,
+    'ROOSEVELT': 2,
+    'ROPE': 1,
+    'ROSA': 1,
+    'ROSS': 1,
+    'ROYAL': 2,
+    'RUBBER': 1,
+    'RUNNING': 1,
+    'RUSHMORE': 1,
+    'S': 1,
+    'SACK': 1,
+    'SAFE': 1,
+    'SAFFRON': 1,
+    'SAHARA': 1,
+    'SAINT': 1,
+    'SALAD': 2,
+    'SALE': 2,
+    'SALSA': 1,
+    'SAME': 1,
+    'SANDCASTLE': 1,
+    'SANDWICH': 4,
+    'SAUCE': 1,
+    'SCALLOPS': 1,
+    'SCAMPI': 1,
+    'SCENE': 1,
+    'SCHEDULING': 1,
+    'SCHOOL': 6,
+    'SCIENCE': 1,
+    'SCOTTISH': 1,
+    'SCRABBLE': 1,
+    'SCRAPS': 1,
+    'SCREEN': 1,
+    'SEA': 3,
+    'SEAT': 1,
+    'SECOND': 1,
+    'SEE': 1,
+    'SEEDS': 1,
+    'SELFIE': 1,
+    'SEQUOIA': 1,
+    'SERENGETI': 1,
+    'SERIES': 1,
+    'SEVEN': 1,
+    'SHAKESPEARE': 1,
+    'SHARPENER': 1,
+    'SHARPENING': 1,
+    'SHED': 4,
+    'SHEEP': 1,
+    'SHEEPS': 1,
+    'SHEET': 1,
+    'SHELF': 1,
+    'SHENANDOAH': 1,
+    'SHEPHERDS': 1,
+    'SHIP': 1,
+    'SHOE': 1,
+    'SHOOTING': 1,
+    'SHOP': 1,
+    'SHOPPING': 1,
+    'SHORTCAKE': 1,
+    'SHOT': 1,
+    'SHOVELING': 1,
+    'SHOW': 8,
+    'SHOWER': 1,
+    'SHREDDER': 1,
+    'SHRIMP': 1,
+    'SIDE': 2,
+    'SIGHT': 1,
+    'SIGMUND': 1,
+    'SIGN': 3,
+    'SILICON': 1,
+    'SILVER': 1,
+    'SIMON': 1,
+    'SINK': 3,
+    'SITTER': 1,
+    'SITTING': 2,
+    'SITUATION': 1,
+    'SKETCH': 1,
+    'SKIPPING': 1,
+    'SLED': 1,
+    'SLEEP': 1,
+    'SLEEPING': 2,
+    'SLOT': 1,
+    'SLOW': 1,
+    'SMOKE': 3,
+    'SMOKED': 2,
+    'SMOKY': 1,
+    'SNOW': 3,
+    'SOAKING': 1,
+    'SOCK': 3,
+    'SOFT': 1,
+    'SOJOURNER': 1,
+    'SOLAR': 1,
+    'SOLSTICE': 1,
+    'SOLVING': 1,
+    'SOMEONES': 3,
+    'SOMMELIER': 1,
+    'SORTING': 1,
+    'SOUP': 6,
+    'SOUTH': 1,
+    'SPACE': 2,
+    'SPAGHETTI': 1,
+    'SPEAK': 2,
+    'SPECIAL': 1,
+    'SPECIALIST': 1,
+    'SPEECH': 2,
+    'SPELLING': 2,
+    'SPICE': 3,
+    'SPILL': 1,
+    'SPLIT': 2,
+    'SPOON': 1,
+    'SPORTS': 2,
+    'SPRING': 1,
+    'SPROUTS': 1,
+    'SQUARE': 3,
+    'SQUEAKY': 1,
+    'SQUEEZING': 1,
+    'STAIN': 1,
+    'STAIR': 1,
+    'STAIRCASE': 1,
+    'STAIRS': 3,
+    'STAIRWELL': 1,
+    'STALIN': 1,
+    'STALL': 1,
+    'STAPLE': 1,
+    'STARGAZING': 1,
+    'STATE': 2,
+    'STATION': 1,
+    'STATUE': 1,
+    'STEAK': 3,
+    'STEAL': 1,
+    'STEAM': 1,
+    'STEINBECK': 1,
+    'STEP': 2,
+    'STEPS': 1,
+    'STICK': 1,
+    'STICKS': 1,
+    'STOCK': 1,
+    'STOKER': 1,
+    'STONE': 1,
+    'STONEHENGE': 1,
+    'STONES': 1,
+    'STOOL': 1,
+    'STOOP': 1,
+    'STOP': 1,
+    'STOPPER': 1,
+    'STOPS': 1,
+    'STORAGE': 2,
+    'STORM': 4,
+    'STOVE': 2,
+    'STOWE': 1,
+    'STRAIT': 1,
+    'STRAW': 2,
+    'STRAWBERRY': 1,
+    'STREEP': 1,
+    'STREET': 3,
+    'STRIKE': 1,
+    'STROGANOFF': 1,
+    'STUDIO': 1,
+    'STUDYING': 1,
+    'STUNT': 1,
+    'SUBJECT': 1,
+    'SUBMARINE': 2,
+    'SUBWAY': 1,
+    'SUCCULENTS': 1,
+    'SUEZ': 1,
+    'SUITCASE': 1,
+    'SUMMER': 1,
+    'SUMMIT': 1,
+    'SUNDAY': 1,
+    'SUNROOM': 1,
+    'SUNSET': 1,
+    'SUPER': 1,
+    'SUPPLY': 1,
+    'SURGEON': 1,
+    'SURPRISE': 1,
+    'SUSAN': 1,
+    'SWEATER': 1,
+    'SWEET': 1,
+    'SWIMMING': 4,
+    'SWING': 2,
+    'SWISS': 1,
+    'SWORDFISH': 1,
+    'SYDNEY': 1,
+    'SYNCHRONIZED': 2,
+    'SYSTEM': 1,
+    'SZECHUAN': 1,
+    'T': 1,
+    'TABLE': 1,
+    'TACO': 1,
+    'TAG': 1,
+    'TAHOE': 1,
+    'TAIL': 1,
+    'TAJ': 1,
+    'TAKE': 1,
+    'TAKES': 1,
+    'TAKING': 4,
+    'TALENT': 2,
+    'TANGO': 1,
+    'TANK': 1,
+    'TATTOO': 1,
+    'TAXES': 1,
+    'TEA': 3,
+    'TEACHING': 1,
+    'TECHNICIAN': 1,
+    'TECHNOLOGIST': 1,
+    'TELESCOPE': 1,
+    'TERESA': 1,
+    'TESLA': 1,
+    'TETON': 1,
+    'THAN': 4,
+    'THANKSGIVING': 1,
+    'THAT': 3,
+    'THE': 161,
+    'THEATER': 1,
+    'THEATRICAL': 1,
+    'THEODORE': 1,
+    'THESIS': 1,
+    'THICK': 1,
+    'THICKER': 1,
+    'THIGHS': 1,
+    'THIN': 2,
+    'THIRD': 1,
+    'THOMAS': 2,
+    'THOREAU': 1,
+    'THOUGHTS': 1,
+    'THROUGH': 1,
+    'THROW': 3,
+    'THROWING': 1,
+    'THUNDER': 1,
+    'THURGOOD': 1,
+    'TICKER': 1,
+    'TICKET': 1,
+    'TIE': 1,
+    'TIKKA': 1,
+    'TILE': 1,
+    'TIME': 1,
+    'TIMER': 1,
+    'TIMES': 1,
+    'TIP': 2,
+    'TO': 16,
+    'TOAST': 2,
+    'TOLL': 1,
+    'TOMATO': 1,
+    'TOO': 1,
+    'TOOL': 2,
+    'TOP': 8,
+    'TOUR': 1,
+    'TOURNAMENT': 4,
+    'TOWEL': 2,
+    'TOWER': 2,
+    'TOWN': 1,
+    'TOY': 1,
+    'TRACKER': 1,
+    'TRAFFIC': 2,
+    'TRAIL': 3,
+    'TRAIN': 2,
+    'TRAINER': 1,
+    'TRAINING': 1,
+    'TRANSLATING': 1,
+    'TRAP': 1,
+    'TRASH': 1,
+    'TREE': 4,
+    'TREES': 1,
+    'TRIAL': 1,
+    'TRIATHLON': 1,
+    'TRICK': 1,
+    'TROPHY': 1,
+    'TRUCK': 1,
+    'TRUTH': 1,
+    'TUB': 3,
+    'TUBMAN': 1,
+    'TUNA': 1,
+    'TURING': 1,
+    'TURN': 1,
+    'TURNIP': 1,
+    'TWAIN': 1,
+    'TWO': 3,
+    'ULYSSES': 1,
+    'UNDER': 7,
+    'UNDERWATER': 1,
+    'UNTANGLING': 1,
+    'UP': 1,
+    'UTILITY': 1,
+    'VALLEY': 4,
+    'VAN': 1,
+    'VANE': 1,
+    'VERSAILLES': 1,
+    'VESUVIUS': 1,
+    'VICTORIA': 2,
+    'VINCENT': 1,
+    'VINCI': 1,
+    'VIRGINIA': 1,
+    'VOICE': 1,
+    'VOLCANOLOGIST': 1,
+    'VOLTAIRE': 1,
+    'VON': 1,
+    'WAGON': 1,
+    'WAITING': 1,
+    'WALDO': 1,
+    'WALK': 1,
+    'WALKING': 2,
+    'WALKWAY': 1,
+    'WALL': 3,
+    'WALLPAPER': 1,
+    'WALNUT': 1,
+    'WAR': 1,
+    'WASHING': 1,
+    'WASHINGTON': 3,
+    'WATCH': 1,
+    'WATCHING': 3,
+    'WATCHMAN': 1,
+    'WATER': 3,
+    'WATERING': 1,
+    'WATERMELON': 1,
+    'WEATHER': 2,
+    'WEATHERPROOFING': 1,
+    'WEDDING': 1,
+    'WELCOME': 2,
+    'WELDER': 1,
+    'WHEATLEY': 1,
+    'WHEEL': 2,
+    'WHEN': 2,
+    'WHERE': 1,
+    'WHILE': 1,
+    'WHISTLEBLOWER': 1,
+    'WHITE': 1,
+    'WHITNEY': 1,
+    'WHOLE': 1,
+    'WILBERFORCE': 1,
+    'WILDERNESS': 1,
+    'WILDFLOWERS': 1,
+    'WILDLIFE': 1,
+    'WILLIAM': 2,
+    'WIND': 2,
+    'WINDOW': 3,
+    'WINDOWS': 1,
+    'WINE': 2,
+    'WINFREY': 1,
+    'WING': 1,
+    'WINGS': 1,
+    'WINSTON': 1,
+    'WITH': 6,
+    'WOLF': 1,
+    'WOOD': 1,
+    'WOODS': 1,
+    'WOOL': 1,
+    'WOOLF': 1,
+    'WORDS': 1,
+    'WORK': 1,
+    'WORKBENCH': 1,
+    'WORLD': 3,
+    'WORLDS': 1,
+    'WORM': 1,
+    'WRAP': 2,
+    'WRAPPED': 1,
+    'WRESTLING': 1,
+    'WRIGHT': 1,
+    'WRITING': 2,
+    'WRONG': 1,
+    'YARDS': 1,
+    'YEARS': 1,
+    'YELLOWSTONE': 1,
+    'YOU': 4,
+    'YOUNG': 1,
+    'YOUR': 11,
+    'ZEDONG': 1,
+    'ZION': 1,
+    'ZONE': 1,
+}
\ No newline at end of file
@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+import json
+import time
+
+from bots import ENGLISH_FREQUENCY
+
+
+class GameClient:
+    """
+    Minimal asyncio client for server.py. request() sends one op and waits
+    for its response; requests on one client are answered in order.
+    """
+
+    def __init__(self, reader, writer):
+        self.reader  = reader
+        self.writer  = writer
+        self._next_id = 0
+
+    @classmethod
+    async def connect(cls, host='127.0.0.1', port=7777, unix=None):
+        if unix:
+            reader, writer = await asyncio.open_unix_connection(unix)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def request(self, op, **args):
+        """Send one request and return the decoded response dict."""
+        self._next_id += 1
+        self.writer.write(json.dumps({'id': self._next_id, 'op': op, **args}).encode() + b'\n')
+        await self.writer.drain()
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError('server closed the connection')
+        return json.loads(line)
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def play(client, guesses):
+    """
+    Stand-in player: guesses in English frequency order, dismisses every
+    round-end popup, and never shops. Returns the number of guesses made.
+    """
+    state = (await client.request('state'))['state']
+    made  = 0
+    while made < guesses:
+        if state['pending']:
+            state = (await client.request('dismiss'))['state']
+            continue
+        letter = next(c for c in ENGLISH_FREQUENCY if c not in state['guessed'])
+        state  = (await client.request('guess', letter=letter))['state']
+        made  += 1
+    return made
+
+
+async def main(args):
+    target = dict(host=args.host, port=args.port, unix=args.unix)
+
+    # Idle players connect and start a game, then sit on the connection
+    idle = []
+    for _ in range(args.idle):
+        client = await GameClient.connect(**target)
+        await client.request('new')
+        idle.append(client)
+    if idle:
+        print(f'{len(idle)} idle sessions open')
+
+    players = [await GameClient.connect(**target) for _ in range(args.players)]
+    start   = time.perf_counter()
+    made    = await asyncio.gather(*(play(client, args.guesses) for client in players))
+    elapsed = time.perf_counter() - start
+    print(f'{args.players} players made {sum(made)} guesses in {elapsed:.2f}s '
+          f'({sum(made) / elapsed:,.0f} guesses/s)')
+
+    for client in idle + players:
+        await client.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local test client for server.py')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7777)
+    parser.add_argument('--unix', metavar='PATH', default=None, help='Connect over a Unix socket instead of TCP')
+    parser.add_argument('--idle', type=int, default=0, help='Idle sessions to open and hold')
+    parser.add_argument('--players', type=int, default=10, help='Concurrent active players')
+    parser.add_argument('--guesses', type=int, default=1000, help='Guesses per active player')
+    asyncio.run(main(parser.parse_args()))
\ No newline at end of file
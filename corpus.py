@@ -0,0 +1,159 @@
+import mmap
+import struct
+import zlib
+from array import array
+from functools import lru_cache
+
+
+# Packed layout, native byte order (a packed corpus is shared between
+# processes on one machine, it isn't a storage format):
+#   header                 magic, puzzle count, category count, padding
+#   difficulties           float64 × puzzles
+#   text end offsets       uint32 × puzzles
+#   category ids           uint32 × puzzles
+#   category end offsets   uint32 × categories
+#   text bytes, then category name bytes (ASCII)
+MAGIC  = b'PZC1'
+HEADER = struct.Struct('=4sIII')
+
+
+class PackedStrings:
+    """Read-only sequence of ASCII strings stored back to back in one buffer, decoded on access."""
+
+    def __init__(self, data, ends):
+        self.data = data
+        self.ends = ends
+
+    def __len__(self):
+        return len(self.ends)
+
+    def __getitem__(self, i):
+        if not 0 <= i < len(self.ends):
+            raise IndexError('string index out of range')
+        start = self.ends[i - 1] if i else 0
+        return str(self.data[start:self.ends[i]], 'ascii')
+
+    def __iter__(self):
+        start = 0
+        for end in self.ends:
+            yield str(self.data[start:end], 'ascii')
+            start = end
+
+
+class Corpus:
+    """
+    The puzzle set, addressed by index: texts[i], category of i, and
+    difficulties[i], the pool-selection difficulty from
+    difficulty.puzzle_difficulty. GameManager pools hold indices into a
+    corpus rather than (text, category) tuples.
+
+    pack() flattens a corpus into one buffer and from_buffer() reads it back
+    without building a string per puzzle up front, so processes can share a
+    single copy through an mmapped file (see open() and shards.py).
+    """
+
+    def __init__(self, texts, category_ids, category_names, difficulties):
+        self.texts          = texts
+        self.category_ids   = category_ids
+        self.category_names = category_names
+        self.difficulties   = difficulties
+        self._indices       = None   # {text: index}, built on first index_of()
+        self._fingerprint   = None
+
+    def __len__(self):
+        return len(self.texts)
+
+    def __getitem__(self, i):
+        """Return puzzle i as a (text, category) pair."""
+        return self.texts[i], self.category_names[self.category_ids[i]]
+
+    def index_of(self, text):
+        """Index of the puzzle with this text."""
+        if self._indices is None:
+            self._indices = {text: i for i, text in enumerate(self.texts)}
+        return self._indices[text]
+
+    @property
+    def fingerprint(self):
+        """CRC-32 of every puzzle's text and category, in order. Puzzle indices only mean the same thing under the same fingerprint."""
+        if self._fingerprint is None:
+            crc = 0
+            for i in range(len(self)):
+                crc = zlib.crc32('\t'.join(self[i]).encode() + b'\n', crc)
+            self._fingerprint = crc
+        return self._fingerprint
+
+    @classmethod
+    def from_puzzles(cls, puzzles):
+        """Build from (text, category) pairs, scoring each with puzzle_difficulty."""
+        from difficulty import puzzle_difficulty
+
+        names = list(dict.fromkeys(category for _, category in puzzles))
+        ids   = {name: i for i, name in enumerate(names)}
+        return cls(
+            tuple(text for text, _ in puzzles),
+            array('I', (ids[category] for _, category in puzzles)),
+            tuple(names),
+            array('d', (puzzle_difficulty(text, category) for text, category in puzzles)),
+        )
+
+    # --- Packing ---
+
+    def pack(self):
+        """Return the corpus as bytes in the layout described at the top of this module."""
+        texts = [text.encode('ascii') for text in self.texts]
+        names = [name.encode('ascii') for name in self.category_names]
+        return b''.join([
+            HEADER.pack(MAGIC, len(texts), len(names), 0),
+            array('d', self.difficulties).tobytes(),
+            _end_offsets(texts).tobytes(),
+            array('I', self.category_ids).tobytes(),
+            _end_offsets(names).tobytes(),
+            *texts,
+            *names,
+        ])
+
+    @classmethod
+    def from_buffer(cls, buffer):
+        """Wrap a packed corpus without copying it. buffer must stay alive (and open) as long as the corpus."""
+        view = memoryview(buffer)
+        magic, count, categories, _ = HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError('not a packed puzzle corpus')
+
+        offset = HEADER.size
+        def take(size, fmt):
+            nonlocal offset
+            part    = view[offset:offset + size * struct.calcsize(fmt)].cast(fmt)
+            offset += part.nbytes
+            return part
+
+        difficulties = take(count, 'd')
+        text_ends    = take(count, 'I')
+        category_ids = take(count, 'I')
+        name_ends    = take(categories, 'I')
+        texts_size   = text_ends[-1] if count else 0
+        texts        = PackedStrings(view[offset:offset + texts_size], text_ends)
+        names        = PackedStrings(view[offset + texts_size:], name_ends)
+        return cls(texts, category_ids, tuple(names), difficulties)
+
+    @classmethod
+    def open(cls, path):
+        """Map a file written from pack() read-only. Every process mapping it shares the same pages."""
+        with open(path, 'rb') as f:
+            return cls.from_buffer(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def _end_offsets(blobs):
+    ends, total = array('I'), 0
+    for blob in blobs:
+        total += len(blob)
+        ends.append(total)
+    return ends
+
+
+@lru_cache(maxsize=None)
+def default_corpus():
+    """The built-in puzzles from puzzles.py, loaded on first use so shard workers never import them."""
+    from puzzles import PUZZLES
+    return Corpus.from_puzzles(PUZZLES)
\ No newline at end of file
@@ -0,0 +1,119 @@
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional — batch recomputation falls back to the scalar formula
+    np = None
+
+
+# Scrabble values used to weight letter rarity in difficulty calculation
+SCRABBLE = {
+    'A': 1, 'E': 1, 'I': 1, 'O': 1, 'U': 1,
+    'N': 1, 'R': 1, 'S': 1, 'T': 1, 'L': 1, 'H': 1,
+    'D': 2, 'G': 2,
+    'B': 3, 'C': 3, 'M': 3, 'P': 3,
+    'F': 4, 'V': 4, 'W': 4, 'Y': 4,
+    'K': 5,
+    'J': 8, 'X': 8,
+    'Q': 10, 'Z': 10
+}
+
+# Letters that are effectively free for certain categories
+FREE_LETTERS_BY_CATEGORY = {
+    'What Are You Doing?': {'I', 'N', 'G'}
+}
+
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+@lru_cache(maxsize=None)
+def calculate_difficulty(phrase, category):
+    """
+    Calculate a numeric difficulty score for a puzzle.
+    Formula: (unique_letters * rarity * avg_word_length) / num_words
+    Memoized — the pool builder scores every puzzle each time it runs.
+    """
+    unique_letters = set(phrase.replace(' ', ''))
+    free = FREE_LETTERS_BY_CATEGORY.get(category, set())
+    unique_letters -= free
+    rarity = sum(SCRABBLE[c] for c in unique_letters)
+    words = phrase.split()
+    avg_word_length = sum(len(w) for w in words) / len(words)
+    return (len(unique_letters) * rarity * avg_word_length) / len(words)
+
+
+@lru_cache(maxsize=None)
+def calibrated_table():
+    """
+    The {phrase: difficulty} table from difficulty_table.py, loaded on first
+    use. Shard workers read difficulties from the shared corpus and never
+    load it.
+    """
+    try:
+        from difficulty_table import DIFFICULTY_TABLE
+    except ImportError:  # No calibrated table generated — pool selection uses the formula
+        return {}
+    return DIFFICULTY_TABLE
+
+
+def puzzle_difficulty(phrase, category):
+    """
+    Difficulty used to pick which puzzles are eligible at a given streak.
+    Uses the simulation-calibrated value from difficulty_table.py (see
+    calibrate.py) when the puzzle has one, otherwise the formula. Both are
+    on the same scale, so a new puzzle missing from the table still lands
+    in a sensible window.
+    """
+    calibrated = calibrated_table().get(phrase)
+    return calibrated if calibrated is not None else calculate_difficulty(phrase, category)
+
+
+def calculate_difficulties(puzzles):
+    """
+    Batch version of calculate_difficulty for a sequence of (phrase, category)
+    pairs, returning a float64 array in the same order.
+
+    Every phrase is packed into one byte buffer, from which a
+    (puzzles × 26) letter-presence matrix and per-puzzle word and letter
+    counts are built with a handful of vector operations. The arithmetic
+    runs in the same order as the scalar formula, so results are identical.
+    Phrases must be uppercase A-Z and single spaces, as in PUZZLES.
+
+    Without NumPy this falls back to calling calculate_difficulty per puzzle
+    and returns a list.
+    """
+    if np is None:
+        return [calculate_difficulty(text, category) for text, category in puzzles]
+
+    texts      = [text for text, _ in puzzles]
+    categories = [category for _, category in puzzles]
+    n          = len(texts)
+
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=n)
+    chars   = np.frombuffer(''.join(texts).encode('ascii'), dtype=np.uint8)
+    rows    = np.repeat(np.arange(n, dtype=np.int32), lengths)  # Puzzle index of every character
+
+    # --- Letter presence, minus each category's free letters ---
+    letters  = chars != ord(' ')
+    presence = np.zeros(n * 26, dtype=bool)
+    presence[rows[letters] * 26 + (chars[letters] - ord('A'))] = True
+    presence = presence.reshape(n, 26)
+
+    for name, free_letters in FREE_LETTERS_BY_CATEGORY.items():
+        in_category = np.fromiter((c == name for c in categories), dtype=bool, count=n)
+        free        = np.array([c in free_letters for c in ALPHABET])
+        presence[in_category] &= ~free
+
+    # --- Word and letter counts ---
+    # A word starts at any letter preceded by a space or by the start of its phrase
+    after_space = np.ones(len(chars), dtype=bool)
+    after_space[1:] = chars[:-1] == ord(' ')
+    after_space[np.cumsum(lengths)[lengths > 0] - lengths[lengths > 0]] = True
+    num_words   = np.bincount(rows[letters & after_space], minlength=n)
+    num_letters = np.bincount(rows[letters], minlength=n)
+
+    scrabble        = np.array([SCRABBLE[c] for c in ALPHABET], dtype=np.int64)
+    unique_letters  = presence.sum(axis=1)
+    rarity          = presence.astype(np.int64) @ scrabble
+    avg_word_length = num_letters / num_words
+    return (unique_letters * rarity * avg_word_length) / num_words
\ No newline at end of file
@@ -0,0 +1,905 @@
+# Generated by calibrate.py — do not edit by hand.
+# Simulation-calibrated puzzle difficulty on the same scale as the formula in difficulty.py.
+
+DIFFICULTY_TABLE = {
+    'A BLESSING IN DISGUISE': 525.0,
+    'A PENNY FOR YOUR THOUGHTS': 286.0,
+    'ABANDONED DRIVE IN THEATER': 120.0,
+    'ABANDONED TRAIN STATION': 91.0,
+    'ABRAHAM LINCOLN': 566.6666666666667,
+    'ACADEMY AWARDS CEREMONY': 98.0,
+    'ACADIA NATIONAL PARK': 226.875,
+    'ACTIONS SPEAK LOUDER THAN WORDS': 122.4,
+    'ADD FUEL TO THE FIRE': 204.75,
+    'AGATHA CHRISTIE': 398.6666666666667,
+    'AIR TRAFFIC CONTROLLER': 198.0,
+    'ALAN TURING': 320.0,
+    'ALARM CLOCK': 1170.0,
+    'ALBERT EINSTEIN': 653.3333333333334,
+    'ALCATRAZ ISLAND': 1534.5,
+    'ALEXANDER HAMILTON': 204.0,
+    'ALEXANDER THE GREAT': 108.0,
+    'ALFRED HITCHCOCK': 570.0,
+    'ALPHABETIZING THE SPICE RACK': 675.0,
+    'AMAZON RAIN FOREST': 86.66666666666667,
+    'AMAZON RIVER': 87.5,
+    'AMELIA EARHART': 286.0,
+    'ANDREW JACKSON': 830.5555555555557,
+    'ANGEL FALLS': 107.55555555555554,
+    'ANGEL FOOD CAKE': 175.0,
+    'ANIMAL CONTROL OFFICER': 270.11111111111114,
+    'ANNE BOLEYN': 945.0,
+    'ANNE FRANK': 149.33333333333334,
+    'ANTIQUE ROAD SHOW': 786.5,
+    'APPALACHIAN TRAIL': 561.0,
+    'APPLE CIDER': 607.75,
+    'ARCHES NATIONAL PARK': 135.0,
+    'AREA FIFTY ONE': 440.0,
+    'ARLINGTON NATIONAL CEMETERY': 293.3333333333333,
+    'ASSEMBLING FLAT PACK FURNITURE': 270.8333333333333,
+    'ATTIC HATCH': 121.5,
+    'AVALANCHE FORECASTER': 496.125,
+    'AVOCADO TOAST': 1083.75,
+    'AVOIDING EYE CONTACT': 393.5555555555556,
+    'AWARDS BANQUET': 1140.0,
+    'BACHELOR AUCTION': 405.3333333333333,
+    'BACK ALLEY BEHIND THE BOWLING ALLEY': 263.25,
+    'BACK CORNER BOOTH': 105.0,
+    'BACK DOOR STEPS': 250.25,
+    'BACK FENCE': 221.0,
+    'BACK NINE': 224.0,
+    'BACK NINE OF THE GOLF COURSE': 192.5,
+    'BACK OF THE AMBULANCE': 256.0,
+    'BACK OF THE BUS': 180.0,
+    'BACK OF THE CAVE': 282.24,
+    'BACK OF THE CLOSET': 221.0,
+    'BACK OF THE FRIDGE': 189.0,
+    'BACK ROOM OF THE PAWNSHOP': 250.25,
+    'BACK TO SQUARE ONE': 180.0,
+    'BAKE SALE': 1326.0,
+    'BAKED ALASKA': 1242.0,
+    'BAKING CHOCOLATE CHIP COOKIES': 373.75,
+    'BALANCING THE CHECKBOOK': 540.0,
+    'BANANA BREAD': 132.0,
+    'BANANA SPLIT': 127.5,
+    'BANGERS AND MASH': 525.0,
+    'BARKING UP THE WRONG TREE': 384.0,
+    'BARN DANCE': 168.75,
+    'BASEMENT STAIRS': 48.0,
+    'BASEMENT STORAGE ROOM': 72.0,
+    'BASKETBALL HOOP': 675.0,
+    'BATH MAT': 190.66666666666666,
+    'BATH TUB': 184.88888888888889,
+    'BATHROOM EXHAUST FAN': 686.1111111111112,
+    'BATHROOM MIRROR': 131.25,
+    'BEAT AROUND THE BUSH': 438.75,
+    'BEATING A DEAD HORSE': 390.0,
+    'BED SHEET': 320.0,
+    'BEEF BOURGUIGNON': 500.5,
+    'BEEF STEAK': 182.0,
+    'BEEF STROGANOFF': 405.0,
+    'BEHIND THE COUCH': 109.43999999999998,
+    'BELT BUCKLE': 1309.0,
+    'BENJAMIN FRANKLIN': 840.0,
+    'BESSIE COLEMAN': 564.6666666666666,
+    'BETTER LATE THAN NEVER': 864.0,
+    'BIKE LOCK': 385.0,
+    'BIKE MESSENGER': 210.0,
+    'BILL GATES': 616.0,
+    'BIRTHDAY CAKE': 220.5,
+    'BISCUITS AND GRAVY': 405.0,
+    'BITE OFF MORE THAN YOU CAN CHEW': 252.0,
+    'BITE THE BULLET': 360.0,
+    'BITE THE DUST': 272.0,
+    'BITE THE HAND THAT FEEDS YOU': 252.0,
+    'BLACK BEAN SOUP': 216.66666666666666,
+    'BLACKENED SWORDFISH WITH MANGO SALSA': 238.0,
+    'BLOOD DRIVE': 126.0,
+    'BLOOD IS THICKER THAN WATER': 333.3333333333333,
+    'BLOWING BUBBLES': 540.0,
+    'BLUEBERRY PANCAKES': 577.7777777777777,
+    'BOAT PARADE': 120.0,
+    'BOMB DISPOSAL TECHNICIAN': 303.3333333333333,
+    'BOOK BAG': 280.0,
+    'BOOK FAIR': 240.0,
+    'BOOK MARK': 250.25,
+    'BOOKER T WASHINGTON': 476.0,
+    'BORA BORA': 1644.5,
+    'BORDER PATROL AGENT': 500.0,
+    'BOTTOM OF THE BARREL': 227.5,
+    'BOTTOM OF THE GARDEN': 112.0,
+    'BOTTOM OF THE HILL': 113.75,
+    'BOTTOM OF THE OCEAN': 269.5,
+    'BOTTOM OF THE STAIRS': 108.0,
+    'BOTTOM OF THE STAIRWELL': 231.0,
+    'BOURBON BREAD PUDDING': 78.75,
+    'BOURBON STREET': 93.33333333333333,
+    'BRAM STOKER': 960.0,
+    'BREAD BOX': 141.55555555555554,
+    'BREAD ROLL': 175.0,
+    'BREAK A LEG': 154.375,
+    'BREAK ROOM': 145.44444444444443,
+    'BREAKFAST NOOK': 94.5,
+    'BROKEN PORCH RAILING': 483.84000000000003,
+    'BRYCE CANYON': 765.0,
+    'BUBBLE WRAP': 168.99999999999997,
+    'BUCKINGHAM PALACE': 497.25,
+    'BUFFALO CHICKEN WINGS': 295.75,
+    'BUILDING A BLANKET FORT': 105.0,
+    'BUILDING A SANDCASTLE': 198.0,
+    'BUILDING INSPECTOR': 300.0,
+    'BUILT IN BOOKCASE': 546.0,
+    'BULLETIN BOARD': 208.0,
+    'BURN THE MIDNIGHT OIL': 330.0,
+    'BURNING BRIDGES': 232.2222222222222,
+    'BURNING THE CANDLE AT BOTH ENDS': 45.0,
+    'BUTTERSCOTCH PUDDING': 300.0,
+    'CAESAR SALAD': 44.44444444444445,
+    'CALCULATING THE TIP ON A LARGE GROUP BILL': 274.56,
+    'CALL IT A DAY': 510.0,
+    'CALLING MOM': 517.5,
+    'CANDLE STICK': 783.75,
+    'CANT SEE THE FOREST FOR THE TREES': 148.5,
+    'CAPE CANAVERAL': 704.0,
+    'CAPE COD': 378.0,
+    'CAPE FEAR': 722.2222222222223,
+    'CAPE HATTERAS': 252.0,
+    'CAPE OF GOOD HOPE': 378.0,
+    'CAR KEY': 217.7777777777778,
+    'CAR SHOW': 180.0,
+    'CARROT GINGER SOUP': 283.5,
+    'CATALOGUING THE RECORD COLLECTION': 227.55555555555554,
+    'CATCHING FIREFLIES': 270.0,
+    'CAUGHT BETWEEN A ROCK AND A HARD PLACE': 281.1111111111111,
+    'CAUGHT WITH YOUR HAND IN THE COOKIE JAR': 330.0,
+    'CAULKING THE BATHTUB': 540.0,
+    'CAVE TOUR GUIDE': 432.0,
+    'CEILING FAN': 96.0,
+    'CELEBRITY CHEF COOKOFF': 525.0,
+    'CELLAR DOOR': 107.55555555555554,
+    'CENTER OF THE MAZE': 1275.0,
+    'CENTRAL PARK': 213.8888888888889,
+    'CHAMPIONSHIP BOXING MATCH': 693.0,
+    'CHARITY AUCTION': 400.0,
+    'CHARLES DARWIN': 236.25,
+    'CHARLES DE GAULLE': 330.0,
+    'CHARLES DICKENS': 686.1111111111112,
+    'CHARRED BRUSSELS SPROUTS': 346.5,
+    'CHASING YOUR TAIL': 254.2222222222222,
+    'CHECKING THE MAIL': 631.2222222222222,
+    'CHECKPOINT CHARLIE': 572.0,
+    'CHEESE STEAK': 149.625,
+    'CHESAPEAKE BAY': 966.0,
+    'CHESS GRANDMASTER': 309.22222222222223,
+    'CHICKEN MARSALA': 236.25,
+    'CHICKEN NOODLE SOUP': 190.0,
+    'CHICKEN PARMESAN': 495.0,
+    'CHICKEN TIKKA MASALA': 233.33333333333334,
+    'CHILDRENS BOOK ILLUSTRATOR': 63.0,
+    'CHILI CHEESE FRIES': 390.0,
+    'CHILI COOK OFF': 217.7777777777778,
+    'CHORAL CONCERT': 206.93877551020407,
+    'CHRISTENING CEREMONY': 296.0,
+    'CHRISTMAS TREE LIGHTING': 263.25,
+    'CHRISTOPHER COLUMBUS': 357.0,
+    'CINCO DE MAYO CELEBRATION': 288.75,
+    'CLAM CHOWDER': 303.3333333333333,
+    'CLARA BARTON': 748.0,
+    'CLEANING THE GARAGE': 35.0,
+    'CLEOPATRA': 697.6666666666666,
+    'CLUB SANDWICH': 485.875,
+    'COAT CHECK': 1235.0,
+    'COAT CLOSET': 121.5,
+    'COAT HANGER': 418.0,
+    'COAT HOOK': 1200.0,
+    'COBB SALAD': 425.0,
+    'COBWEBS IN THE CORNER OF THE GARAGE': 286.0,
+    'COFFEE MUG': 611.1111111111112,
+    'COIN PURSE': 613.3333333333334,
+    'COLONIAL REENACTMENT FESTIVAL': 204.0,
+    'COLOSSEUM': 348.0,
+    'COMPARING APPLES TO ORANGES': 256.0,
+    'COMPETITIVE BALLROOM DANCE JUDGE': 266.6666666666667,
+    'COMPETITIVE BARBECUE CHAMPIONSHIP': 300.0,
+    'COMPETITIVE EATING CHAMPION': 117.33333333333333,
+    'COMPETITIVE ROBOTICS TOURNAMENT': 353.22222222222223,
+    'COMPETITIVE SCRABBLE PLAYER': 352.6875,
+    'COMPOSTING KITCHEN SCRAPS': 292.5,
+    'CONFLICT MEDIATOR': 243.0,
+    'CONVERTED GARAGE STUDIO': 405.0,
+    'COPERNICUS': 576.3333333333334,
+    'CORN BREAD': 178.125,
+    'CORN DOG': 221.0,
+    'CORNER COFFEE SHOP': 532.875,
+    'CORNER OF THE RING': 133.0,
+    'CORPORATE BOARD MEETING': 321.75,
+    'COST AN ARM AND A LEG': 210.0,
+    'COUNTING SHEEP': 386.4,
+    'COUNTY FAIR': 378.0,
+    'COURT REPORTER': 733.3333333333334,
+    'COVER ALL YOUR BASES': 594.0,
+    'CRAB CAKE': 617.5,
+    'CRACKED TILE BEHIND THE STOVE': 333.66666666666663,
+    'CRAFT BEER FESTIVAL': 560.0,
+    'CRATER LAKE': 283.5,
+    'CRAWL SPACE': 506.25,
+    'CRAZY HORSE': 1800.0,
+    'CREAM PUFF': 897.0,
+    'CREME BRULEE': 948.75,
+    'CRIME SCENE CLEANER': 278.6666666666667,
+    'CROP DUSTER PILOT': 378.0,
+    'CROSS THAT BRIDGE WHEN YOU COME TO IT': 144.0,
+    'CROSSWORD PUZZLE CONSTRUCTOR': 170.66666666666666,
+    'CROWS NEST': 430.2222222222222,
+    'CUT TO THE CHASE': 300.0,
+    'DANCING AROUND THE SUBJECT': 405.0,
+    'DAYTONA BEACH': 520.0,
+    'DEAD END': 105.0,
+    'DEAD SEA': 168.0,
+    'DEAN MARTIN': 245.0,
+    'DEATH VALLEY': 308.0,
+    'DEBUGGING COMPUTER CODE': 336.0,
+    'DECLUTTERING THE BASEMENT': 202.2222222222222,
+    'DEEP END OF THE POOL': 157.5,
+    'DEEP SEA DIVER': 929.5,
+    'DEFENDING YOUR DOCTORAL THESIS': 158.83999999999997,
+    'DEMOLITION DERBY': 84.0,
+    'DEMOLITION DERBY DRIVER': 80.0,
+    'DENALI NATIONAL PARK': 213.33333333333334,
+    'DEVILS TOWER': 504.0,
+    'DIANA ROSS': 269.5,
+    'DIGGING A HOLE': 248.8888888888889,
+    'DINING ROOM TABLE': 420.75,
+    'DIPLOMATIC SUMMIT': 409.5,
+    'DISH RAG': 614.25,
+    'DISH TOWEL': 168.99999999999997,
+    'DIVING BOARD': 157.5,
+    'DOG SHOW': 252.0,
+    'DOG SLED RACER': 270.0,
+    'DOING THE DISHES': 387.5,
+    'DONT COUNT YOUR CHICKENS': 467.5,
+    'DONT LOOK A GIFT HORSE IN THE MOUTH': 272.25,
+    'DONT THROW THE BABY OUT WITH THE BATHWATER': 360.0,
+    'DOOR KNOCKER': 1256.6666666666665,
+    'DOOR MAT': 175.5,
+    'DOOR STOPPER': 860.625,
+    'DOROTHY PARKER': 792.0,
+    'DUCK CONFIT WITH LENTILS': 227.5,
+    'DUSTY ATTIC CORNER': 77.0,
+    'DUSTY COUNTRY ROAD': 226.66666666666666,
+    'DWIGHT EISENHOWER': 286.0,
+    'EATING LUNCH': 85.3061224489796,
+    'EAVESDROPPING ON THE NEIGHBORS': 332.44444444444446,
+    'EDGAR ALLAN POE': 526.5,
+    'EDGE OF THE CLIFF': 240.0,
+    'EDGE OF THE MAP': 430.6666666666667,
+    'EGG ROLL': 846.0,
+    'EGGS BENEDICT': 660.0,
+    'EIFFEL TOWER': 420.0,
+    'ELEANOR ROOSEVELT': 115.5,
+    'ELECTRIC BLANKET': 242.0,
+    'ELIZABETH BLACKWELL': 1308.4444444444446,
+    'ELLA FITZGERALD': 1578.6666666666667,
+    'EMILY DICKINSON': 690.0,
+    'EMPIRE STATE BUILDING': 293.3333333333333,
+    'EMPTY SWIMMING POOL': 376.4444444444445,
+    'END OF THE LINE': 119.0,
+    'END OF THE PIER': 497.25,
+    'END OF THE RAINBOW': 392.4375,
+    'END ZONE': 2233.0,
+    'ENGLISH CHANNEL': 400.0,
+    'ERNEST HEMINGWAY': 294.0,
+    'ETHICAL HACKER': 963.4444444444445,
+    'EVERY CLOUD HAS A SILVER LINING': 245.4375,
+    'EVERY DOG HAS ITS DAY': 120.0,
+    'EXERCISE BIKE': 1495.0,
+    'EXPLAINING QUANTUM PHYSICS TO A CHILD': 342.0,
+    'FEEDING THE DUCKS': 539.0,
+    'FILING YOUR TAXES': 560.0,
+    'FILM FESTIVAL OPENING NIGHT': 234.0,
+    'FIRE ESCAPE': 180.0,
+    'FIRE ESCAPE LANDING': 141.75,
+    'FIRE EXTINGUISHER': 980.0,
+    'FIRE LOOKOUT': 288.0,
+    'FIRE PIT': 210.375,
+    'FIREPLACE MANTLE': 409.5,
+    'FIREWORKS GRAND FINALE': 168.0,
+    'FIRST DAY OF SCHOOL': 182.0,
+    'FISH AND CHIPS': 532.0,
+    'FISH FRY': 510.0,
+    'FISH TACO': 300.0,
+    'FISH TANK': 990.0,
+    'FLICKERING PORCH LIGHT FIXTURE': 495.0,
+    'FLIP FLOPS': 897.8399999999999,
+    'FLORENCE NIGHTINGALE': 266.6666666666667,
+    'FLORIDA EVERGLADES': 570.0,
+    'FLORIDA KEYS': 682.5,
+    'FLOWER POT': 147.0,
+    'FLOWER SHOW': 135.0,
+    'FLYING A KITE': 720.0,
+    'FOLDING LAUNDRY': 336.0,
+    'FOLLOWING A COMPLICATED RECIPE': 248.8888888888889,
+    'FOOD CRITIC': 385.0,
+    'FOOD DRIVE': 210.0,
+    'FORBIDDEN CITY': 495.0,
+    'FORENSIC ACCOUNTANT': 202.5,
+    'FORENSIC ENTOMOLOGIST': 266.6666666666667,
+    'FORENSIC SKETCH ARTIST': 564.7777777777778,
+    'FORGOTTEN CORNER OF THE LIBRARY': 288.0,
+    'FORGOTTEN GARDEN BEHIND THE CHURCH': 157.5,
+    'FORGOTTEN SUBWAY PLATFORM': 239.765625,
+    'FORK IN THE ROAD': 520.0,
+    'FOURTH OF JULY FIREWORKS': 484.0,
+    'FRANK LLOYD WRIGHT': 266.0,
+    'FREDERICK DOUGLASS': 497.25,
+    'FRENCH ONION SOUP': 182.72222222222226,
+    'FRENCH QUARTER': 1296.75,
+    'FRENCH TOAST': 78.75,
+    'FRIDA KAHLO': 960.0,
+    'FRONT HALL MIRROR': 148.75,
+    'FRONT PORCH SWING': 157.5,
+    'FRONT STOOP': 624.0,
+    'FUNDRAISER GALA': 94.5,
+    'FUNERAL HOME DIRECTOR': 174.2222222222222,
+    'FYODOR DOSTOEVSKY': 829.4399999999999,
+    'GALAPAGOS ISLANDS': 563.3333333333334,
+    'GALILEO GALILEI': 697.5,
+    'GAME NIGHT': 141.75,
+    'GARAGE DOOR OPENER': 521.3333333333334,
+    'GARAGE WORKBENCH': 690.0,
+    'GARDEN GATE': 87.75,
+    'GARDEN GNOME': 330.0,
+    'GARDEN HOSE': 261.25,
+    'GENGHIS KHAN': 1088.888888888889,
+    'GEORGE ORWELL': 528.125,
+    'GEORGE WASHINGTON': 56.875,
+    'GERMAN CHOCOLATE CAKE': 380.25,
+    'GERONIMO': 523.25,
+    'GIFT WRAP': 211.75,
+    'GIVE CREDIT WHERE CREDIT IS DUE': 280.0,
+    'GIVE IT A SHOT': 210.375,
+    'GLACIER NATIONAL PARK': 340.0,
+    'GO BACK TO THE DRAWING BOARD': 261.25,
+    'GOBI DESERT': 616.6875,
+    'GOLDEN GATE BRIDGE': 180.0,
+    'GOLF CADDIE': 288.0,
+    'GRADUATION CEREMONY': 267.75,
+    'GRAFFITI REMOVAL SPECIALIST': 351.0,
+    'GRAND CANYON': 157.5,
+    'GRAND TETON NATIONAL PARK': 105.0,
+    'GREAT BARRIER REEF': 607.5,
+    'GREAT SMOKY MOUNTAINS': 486.0,
+    'GREAT WALL OF CHINA': 150.0,
+    'GREEN ROOM': 141.75,
+    'GREEN TEA': 124.44444444444446,
+    'GRILLED CHEESE SANDWICH': 52.5,
+    'GROUNDBREAKING CEREMONY': 411.125,
+    'GROUNDHOG DAY': 504.0,
+    'GUEST ROOM BED': 418.0,
+    'GULF OF MEXICO': 1126.6666666666665,
+    'HAIR TIE': 306.0,
+    'HALF TIME SHOW': 277.27777777777777,
+    'HALL MIRROR': 156.0,
+    'HALL MONITOR': 260.0,
+    'HALLOWEEN COSTUME PARTY': 162.5625,
+    'HAM STEAK': 312.0,
+    'HAND FAN': 240.0,
+    'HAND MODEL': 321.11111111111114,
+    'HARBOR MASTER': 658.125,
+    'HARRIET BEECHER STOWE': 552.0,
+    'HARRIET TUBMAN': 560.0,
+    'HARVEST MOON FESTIVAL': 143.0,
+    'HAUNTED LIGHTHOUSE': 115.55555555555554,
+    'HAVE YOUR CAKE AND EAT IT TOO': 378.0,
+    'HAY BARN': 507.0,
+    'HEART OF THE CITY': 166.83333333333334,
+    'HELEN KELLER': 1463.0,
+    'HENRY DAVID THOREAU': 468.0,
+    'HIDDEN CLEARING IN THE WOODS': 192.5,
+    'HIGH SCHOOL REUNION': 285.0,
+    'HIT THE NAIL ON THE HEAD': 183.75,
+    'HIT THE ROAD': 132.0,
+    'HIT THE SACK': 376.32000000000005,
+    'HOLLANDAISE SAUCE': 168.0,
+    'HOME BASE': 1008.0,
+    'HOMECOMING PARADE': 278.4375,
+    'HOMER': 704.0,
+    'HOOVER DAM': 948.75,
+    'HORSE SHOW': 126.5,
+    'HORSE TRAINER': 110.25,
+    'HOT DOG': 163.625,
+    'HUDSON RIVER': 232.00000000000003,
+    'ICED TEA': 360.0,
+    'IMMANUEL KANT': 627.0,
+    'IN HOT WATER': 175.0,
+    'INCA TRAIL': 260.0,
+    'INTERNATIONAL BALLOON FIESTA': 469.3333333333333,
+    'INTERNATIONAL CHESS TOURNAMENT': 61.25,
+    'IRONING BOARD': 376.4444444444445,
+    'ISAAC NEWTON': 288.0,
+    'ISLE OF CAPRI': 448.0,
+    'IT TAKES TWO TO TANGO': 916.6666666666666,
+    'JEWELRY BOX': 1296.75,
+    'JOAN OF ARC': 1352.0,
+    'JOHN ADAMS': 412.5,
+    'JOHN F KENNEDY': 1122.0,
+    'JOHN STEINBECK': 810.0,
+    'JOSEPH STALIN': 792.0,
+    'JULIUS CAESAR': 1134.0,
+    'JUMP FROM THE FRYING PAN INTO THE FIRE': 260.0,
+    'JUMP ON THE BANDWAGON': 337.77777777777777,
+    'JUMP ROPE': 373.75,
+    'JUNK DRAWER': 280.0,
+    'KEY CHAIN': 227.5,
+    'KILL TWO BIRDS WITH ONE STONE': 443.3333333333333,
+    'KITCHEN ISLAND COUNTER': 56.0,
+    'KITCHEN SINK': 167.2,
+    'KITCHEN TIMER': 288.8888888888889,
+    'KNITTING A SWEATER': 726.0,
+    'LAKE BAIKAL': 1326.0,
+    'LAKE ERIE': 306.0,
+    'LAKE HURON': 286.22222222222223,
+    'LAKE MICHIGAN': 418.0,
+    'LAKE TAHOE': 243.75,
+    'LAMB CHOP': 866.25,
+    'LAMINATING EVERYTHING IN SIGHT': 262.5,
+    'LANGSTON HUGHES': 333.66666666666663,
+    'LAST BOOTH IN THE GREASY SPOON': 286.0,
+    'LAST DAY OF SCHOOL': 250.0,
+    'LAUNDRY CHUTE': 201.875,
+    'LAUNDRY ROOM FLOOR': 131.25,
+    'LAVA LAMP': 1343.3333333333335,
+    'LEAKY FAUCET IN THE BASEMENT SINK': 263.25,
+    'LEARNING TO PLAY GUITAR': 243.0,
+    'LEARNING TO RIDE A BIKE': 185.77777777777774,
+    'LEONARDO DA VINCI': 643.5,
+    'LET SLEEPING DOGS LIE': 196.44444444444446,
+    'LET THE CAT OUT OF THE BAG': 260.0,
+    'LIBERTY BELL': 144.0,
+    'LIGHTHOUSE KEEPER': 570.0,
+    'LIKE FINDING A NEEDLE IN A HAYSTACK': 392.0,
+    'LINCOLN MEMORIAL': 86.4,
+    'LINEN CLOSET': 167.2,
+    'LIP BALM': 1050.0,
+    'LITTLE LEAGUE BASEBALL FIELD': 504.0,
+    'LIVING ROOM COUCH': 590.3333333333334,
+    'LOADING DOCK': 227.5,
+    'LOBSTER BISQUE': 175.0,
+    'LOCKED WING OF THE HOSPITAL': 233.33333333333334,
+    'LOST AND FOUND': 390.0,
+    'LOST LUGGAGE AREA': 71.28,
+    'LOUIS ARMSTRONG': 234.0,
+    'LOUISIANA BAYOU': 660.0,
+    'LUGGAGE TAG': 156.0,
+    'LUNCH BOX': 316.875,
+    'LYNDON B JOHNSON': 1089.0,
+    'MACARONI AND CHEESE': 198.0,
+    'MACHU PICCHU': 736.0,
+    'MAGNIFYING GLASS': 483.0,
+    'MAHATMA GANDHI': 457.11111111111114,
+    'MAIL BOX': 316.875,
+    'MAIL CARRIER': 325.00000000000006,
+    'MAIL SLOT': 240.0,
+    'MAKING A MOUNTAIN OUT OF A MOLEHILL': 198.0,
+    'MAKING BREAKFAST': 87.5,
+    'MAO ZEDONG': 2100.0,
+    'MAPLE BACON DONUT': 400.0,
+    'MARATHON FINISH LINE': 240.25,
+    'MARCO POLO': 731.5,
+    'MARDI GRAS PARADE': 450.0,
+    'MARIE ANTOINETTE': 142.99999999999997,
+    'MARIE CURIE': 364.0,
+    'MARINE BIOLOGIST': 408.0,
+    'MARK TWAIN': 420.0,
+    'MARTIN LUTHER KING': 506.25,
+    'MASTER BATH SOAKING TUB': 400.0,
+    'MASTER BEDROOM': 86.4,
+    'MEAT LOAF': 510.0,
+    'MEAT PIE': 166.25,
+    'MEDICINE CABINET': 290.8888888888889,
+    'MEDIEVAL JOUSTING TOURNAMENT': 409.5,
+    'MEMORIAL DAY COOKOUT': 414.0,
+    'MERYL STREEP': 650.0,
+    'MICHELANGELO': 360.0,
+    'MIDNIGHT COUNTDOWN': 266.0,
+    'MIDNIGHT DINER': 192.5,
+    'MISS THE BOAT': 308.0,
+    'MISSISSIPPI DELTA': 247.03125,
+    'MISSISSIPPI RIVER': 99.34375,
+    'MOCK TRIAL': 627.0,
+    'MOJAVE DESERT': 968.0,
+    'MONT BLANC': 748.0,
+    'MONTE CRISTO SANDWICH': 169.8125,
+    'MONUMENT VALLEY': 124.3125,
+    'MOON LANDING': 108.0,
+    'MOSES': 585.0,
+    'MOTHER TERESA': 302.22222222222223,
+    'MOUNT EVEREST': 770.0,
+    'MOUNT FUJI': 1276.0,
+    'MOUNT KILIMANJARO': 840.0,
+    'MOUNT OLYMPUS': 560.0,
+    'MOUNT RUSHMORE': 198.0,
+    'MOUNT SAINT HELENS': 225.0,
+    'MOUNT VESUVIUS': 780.0,
+    'MOUNT WHITNEY': 405.0,
+    'MOUNTAIN RESCUE COORDINATOR': 174.0,
+    'MOUSE TRAP': 616.0,
+    'MOUTH OF THE RIVER': 192.5,
+    'MOWING THE LAWN': 316.6666666666667,
+    'MOZZARELLA STICKS': 1140.0625,
+    'MUDDY RIVERBANK': 576.3333333333334,
+    'MUDROOM BENCH': 564.6666666666666,
+    'MUDROOM COAT RACK': 157.5,
+    'NAPOLEON BONAPARTE': 665.5,
+    'NARRATING YOUR OWN LIFE': 273.0,
+    'NATIONAL SPELLING CHAMPIONSHIP': 61.25,
+    'NEGOTIATING A HOSTAGE SITUATION': 362.6666666666667,
+    'NEIGHBORHOOD BLOCK PARTY': 297.0,
+    'NEIGHBORHOOD GARAGE SALE': 96.0,
+    'NEIGHBORHOOD SWIMMING HOLE': 91.875,
+    'NEIL ARMSTRONG': 52.5,
+    'NEIL YOUNG': 532.0,
+    'NELSON MANDELA': 305.76,
+    'NEW YEARS EVE PARTY': 630.0,
+    'NIAGARA FALLS': 456.0,
+    'NIGHT WATCHMAN': 365.625,
+    'NIKITA KHRUSHCHEV': 570.0,
+    'NIKOLA TESLA': 960.0,
+    'NILE RIVER': 252.0,
+    'NORTH POLE': 216.0,
+    'NORWEGIAN FJORDS': 693.0,
+    'NOTE PAD': 704.0,
+    'NUCLEAR SUBMARINE COOK': 175.0,
+    'OBSERVATION DECK AT DAWN': 402.5,
+    'OFF THE TOP OF MY HEAD': 432.0,
+    'OLD COVERED BRIDGE': 650.2222222222222,
+    'OLD FISHING DOCK': 364.5,
+    'OLD NEIGHBORHOOD BARBERSHOP': 346.5,
+    'OLYMPIC OPENING CEREMONY': 264.0,
+    'ON THE FENCE': 154.0,
+    'ON THIN ICE': 272.0,
+    'ONCE IN A BLUE MOON': 582.6666666666666,
+    'ONION RING': 165.0,
+    'OPEN MIC NIGHT': 420.75,
+    'OPRAH WINFREY': 415.8,
+    'OTTO VON BISMARCK': 606.6666666666666,
+    'OUTDOOR SHOWER STALL': 230.0,
+    'OVERFLOW PARKING LOT': 409.5,
+    'OVERGROWN CEMETERY PATH': 351.0,
+    'OVERGROWN WALKWAY TO THE SHED': 336.0,
+    'OVERHAULING THE FILING SYSTEM': 264.0,
+    'OVERTHINKING EVERYTHING': 687.5555555555557,
+    'PABLO PICASSO': 888.25,
+    'PACIFIC CREST TRAIL': 459.0,
+    'PACKING A SUITCASE': 513.0,
+    'PAINTING THE BEDROOM': 332.4444444444444,
+    'PALACE OF VERSAILLES': 560.0,
+    'PALM BEACH': 714.0,
+    'PANAMA CANAL': 935.0,
+    'PANCAKE BREAKFAST FUNDRAISER': 355.0625,
+    'PANTRY SHELF': 344.25,
+    'PAPER SHREDDER': 885.5,
+    'PARALLEL PARKING A MOVING TRUCK': 330.0,
+    'PARK RANGER': 893.75,
+    'PARKING METER': 342.2222222222222,
+    'PATAGONIA WILDERNESS': 297.0,
+    'PAYPHONE ON THE CORNER': 444.4444444444444,
+    'PEA COAT': 126.0,
+    'PEACH COBBLER': 546.6666666666666,
+    'PEACH PIE': 166.32,
+    'PEANUT BUTTER AND JELLY': 660.0,
+    'PEELING WALLPAPER IN THE POWDER ROOM': 276.25,
+    'PEKING DUCK': 701.25,
+    'PENCIL SHARPENER': 476.0,
+    'PENNE ARRABBIATA': 769.5,
+    'PEP RALLY': 1001.0,
+    'PEPPER GRINDER': 746.6666666666666,
+    'PERFORMING IN THE SCHOOL TALENT SHOW': 189.0,
+    'PERISCOPE': 792.0,
+    'PETTING THE CAT': 525.0,
+    'PHILLIS WHEATLEY': 488.88888888888886,
+    'PHONE CASE': 105.6,
+    'PHONE CHARGER': 467.5,
+    'PIANO RECITAL': 468.0,
+    'PICKING APPLES': 768.4444444444443,
+    'PICKLED WATERMELON RIND': 382.5,
+    'PICTURE FRAME': 500.5,
+    'PIE EATING CONTEST': 229.32000000000002,
+    'PIECE OF CAKE': 260.0,
+    'PIGGY BANK': 1127.7777777777776,
+    'PILL BOTTLE': 1083.0,
+    'PIT STOP': 210.0,
+    'PITA BREAD': 888.25,
+    'PLANTING SEEDS': 450.0,
+    'PLATO': 1056.0,
+    'POACHED PEAR IN RED WINE': 440.0,
+    'POCAHONTAS': 693.0,
+    'POCKET WATCH': 912.0,
+    'POLAR BEAR PLUNGE': 532.0,
+    'POLITICAL CARTOONIST': 486.0,
+    'POND IN THE PARK': 204.75,
+    'POOL LIFEGUARD': 380.25,
+    'PORCH SWING': 199.33333333333334,
+    'POT LUCK DINNER': 546.0,
+    'POTATO LEEK SOUP': 945.0,
+    'POUND CAKE': 250.25,
+    'POWER WASHING THE DRIVEWAY': 321.75,
+    'PRACTICING THE ACCEPTANCE SPEECH': 324.0,
+    'PRESIDENTIAL INAUGURATION': 300.0,
+    'PRESSING WILDFLOWERS': 372.59999999999997,
+    'PRETENDING TO BE BUSY': 324.0,
+    'PRETENDING TO WORK FROM HOME': 394.77777777777777,
+    'PRIME RIB ROAST': 585.0,
+    'PRIVATE INVESTIGATOR': 569.25,
+    'PROFESSIONAL BRIDESMAID': 358.8888888888889,
+    'PROFESSIONAL BULL RIDING CHAMPIONSHIP': 163.2,
+    'PROFESSIONAL CUDDLER': 163.33333333333334,
+    'PROFESSIONAL FOLEY ARTIST': 346.5,
+    'PROFESSIONAL GENEALOGIST': 300.0,
+    'PROFESSIONAL GOLF TOURNAMENT PLAYOFF': 237.5,
+    'PROFESSIONAL LINE SITTER': 80.0,
+    'PROFESSIONAL MOURNER': 238.0,
+    'PROFESSIONAL ORGANIZER': 1152.0,
+    'PROFESSIONAL POKER PLAYER': 569.25,
+    'PROFESSIONAL WHISTLEBLOWER': 300.0,
+    'PROFESSIONAL WRESTLING GRUDGE MATCH': 65.0,
+    'PROM NIGHT': 427.5,
+    'PROSCIUTTO WRAPPED MELON': 247.5,
+    'PULL OUT ALL THE STOPS': 153.0,
+    'PULL SOMEONES LEG': 210.0,
+    'PULLED PORK SANDWICH': 150.2222222222222,
+    'PULLING THE WOOL OVER SOMEONES EYES': 260.0,
+    'PUT A SOCK IN IT': 121.5,
+    'PUT ALL YOUR EGGS IN ONE BASKET': 324.0,
+    'QUEEN VICTORIA': 1140.0,
+    'RAIN GUTTER': 526.5,
+    'RAKING LEAVES': 762.6666666666666,
+    'RALPH WALDO EMERSON': 336.0,
+    'RATATOUILLE': 264.0,
+    'READING A GOOD BOOK': 189.0,
+    'READING NOOK CUSHION': 161.7777777777778,
+    'RED SEA': 173.25,
+    'REFINISHING THE HARDWOOD FLOORS': 199.1111111111111,
+    'REORGANIZING THE PANTRY': 1132.4444444444443,
+    'REPOTTING THE SUCCULENTS': 288.0,
+    'RESTORING AN OLD PHOTO': 286.0,
+    'RETIREMENT PARTY': 320.0,
+    'REWATCHING THE SAME DOCUMENTARY': 162.0,
+    'REWIRING AN OLD LAMP': 308.0,
+    'RIBBON CUTTING CEREMONY': 405.0,
+    'RICE CAKE': 309.375,
+    'RICHARD NIXON': 1287.0,
+    'ROBBING PETER TO PAY PAUL': 325.1111111111111,
+    'ROCKING CHAIR': 960.0,
+    'ROCKY MOUNTAIN NATIONAL PARK': 115.5,
+    'ROCKY MOUNTAINS': 117.33333333333333,
+    'ROLLER COASTER DESIGNER': 263.25,
+    'ROLLER DERBY COACH': 210.0,
+    'ROLLING DOWN A HILL': 303.75,
+    'ROOFTOP GARDEN': 476.0,
+    'ROSA PARKS': 1392.0,
+    'ROYAL GUARD CHANGING CEREMONY': 234.0,
+    'ROYAL WEDDING': 377.7777777777778,
+    'RUBBER DUCK': 603.75,
+    'RUNNING A MARATHON': 321.75,
+    'SAFE HOUSE': 436.3333333333333,
+    'SAFFRON RISOTTO WITH SCALLOPS': 303.3333333333333,
+    'SAHARA DESERT': 207.14285714285717,
+    'SCHEDULING BACK TO BACK MEETINGS': 213.33333333333334,
+    'SCHOOL BUS DRIVER': 112.0,
+    'SCHOOL PLAY': 157.5,
+    'SCIENCE FAIR': 285.0,
+    'SCOTTISH HIGHLANDS': 284.4444444444444,
+    'SCREEN DOOR': 272.0,
+    'SECOND FLOOR LANDING': 154.375,
+    'SEQUOIA NATIONAL PARK': 808.888888888889,
+    'SERENGETI NATIONAL PARK': 341.25,
+    'SHARPENING ALL THE KNIVES': 453.3333333333333,
+    'SHED DOOR': 180.625,
+    'SHENANDOAH VALLEY': 202.2222222222222,
+    'SHEPHERDS PIE': 252.0,
+    'SHIP CAPTAIN': 378.0,
+    'SHOE HORN': 280.0,
+    'SHOOTING THE MESSENGER': 115.5,
+    'SHOVELING SNOW': 650.0,
+    'SHRIMP SCAMPI': 650.2222222222222,
+    'SIDE GATE': 210.0,
+    'SIDE OF THE ROAD': 119.0,
+    'SIGMUND FREUD': 361.6666666666667,
+    'SIGN LANGUAGE INTERPRETER': 400.0,
+    'SIGN PAINTER': 540.0,
+    'SILICON VALLEY': 220.0,
+    'SIMON BOLIVAR': 666.6666666666667,
+    'SITTING BULL': 250.0,
+    'SITTING IN TRAFFIC': 35.0,
+    'SKIPPING STONES': 950.0,
+    'SLEEP TECHNOLOGIST': 382.5,
+    'SLEEPING BAG': 156.40625,
+    'SLOW ROASTED PORK BELLY': 468.0,
+    'SMOKE ALARM BATTERY': 560.0,
+    'SMOKE DETECTOR': 250.0,
+    'SMOKE JUMPER': 1138.5,
+    'SMOKED GOUDA GRILLED CHEESE': 160.875,
+    'SMOKED PAPRIKA CHICKEN THIGHS': 264.0,
+    'SNOW BLOWER': 748.0,
+    'SNOW GLOBE': 704.0,
+    'SOCK HOP': 1026.0,
+    'SOFT PRETZEL': 2080.0,
+    'SOJOURNER TRUTH': 1134.0,
+    'SOLAR ECLIPSE': 240.24,
+    'SOLVING A CROSSWORD PUZZLE': 292.5,
+    'SORTING THE RECYCLING': 127.77777777777779,
+    'SOUTH POLE': 286.0,
+    'SPACE DEBRIS TRACKER': 665.0,
+    'SPAGHETTI AND MEATBALLS': 346.5,
+    'SPEAK OF THE DEVIL': 459.0,
+    'SPECIAL EFFECTS ARTIST': 462.0,
+    'SPEECH PATHOLOGIST': 348.3333333333333,
+    'SPELLING BEE': 759.0,
+    'SPICE CABINET': 148.75,
+    'SPICE RACK': 192.5,
+    'SPILL THE BEANS': 532.0,
+    'SPLIT PEA SOUP': 82.65306122448979,
+    'SPORTS ANNOUNCER': 241.5,
+    'SPORTS PHOTOGRAPHER': 48.0,
+    'SPRING CLEANING': 471.03999999999996,
+    'SQUEAKY FLOORBOARD IN THE HALLWAY': 349.5555555555555,
+    'SQUEEZING BLOOD FROM A TURNIP': 409.5,
+    'STAPLE GUN': 525.0,
+    'STARGAZING IN THE BACKYARD': 675.0,
+    'STATE FAIR OPENING DAY': 150.0,
+    'STATUE OF LIBERTY': 222.44444444444443,
+    'STEAL SOMEONES THUNDER': 207.77777777777774,
+    'STEAM CLEANING THE CARPETS': 326.25,
+    'STEP STOOL': 272.22222222222223,
+    'STONEHENGE': 569.25,
+    'STORM CELLAR DOOR': 85.75,
+    'STORM CHASER': 229.5918367346939,
+    'STORM DOOR': 168.0,
+    'STRAIT OF GIBRALTAR': 540.0,
+    'STRAWBERRY SHORTCAKE': 581.25,
+    'STREET PERFORMER': 664.4444444444445,
+    'STRIKE WHILE THE IRON IS HOT': 630.0,
+    'STUDYING FOR THE BAR EXAM': 333.3333333333333,
+    'STUNT DOUBLE': 650.0,
+    'SUBMARINE COMMANDER': 195.0,
+    'SUEZ CANAL': 2080.0,
+    'SUMMER SOLSTICE CELEBRATION': 83.2,
+    'SUNROOM': 378.00000000000006,
+    'SUPER BOWL SUNDAY': 337.77777777777777,
+    'SUPPLY CLOSET': 552.5,
+    'SURPRISE BIRTHDAY PARTY': 234.0,
+    'SUSAN B ANTHONY': 531.5555555555555,
+    'SWEET POTATO PIE': 390.0,
+    'SWIMMING POOL': 227.5,
+    'SWISS ALPS': 929.5,
+    'SYDNEY OPERA HOUSE': 396.0,
+    'SYNCHRONIZED DIVING CHAMPIONSHIP': 65.33333333333333,
+    'SYNCHRONIZED SWIMMING GALA': 98.0,
+    'SZECHUAN PEPPERCORN BEEF': 985.111111111111,
+    'TAJ MAHAL': 1701.0,
+    'TAKE THE BULL BY THE HORNS': 440.0,
+    'TAKING A BUBBLE BATH': 80.4375,
+    'TAKING A NAP': 914.6666666666666,
+    'TAKING A SELFIE': 420.0,
+    'TAKING OUT THE TRASH': 67.5,
+    'TALENT SHOW': 120.0,
+    'TATTOO ARTIST': 149.33333333333334,
+    'TEA CUP': 220.5,
+    'TEACHING THE DOG A NEW TRICK': 432.0,
+    'TELESCOPE': 804.375,
+    'THANKSGIVING DINNER': 574.75,
+    'THE BACK BEDROOM': 173.25,
+    'THE BACK DOOR': 216.0,
+    'THE BACK PORCH': 176.9591836734694,
+    'THE BACK STAIRCASE': 180.0,
+    'THE BALL IS IN YOUR COURT': 286.0,
+    'THE BEST OF BOTH WORLDS': 304.0,
+    'THE BOILER ROOM': 702.0,
+    'THE CORKBOARD': 787.111111111111,
+    'THE EARLY BIRD CATCHES THE WORM': 277.875,
+    'THE FRONT STEP': 180.0,
+    'THE GARDEN SHED': 121.5,
+    'THE HALL CLOSET': 126.0,
+    'THE HOT TUB': 157.5,
+    'THE JUNK ROOM': 252.0,
+    'THE LAST STRAW': 126.0,
+    'THE PARTHENON': 637.0,
+    'THE PENALTY BOX': 546.0,
+    'THE POT CALLING THE KETTLE BLACK': 115.5,
+    'THE RECYCLING BIN': 460.0,
+    'THE SOCK DRAWER': 147.0,
+    'THE STORM CELLAR': 120.0,
+    'THE STRAW THAT BROKE THE CAMELS BACK': 250.0,
+    'THE TIP OF THE ICEBERG': 438.75,
+    'THE WAITING ROOM': 312.0,
+    'THE WHOLE NINE YARDS': 286.875,
+    'THE WRITING IS ON THE WALL': 84.0,
+    'THEATRICAL FIGHT CHOREOGRAPHER': 348.3333333333333,
+    'THEODORE ROOSEVELT': 200.0,
+    'THIRD FLOOR OF THE PARKING GARAGE': 112.0,
+    'THOMAS EDISON': 120.0,
+    'THOMAS JEFFERSON': 825.0,
+    'THROUGH THICK AND THIN': 535.5,
+    'THROW CAUTION TO THE WIND': 177.42857142857142,
+    'THROW PILLOW': 644.0,
+    'THROWING IN THE TOWEL': 321.75,
+    'THURGOOD MARSHALL': 293.3333333333333,
+    'TICKET BOOTH AT THE FAIR': 616.0,
+    'TIMES SQUARE': 290.8888888888889,
+    'TOLL BOOTH OPERATOR': 635.5555555555555,
+    'TOMATO BISQUE': 294.0,
+    'TOOL CHEST': 285.99999999999994,
+    'TOOL SHED': 180.0,
+    'TOP BUNK': 1215.0,
+    'TOP OF THE FERRIS WHEEL': 220.0,
+    'TOP OF THE FOOD CHAIN': 105.0,
+    'TOP OF THE FRIDGE': 156.0,
+    'TOP OF THE LIGHTHOUSE': 181.5,
+    'TOP OF THE STAIRS': 148.5,
+    'TOP OF THE WORLD': 210.0,
+    'TOWN SQUARE FOUNTAIN': 270.0,
+    'TOY BOX': 1212.4444444444443,
+    'TRAIN CONDUCTOR': 231.1111111111111,
+    'TRAINING FOR A TRIATHLON': 378.0,
+    'TRANSLATING AN ANCIENT MANUSCRIPT': 288.0,
+    'TREE FORT': 144.0,
+    'TREE SURGEON': 441.0,
+    'TROPHY CASE': 504.0,
+    'TUNA NOODLE CASSEROLE': 168.0,
+    'TURN OVER A NEW LEAF': 360.0,
+    'TWO PEAS IN A POD': 508.4444444444444,
+    'ULYSSES S GRANT': 432.0,
+    'UNDER STAIR STORAGE': 90.0,
+    'UNDER THE BED': 195.0,
+    'UNDER THE BRIDGE': 142.5,
+    'UNDER THE DECK': 206.63265306122452,
+    'UNDER THE PORCH': 142.12,
+    'UNDER THE SINK': 192.0,
+    'UNDER THE WEATHER': 140.8,
+    'UNDERWATER WELDER': 306.0,
+    'UNTANGLING CHRISTMAS LIGHTS': 262.5,
+    'UTILITY ROOM': 624.75,
+    'VICTORIA FALLS': 112.5,
+    'VINCENT VAN GOGH': 643.5,
+    'VIRGINIA WOOLF': 680.0,
+    'VOICE ACTOR': 960.0,
+    'VOLCANOLOGIST': 693.3333333333334,
+    'VOLTAIRE': 972.0,
+    'WAGON WHEEL': 450.0,
+    'WALK IN CLOSET': 648.0,
+    'WALKING ON EGGSHELLS': 148.5,
+    'WALKING THE DOG': 126.0,
+    'WALL STREET': 181.44,
+    'WALNUT BROWNIE': 482.625,
+    'WAR ROOM': 1026.0,
+    'WASHINGTON MONUMENT': 63.0,
+    'WATCHING PAINT DRY': 330.0,
+    'WATCHING THE STOCK TICKER': 455.0,
+    'WATCHING THE SUNSET': 157.5,
+    'WATER STAIN ON THE BEDROOM CEILING': 47.5,
+    'WATERING THE PLANTS': 330.0,
+    'WEATHER VANE': 1020.0,
+    'WEATHERPROOFING THE WINDOWS': 264.0,
+    'WELCOME MAT': 147.0,
+    'WELCOME SIGN': 122.5,
+    'WHEN PIGS FLY': 396.0,
+    'WHITE CLIFFS OF DOVER': 396.0,
+    'WILDLIFE PHOTOGRAPHER': 268.8125,
+    'WILLIAM SHAKESPEARE': 693.0,
+    'WILLIAM WILBERFORCE': 495.0,
+    'WIND CHIME': 375.375,
+    'WINDOW LEDGE': 455.0,
+    'WINDOW SEAT': 193.6,
+    'WINDOW SHOPPING DOWNTOWN': 450.0,
+    'WINE SOMMELIER': 288.0,
+    'WINSTON CHURCHILL': 236.25,
+    'WOLF IN SHEEPS CLOTHING': 308.00000000000006,
+    'WOOD BURNING STOVE': 250.25,
+    'WORLD CUP FINAL': 279.86111111111114,
+    'WORLD SERIES GAME SEVEN': 397.2222222222222,
+    'WRITING IN A JOURNAL': 721.7777777777777,
+    'YELLOWSTONE NATIONAL PARK': 349.43999999999994,
+    'YOU CANT JUDGE A BOOK BY ITS COVER': 99.16666666666667,
+    'ZION NATIONAL PARK': 1482.0,
+}
\ No newline at end of file
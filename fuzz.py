@@ -0,0 +1,299 @@
+import argparse
+import random
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from constants import SCREEN_SIZE
+from game_manager import GameManager, PRESTIGE_UNLOCK_STREAK
+from shop import Shop
+from shop_items import UPGRADES, CONSUMABLES, PRESTIGE_ITEMS
+import snapshot
+
+
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Every action the fuzzer can take, as (op, arg) tuples, with relative weights.
+# Any action is legal in any state (it is ignored when it doesn't apply), so
+# any subsequence of a sequence is still a valid sequence — that is what lets
+# failures be shrunk by deleting actions. 'hit' guesses the next hidden phrase
+# letter; without it random guessing loses nearly every round and streaks,
+# upgrades and prestige are never reached.
+ACTIONS = (
+    [(('guess', c), 1) for c in ALPHABET]
+    + [(('hit', None), 60)]
+    + [(('consumable', item['id']), 3) for item in CONSUMABLES]
+    + [(('upgrade', item['id']), 2) for item in UPGRADES]
+    + [(('prestige_item', item['id']), 2) for item in PRESTIGE_ITEMS]
+    + [(('resolve', None), 40), (('prestige', None), 5), (('boost', None), 5)]
+)
+
+# The snapshot round trip builds a whole new manager, so it runs after every
+# Nth action (and the last) rather than after each one — every action made
+# the fuzzer about ten times slower
+SNAPSHOT_EVERY = 50
+
+
+class InvariantError(Exception):
+    """Raised by FuzzHarness.check when game state breaks an invariant. args[0] is the invariant name."""
+
+
+class FuzzHarness:
+    """
+    Headless game driven the way main.py drives it. While a round-end popup
+    would be showing (self.pending is set) only 'resolve' does anything, and
+    it calls win() or lose() just like dismissing the popup. Guesses of
+    already guessed letters are ignored, as main.guess_letter ignores them.
+
+    'boost' is the debug button: +$10,000 and +9 streak.
+    """
+
+    def __init__(self, seed):
+        self.shop    = Shop(None, *SCREEN_SIZE)
+        self.manager = GameManager(None, self.shop, seed=seed)
+        self.shop.manager = self.manager
+
+        self.pending     = None    # 'won', 'lost' or 'complete' while a popup would be open
+        self.run_puzzles = set()   # Every puzzle started since the last loss or prestige
+        self._phrase     = None
+        self._track_round()
+
+    def apply(self, action):
+        op, arg = action
+        manager = self.manager
+
+        if op == 'resolve':
+            if self.pending == 'won':
+                self.pending = None if manager.win() else 'complete'
+            elif self.pending in ('lost', 'complete'):
+                self.pending = None
+                manager.lose()
+                self.run_puzzles.clear()
+        elif self.pending:
+            return
+        elif op in ('guess', 'hit'):
+            if op == 'hit':
+                arg = min(set(manager.phrase.word.replace(' ', '')) - manager.alphabet.guessed, default=None)
+            if arg is None or arg in manager.alphabet.guessed:
+                return
+            result = manager.guess(arg)
+            if result == 'solved':
+                self.pending = 'won'
+            elif result == 'game_over':
+                self.pending = 'lost'
+        elif op == 'consumable':
+            self.shop._try_purchase_consumable(arg)
+            if manager.solved_by_consumable:
+                manager.solved_by_consumable = False
+                self.pending = 'won'
+        elif op == 'upgrade':
+            self.shop._try_purchase_item(arg, UPGRADES)
+        elif op == 'prestige_item':
+            self.shop._try_purchase_item(arg, PRESTIGE_ITEMS)
+        elif op == 'prestige':
+            if manager.can_prestige:
+                manager.prestige()
+                self.run_puzzles.clear()
+        elif op == 'boost':
+            manager.money += 10_000
+            manager.streak_count += 9
+            manager.mark_changed()
+
+        self._track_round()
+
+    def _track_round(self):
+        """Note a newly started round and fail if its puzzle already came up this run."""
+        if self.manager.phrase is self._phrase:
+            return
+        self._phrase = self.manager.phrase
+        word = self._phrase.word
+        if word in self.run_puzzles:
+            raise InvariantError('repeated_puzzle', word)
+        self.run_puzzles.add(word)
+
+    def check(self, snapshots=True):
+        """Raise InvariantError naming the first broken invariant."""
+        m = self.manager
+        if m.money < 0:
+            raise InvariantError('money_non_negative', m.money)
+        if m.stars < 0:
+            raise InvariantError('stars_non_negative', m.stars)
+        if m.streak_count < 0:
+            raise InvariantError('streak_non_negative', m.streak_count)
+        if not 0 <= m.strikes.count <= m.strikes.max_strikes:
+            raise InvariantError('strikes_within_max', m.strikes.count, m.strikes.max_strikes)
+        if m.strikes.max_strikes > m.max_strikes():
+            raise InvariantError('max_strikes_matches_upgrades', m.strikes.max_strikes, m.max_strikes())
+        if not 0 <= m.bonus_strikes <= 3:
+            raise InvariantError('bonus_strikes_capped', m.bonus_strikes)
+        if not 0 <= m.star_streak_discounts <= 5:
+            raise InvariantError('star_streak_discounts_capped', m.star_streak_discounts)
+        if m.solved_by_consumable:
+            raise InvariantError('solved_by_consumable_handled')
+        if self.pending is None and m.phrase.is_solved():
+            raise InvariantError('solved_round_in_progress', m.phrase.word)
+        if self.pending == 'won' and not m.phrase.is_solved():
+            raise InvariantError('won_round_unsolved', m.phrase.word)
+        if m.phrase.word in m.seen_puzzles:
+            raise InvariantError('current_puzzle_seen', m.phrase.word)
+        if not m.seen_puzzles <= self.run_puzzles:
+            raise InvariantError('seen_puzzles_from_this_run')
+        if any(count < 0 for count in m.consumable_purchases.values()):
+            raise InvariantError('consumable_counts_non_negative', m.consumable_purchases)
+
+        # Memoized derived values must match a fresh computation, i.e. every
+        # mutation bumped manager.version
+        fresh = {
+            'star_buffer':  m._count_stars_for_streak(m.streak_count),
+            'max_strikes':  3 + sum(1 for k in m.purchased_upgrades
+                                    if k == 'extra_strike' or k.startswith('extra_strike_')),
+        }
+        fresh['can_prestige'] = m.streak_count >= PRESTIGE_UNLOCK_STREAK and fresh['star_buffer'] > 0
+        cached = {'star_buffer': m.star_buffer, 'max_strikes': m.max_strikes(), 'can_prestige': m.can_prestige}
+        for item in CONSUMABLES:
+            fresh[item['id']]  = self.shop._consumable_disabled(item['id'])
+            cached[item['id']] = self.shop._is_consumable_disabled(item['id'])
+        if cached != fresh:
+            raise InvariantError('derived_state_fresh', {k: (cached[k], fresh[k]) for k in fresh if cached[k] != fresh[k]})
+
+        # A snapshot restores to a manager that snapshots identically
+        if not snapshots:
+            return
+        blob     = snapshot.dump(m)
+        restored = snapshot.restore(blob, None, Shop(None, *SCREEN_SIZE), m.corpus)
+        if snapshot.dump(restored) != blob or vars(restored).keys() != vars(m).keys():
+            raise InvariantError('snapshot_round_trip', len(blob))
+
+
+def random_sequence(seed, length):
+    """Return a reproducible list of length random actions for seed."""
+    actions, weights = zip(*ACTIONS)
+    return random.Random(seed).choices(actions, weights, k=length)
+
+
+def run_sequence(game_seed, actions, snapshot_every=SNAPSHOT_EVERY):
+    """
+    Play actions against a fresh game seeded with game_seed, checking the
+    invariants after each one, and the snapshot round trip after every
+    snapshot_every-th and the last. Returns None if everything held,
+    otherwise (action index, failure name, detail). An exception counts as a
+    failure named after its type.
+    """
+    index = -1
+    try:
+        harness = FuzzHarness(game_seed)
+        harness.check()
+        for index, action in enumerate(actions):
+            harness.apply(action)
+            harness.check(snapshots=(index + 1) % snapshot_every == 0 or index == len(actions) - 1)
+    except InvariantError as e:
+        return index, e.args[0], e.args[1:]
+    except Exception as e:
+        return index, type(e).__name__, traceback.format_exc(limit=-3)
+    return None
+
+
+def shrink(game_seed, actions, name, snapshot_every=SNAPSHOT_EVERY):
+    """
+    Delta-debug actions down to a minimal sequence that still fails with the
+    same invariant name. Removing any single remaining action makes it pass
+    (or fail differently).
+    """
+    def fails(candidate):
+        failure = run_sequence(game_seed, candidate, snapshot_every)
+        return failure is not None and failure[1] == name
+
+    # Anything after the failing action is irrelevant
+    actions = actions[:run_sequence(game_seed, actions, snapshot_every)[0] + 1]
+    chunks  = 2
+    while len(actions) >= 2:
+        size    = len(actions) // chunks
+        reduced = False
+        for start in range(0, len(actions), size):
+            candidate = actions[:start] + actions[start + size:]
+            if fails(candidate):
+                actions = candidate
+                chunks  = max(chunks - 1, 2)
+                reduced = True
+                break
+        if not reduced:
+            if size == 1:
+                break
+            chunks = min(chunks * 2, len(actions))
+    return actions
+
+
+def fuzz_batch(seeds, length, snapshot_every=SNAPSHOT_EVERY):
+    """
+    Run one random sequence per seed, using the seed for both the game and the
+    actions. Returns (sequences run, actions applied, failures) where each
+    failure is a shrunk repro dict.
+    """
+    failures = []
+    applied  = 0
+    for seed in seeds:
+        actions = random_sequence(seed, length)
+        failure = run_sequence(seed, actions, snapshot_every)
+        if failure is None:
+            applied += length
+            continue
+        index, name, detail = failure
+        applied += index + 1
+        failures.append({
+            'seed':    seed,
+            'name':    name,
+            'detail':  detail,
+            'actions': shrink(seed, actions, name, snapshot_every),
+            'snapshot_every': snapshot_every,
+        })
+    return len(seeds), applied, failures
+
+
+def _fuzz_batch_args(args):
+    return fuzz_batch(*args)
+
+
+def fuzz(sequences, length, start=0, workers=None, batch=200, snapshot_every=SNAPSHOT_EVERY):
+    """Fuzz seeds start..start+sequences-1 across a process pool. Returns (actions applied, failures)."""
+    seeds = range(start, start + sequences)
+    jobs  = [(seeds[i:i + batch], length, snapshot_every) for i in range(0, sequences, batch)]
+    total_applied = 0
+    all_failures  = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for _, applied, failures in pool.map(_fuzz_batch_args, jobs):
+            total_applied += applied
+            all_failures.extend(failures)
+    return total_applied, all_failures
+
+
+def format_failures(failures):
+    """One repro per distinct invariant — the shortest one found."""
+    shortest = {}
+    for f in failures:
+        if f['name'] not in shortest or len(f['actions']) < len(shortest[f['name']]['actions']):
+            shortest[f['name']] = f
+    lines = []
+    for name, f in sorted(shortest.items()):
+        count = sum(1 for other in failures if other['name'] == name)
+        lines.append(f'{name}  ({count} sequences)  detail: {f["detail"]}')
+        every = f', snapshot_every={f["snapshot_every"]}' if f['snapshot_every'] != SNAPSHOT_EVERY else ''
+        lines.append(f'  repro: run_sequence({f["seed"]}, {f["actions"]!r}{every})')
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Throw random action sequences at the headless game and check invariants')
+    parser.add_argument('--sequences', type=int, default=10_000, help='Number of random sequences')
+    parser.add_argument('--length', type=int, default=500, help='Actions per sequence')
+    parser.add_argument('--start', type=int, default=0, help='First seed')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--snapshot-every', type=int, default=SNAPSHOT_EVERY, metavar='N',
+                        help='Check the snapshot round trip after every Nth action (1 = after each)')
+    args = parser.parse_args()
+    if args.snapshot_every < 1:
+        parser.error('--snapshot-every must be at least 1')
+
+    applied, failures = fuzz(args.sequences, args.length, args.start, args.workers,
+                             snapshot_every=args.snapshot_every)
+    print(f'{args.sequences} sequences, {applied} actions, {len(failures)} failing sequences')
+    if failures:
+        print(format_failures(failures))
\ No newline at end of file
@@ -1,7 +1,11 @@
 import random
+from array import array
+from bisect import bisect_right
 
 from constants import CONSONANTS, SCREEN_SIZE, VOWELS
-from puzzles import PUZZLES
+from corpus import default_corpus
+from difficulty import calculate_difficulty
+from pcg import PCG32
 from phrase import Phrase
 from alphabet import Alphabet
 from strikes import Strikes
@@ -12,22 +16,13 @@ from shop_items import UPGRADES
 # Streak round required before the player can prestige — adjust for balancing
 PRESTIGE_UNLOCK_STREAK = 50
 
-# Scrabble values used to weight letter rarity in difficulty calculation
-SCRABBLE = {
-    'A': 1, 'E': 1, 'I': 1, 'O': 1, 'U': 1,
-    'N': 1, 'R': 1, 'S': 1, 'T': 1, 'L': 1, 'H': 1,
-    'D': 2, 'G': 2,
-    'B': 3, 'C': 3, 'M': 3, 'P': 3,
-    'F': 4, 'V': 4, 'W': 4, 'Y': 4,
-    'K': 5,
-    'J': 8, 'X': 8,
-    'Q': 10, 'Z': 10
-}
+# Largest seed a run can have — replays and snapshots store it as a uint64
+MAX_SEED = 2 ** 64 - 1
 
-# Letters that are effectively free for certain categories
-FREE_LETTERS_BY_CATEGORY = {
-    'What Are You Doing?': {'I', 'N', 'G'}
-}
+# Star milestone lists, built once per star_streak_discounts value. star_buffer
+# is read several times a frame, so rebuilding the list each time was the
+# largest source of per-frame garbage.
+_milestones_by_discount = {}
 
 
 class GameManager:
@@ -38,12 +33,39 @@ class GameManager:
 
     Other classes (Shop, Streak, etc.) call into the manager to read or
     mutate state rather than holding it themselves.
+
+    Every random draw (puzzle picks, auto-guesses, consumable reveals) goes
+    through self.rng, a private PCG32 seeded from seed. Two managers built
+    with the same seed and fed the same actions play out identically,
+    without touching the global random module. The generator's state is a
+    single integer, so snapshot.py can save a game in a few hundred bytes.
+
+    self.version increases on every state change. Derived values that
+    widgets poll each frame (star_buffer, can_prestige, max_strikes, ...)
+    are memoized until the version moves, and widgets can compare versions
+    to skip rebuilding what they draw. Code that mutates manager state
+    directly, rather than through a manager method, must call mark_changed().
     """
 
-    def __init__(self, font, shop):
+    def __init__(self, font, shop, seed=None, corpus=None, difficulties=None):
+        self._init_state(font, shop, seed, corpus, difficulties)
+        self._build_pool()
+        self._start_round()
+
+    def _init_state(self, font, shop, seed, corpus, difficulties=None):
+        """Set every attribute to its new-game value, short of building a pool and round (snapshot.restore fills those in)."""
         self.font = font
         self.shop = shop
 
+        # Change tracking — see mark_changed()
+        self.version          = 0
+        self._derived         = {}   # {name: value} valid for _derived_version
+        self._derived_version = -1
+
+        # Seed is recorded so a run can be replayed; None picks a fresh one
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng  = PCG32(self.seed)
+
         # Run state — persists until a loss
         self.streak_count = 0
         self.previous_streak = 0   # Streak before last loss, used in lose popup
@@ -64,20 +86,45 @@ class GameManager:
         self.star_streak_discounts = 0       # Times 'star_streak_discount' has been purchased (max 5)
 
         # Round state — rebuilt each round
+        self.puzzle_index = None  # Index into self.corpus of the current puzzle
         self.phrase = None
         self.alphabet = None
         self.strikes = None
         self.topic = None
         self.free_guess_active = False  # Consumed on any guess, right or wrong
         self.bonus_strikes = 0          # Extra lives consumed only on wrong guesses
+        self.solved_by_consumable = False
+
+        # Round event callbacks, for run history — set by main.py
+        self.on_round_start = None   # ()
+        self.on_guess       = None   # (letter, result) after every guess
+        self.on_round_end   = None   # (outcome, money earned) when a round is won or lost
 
         # Pool state
+        self.corpus = corpus if corpus is not None else default_corpus()
+        # Difficulty each puzzle is pooled by: the corpus's own, or values tuned from play (see live_difficulty.py)
+        self.difficulties = difficulties if difficulties is not None else self.corpus.difficulties
         self.seen_puzzles = set()
-        self.remaining_puzzles = []
+        self.remaining_puzzles = array('I')  # Indices into self.corpus, ascending
         self.current_tier = self._get_difficulty_tier()
 
-        self._build_pool()
-        self._start_round()
+    # --- Change Tracking ---
+
+    def mark_changed(self):
+        """Record that state changed, invalidating memoized derived values."""
+        self.version += 1
+
+    def derived(self, name, compute):
+        """
+        Return compute(), cached under name until the next mark_changed().
+        Widgets use this for their own per-frame derived values too.
+        """
+        if self._derived_version != self.version:
+            self._derived.clear()
+            self._derived_version = self.version
+        if name not in self._derived:
+            self._derived[name] = compute()
+        return self._derived[name]
 
     # --- Money ---
 
@@ -89,12 +136,14 @@ class GameManager:
             * (1 + 0.05 * strikes_left)
         )
         self.money += amount
+        self.mark_changed()
 
     def spend(self, amount):
         """Deduct money. Returns True if successful, False if insufficient funds."""
         if self.money < amount:
             return False
         self.money -= amount
+        self.mark_changed()
         return True
 
     def spend_stars(self, amount):
@@ -102,6 +151,7 @@ class GameManager:
         if self.stars < amount:
             return False
         self.stars -= amount
+        self.mark_changed()
         return True
 
     def purchase_prestige_item(self, item_id):
@@ -117,26 +167,30 @@ class GameManager:
             self.unlocked_color_topics.add(item_id)
         elif item_id == 'star_streak_discount':
             self.star_streak_discounts = min(self.star_streak_discounts + 1, 5)
+        self.mark_changed()
 
     @property
     def star_buffer(self):
         """Stars pending for this run — simply the count of milestones passed at the current streak."""
-        return self._count_stars_for_streak(self.streak_count)
+        return self.derived('star_buffer', lambda: self._count_stars_for_streak(self.streak_count))
 
     @property
     def stars_display_unlocked(self):
         """True if the star display should be shown."""
-        return self._stars_display_unlocked or self.stars > 0 or self.star_buffer > 0
+        return self.derived('stars_display_unlocked',
+                          lambda: self._stars_display_unlocked or self.stars > 0 or self.star_buffer > 0)
 
     @stars_display_unlocked.setter
     def stars_display_unlocked(self, value):
         self._stars_display_unlocked = value
+        self.mark_changed()
 
     @property
     def can_prestige(self):
         """True when the player is eligible to prestige — streak is at the unlock threshold
         and there is at least one star waiting in the buffer."""
-        return self.streak_count >= PRESTIGE_UNLOCK_STREAK and self.star_buffer > 0
+        return self.derived('can_prestige',
+                          lambda: self.streak_count >= PRESTIGE_UNLOCK_STREAK and self.star_buffer > 0)
 
     def prestige(self):
         """
@@ -152,6 +206,7 @@ class GameManager:
         self.purchased_upgrades = set()
         self.consumable_purchases = {}
         self.seen_puzzles.clear()
+        self.mark_changed()  # Before _start_round reads max_strikes()
         self.shop.reset()
         self.current_tier = self._get_difficulty_tier()
         self._build_pool()
@@ -172,17 +227,24 @@ class GameManager:
 
         difficulty = self._calculate_difficulty(self.phrase.word, self.topic.topic)
         strikes_left = self.strikes.max_strikes - self.strikes.count  # bonus strikes excluded intentionally
+        money_before = self.money
         self.earn(difficulty, strikes_left)
+        if self.on_round_end:
+            self.on_round_end('won', self.money - money_before)
         return self._advance_round()
 
     def lose(self):
         """Handle a round loss — reset all run state and start fresh. Meta state is preserved."""
+        # Also called to start over after beating the game, when the last round was won, not lost
+        if self.on_round_end and not self.phrase.is_solved():
+            self.on_round_end('lost', 0)
         self.previous_streak = self.streak_count
         self.streak_count = 0
         self.money = 0
         self.purchased_upgrades = set()
         self.consumable_purchases = {}
         self.seen_puzzles.clear()
+        self.mark_changed()  # Before _start_round reads max_strikes()
         self.shop.reset()
         self.current_tier = self._get_difficulty_tier()
         self._build_pool()
@@ -190,8 +252,8 @@ class GameManager:
 
     def max_strikes(self):
         """Return total strikes allowed based on purchased extra_strike upgrades."""
-        count = sum(1 for k in self.purchased_upgrades if k == 'extra_strike' or k.startswith('extra_strike_'))
-        return 3 + count
+        return self.derived('max_strikes', lambda: 3 + sum(
+            1 for k in self.purchased_upgrades if k == 'extra_strike' or k.startswith('extra_strike_')))
 
     def get_auto_guesses(self):
         """
@@ -209,11 +271,11 @@ class GameManager:
         for slot in range(free_consonants):
             guaranteed = slot < guar_consonants
             available  = phrase_letters & CONSONANTS if guaranteed else CONSONANTS
-            pool       = list(available - set(guesses))
+            pool       = sorted(available - set(guesses))
             if not pool:
-                pool = list(CONSONANTS - set(guesses))
+                pool = sorted(CONSONANTS - set(guesses))
             if pool:
-                guesses.append(random.choice(pool))
+                guesses.append(self.rng.choice(pool))
 
         free_vowels = sum(1 for k in self.purchased_upgrades
                           if k == 'free_vowel' or k.startswith('free_vowel_'))
@@ -222,11 +284,11 @@ class GameManager:
         for slot in range(free_vowels):
             guaranteed = slot < guar_vowels
             available  = phrase_letters & VOWELS if guaranteed else VOWELS
-            pool       = list(available - set(guesses))
+            pool       = sorted(available - set(guesses))
             if not pool:
-                pool = list(VOWELS - set(guesses))
+                pool = sorted(VOWELS - set(guesses))
             if pool:
-                guesses.append(random.choice(pool))
+                guesses.append(self.rng.choice(pool))
 
         return guesses
 
@@ -241,7 +303,12 @@ class GameManager:
           e.g. with 5 discounts: increment is 5  → 50, 65, 85 ...
 
         We generate enough milestones to cover any realistic run (up to 200 stars).
+        The list is shared between calls and must not be modified.
         """
+        cached = _milestones_by_discount.get(self.star_streak_discounts)
+        if cached is not None:
+            return cached
+
         milestones = []
         for n in range(1, 6):          # Stars 1–5 at 10, 20, 30, 40, 50
             milestones.append(n * 10)
@@ -253,11 +320,12 @@ class GameManager:
             current += gap
             milestones.append(current)
             gap += increment
+        _milestones_by_discount[self.star_streak_discounts] = milestones
         return milestones
 
     def _count_stars_for_streak(self, streak):
         """Return how many star milestones fall at or below the given streak."""
-        return sum(1 for m in self._star_milestones() if m <= streak)
+        return bisect_right(self._star_milestones(), streak)
 
     # --- Round Lifecycle ---
 
@@ -273,17 +341,9 @@ class GameManager:
         return True
 
     def _start_round(self):
-        """Set up all round state from the next puzzle in the pool."""
-        text, topic_text = self.remaining_puzzles.pop()
-
-        self.phrase = Phrase(text, self.font, *SCREEN_SIZE)
-        self.alphabet = Alphabet(self.font, *SCREEN_SIZE)
-        self.strikes = Strikes(self.font, SCREEN_SIZE[0], self.max_strikes())
-        self.topic = Topic(topic_text, self.font, *SCREEN_SIZE)
-
-        if self.phrase.letters:
-            bottom = max(letter.rect.bottom for letter in self.phrase.letters)
-            self.topic.update_position(bottom)
+        """Set up all round state from a puzzle drawn at random from the pool."""
+        index = self.remaining_puzzles.pop(self.rng.randrange(len(self.remaining_puzzles)))
+        self._build_round(index, self.max_strikes())
 
         # Apply auto-guess upgrades at round start
         for letter in self.get_auto_guesses():
@@ -294,6 +354,24 @@ class GameManager:
         self.solved_by_consumable = False  # Set True if a consumable reveal solves the puzzle
         # bonus_strikes intentionally not reset here — carries over between rounds
 
+        self.mark_changed()
+        if self.on_round_start:
+            self.on_round_start()
+
+    def _build_round(self, index, max_strikes):
+        """Create the round's widgets for puzzle index, with nothing guessed yet."""
+        text, topic_text = self.corpus[index]
+        self.puzzle_index = index
+
+        self.phrase = Phrase(text, self.font, *SCREEN_SIZE)
+        self.alphabet = Alphabet(self.font, *SCREEN_SIZE)
+        self.strikes = Strikes(self.font, SCREEN_SIZE[0], max_strikes)
+        self.topic = Topic(topic_text, self.font, *SCREEN_SIZE)
+
+        if self.phrase.letters:
+            bottom = max(letter.rect.bottom for letter in self.phrase.letters)
+            self.topic.update_position(bottom)
+
         # Register consumable callbacks now that phrase and alphabet exist
         self.shop.on_reveal_consonant = self._reveal_consonant
         self.shop.on_reveal_vowel = self._reveal_vowel
@@ -307,31 +385,33 @@ class GameManager:
     def _reveal_consonant(self):
         """Reveal a random hidden consonant from the current phrase."""
         hidden = [
-            c for c in set(self.phrase.word.replace(' ', ''))
+            c for c in sorted(set(self.phrase.word.replace(' ', '')))
             if c in {'B','C','D','F','G','H','J','K','L','M',
                      'N','P','Q','R','S','T','V','W','X','Y','Z'}
             and c not in self.alphabet.guessed
         ]
         if hidden:
-            letter = random.choice(hidden)
+            letter = self.rng.choice(hidden)
             self.phrase.guess(letter)
             self.alphabet.guess(letter)
             if self.phrase.is_solved():
                 self.solved_by_consumable = True
+            self.mark_changed()
 
     def _reveal_vowel(self):
         """Reveal a random hidden vowel from the current phrase."""
         hidden = [
-            c for c in set(self.phrase.word.replace(' ', ''))
+            c for c in sorted(set(self.phrase.word.replace(' ', '')))
             if c in {'A', 'E', 'I', 'O', 'U'}
             and c not in self.alphabet.guessed
         ]
         if hidden:
-            letter = random.choice(hidden)
+            letter = self.rng.choice(hidden)
             self.phrase.guess(letter)
             self.alphabet.guess(letter)
             if self.phrase.is_solved():
                 self.solved_by_consumable = True
+            self.mark_changed()
 
     def _eliminate_letters(self):
         """Mark 3 letters not in the phrase as guessed to remove them from the alphabet."""
@@ -339,13 +419,15 @@ class GameManager:
             c for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
             if c not in self.phrase.word and c not in self.alphabet.guessed
         ]
-        choices = random.sample(not_in_phrase, min(3, len(not_in_phrase)))
+        choices = self.rng.sample(not_in_phrase, min(3, len(not_in_phrase)))
         for c in choices:
             self.alphabet.guess(c)
+        self.mark_changed()
 
     def _grant_free_guess(self):
         """Grant a free guess — will be consumed on the next guess regardless of outcome."""
         self.free_guess_active = True
+        self.mark_changed()
 
     def _grant_bonus_strike(self):
         """
@@ -357,6 +439,7 @@ class GameManager:
             self.strikes.count -= 1
         else:
             self.bonus_strikes += 1
+        self.mark_changed()
 
     # --- Guess Handling ---
 
@@ -368,8 +451,15 @@ class GameManager:
         Returns 'solved', 'correct', 'blocked' (free guess used),
         'bonus_strike' (bonus absorbed the wrong guess), 'strike', or 'game_over'.
         """
+        result = self._apply_guess(letter)
+        if self.on_guess:
+            self.on_guess(letter, result)
+        return result
+
+    def _apply_guess(self, letter):
         free_guess_used = self.free_guess_active
         self.free_guess_active = False
+        self.mark_changed()  # Every path below mutates state and none reads derived values
 
         matched = self.phrase.guess(letter)
         self.alphabet.guess(letter)
@@ -394,19 +484,21 @@ class GameManager:
     # --- Pool Management ---
 
     def _build_pool(self):
-        """Build a shuffled pool of eligible unseen puzzles for the current difficulty range."""
+        """
+        Build the pool of eligible unseen puzzles for the current difficulty
+        range. It stays in index order; _start_round draws from it at random,
+        so the pool's state is just which puzzles are left.
+        """
         min_diff, max_diff = self._get_difficulty_range()
-        pool = [
-            (text, topic) for text, topic in PUZZLES
-            if text not in self.seen_puzzles
-            and min_diff <= self._calculate_difficulty(text, topic) <= max_diff
-        ]
+        difficulties = self.difficulties
+        unseen = [i for i, text in enumerate(self.corpus.texts) if text not in self.seen_puzzles]
+        pool = [i for i in unseen if min_diff <= difficulties[i] <= max_diff]
         if not pool:
-            pool = [(text, topic) for text, topic in PUZZLES if text not in self.seen_puzzles]
+            pool = unseen
         if not pool:
-            pool = list(PUZZLES)
-        random.shuffle(pool)
-        self.remaining_puzzles = pool
+            pool = range(len(self.corpus))
+        # An index array rather than a list of tuples — servers hold thousands of pools
+        self.remaining_puzzles = array('I', pool)
 
     def _maybe_rebuild_pool(self):
         """Rebuild the pool if the difficulty tier has advanced since last build."""
@@ -421,14 +513,12 @@ class GameManager:
         """
         Calculate a numeric difficulty score for a puzzle.
         Formula: (unique_letters * rarity * avg_word_length) / num_words
+        See difficulty.py, which also has a batch version for whole puzzle packs.
+        Payouts always use this formula; pool selection uses
+        self.difficulties — the calibrated puzzle_difficulty precomputed in
+        self.corpus.difficulties, unless main.py passed values tuned from play.
         """
-        unique_letters = set(phrase.replace(' ', ''))
-        free = FREE_LETTERS_BY_CATEGORY.get(category, set())
-        unique_letters -= free
-        rarity = sum(SCRABBLE[c] for c in unique_letters)
-        words = phrase.split()
-        avg_word_length = sum(len(w) for w in words) / len(words)
-        return (len(unique_letters) * rarity * avg_word_length) / len(words)
+        return calculate_difficulty(phrase, category)
 
     def _get_difficulty_range(self):
         """Return (min, max) difficulty for the current streak."""
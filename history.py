@@ -0,0 +1,148 @@
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+
+from paths import app_dir
+from shop_items import CONSUMABLES
+
+
+DEFAULT_PATH = os.path.join(app_dir(), 'history.db')
+
+# Most rounds the writer thread inserts in one transaction
+BATCH_SIZE = 500
+
+# One row per finished round. guesses is the player's letters in order
+# (auto-guesses and consumable reveals aren't guesses); consumables is the
+# ids bought this round, comma-separated, in order.
+COLUMNS = (
+    'recorded_at', 'seed', 'puzzle', 'category', 'difficulty', 'outcome', 'streak',
+    'guesses', 'strikes_used', 'consumables', 'money_earned', 'seconds',
+)
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS rounds (
+        id           INTEGER PRIMARY KEY,
+        recorded_at  REAL    NOT NULL,
+        seed         INTEGER NOT NULL,
+        puzzle       TEXT    NOT NULL,
+        category     TEXT    NOT NULL,
+        difficulty   REAL    NOT NULL,
+        outcome      TEXT    NOT NULL,
+        streak       INTEGER NOT NULL,
+        guesses      TEXT    NOT NULL,
+        strikes_used INTEGER NOT NULL,
+        consumables  TEXT    NOT NULL,
+        money_earned INTEGER NOT NULL,
+        seconds      REAL    NOT NULL
+    )
+'''
+INSERT = f'INSERT INTO rounds ({", ".join(COLUMNS)}) VALUES ({", ".join("?" * len(COLUMNS))})'
+
+_CONSUMABLE_IDS = {item['id'] for item in CONSUMABLES}
+
+
+class RunHistory:
+    """
+    Records every finished round of a GameManager into an SQLite table for
+    later analysis. Its round_started, guessed, purchased and round_ended
+    methods are hooked to the manager's on_round_start, on_guess and
+    on_round_end callbacks and the shop's on_purchase.
+
+    Recording a round only builds a tuple and puts it on a queue. A
+    background thread takes rows off the queue and inserts whatever has
+    built up in one transaction, so the game never waits on the disk. The
+    database runs in WAL mode, so it can be read while the game writes.
+
+    A round's time runs from its start to the last guess or purchase in it,
+    so time spent on the round-end popup isn't counted.
+
+    on_round, if set, is called with each round's row as a dict (keys from
+    COLUMNS) as it is recorded; stats.RoundStats.add keeps running totals
+    that way.
+    """
+
+    def __init__(self, manager, path=DEFAULT_PATH):
+        self.manager  = manager
+        self.recorded = 0
+        self.on_round = None
+        self._queue   = queue.SimpleQueue()
+        self._failed  = False
+        self._thread  = threading.Thread(target=self._write_rows, args=(path,), name='run-history', daemon=True)
+        self._thread.start()
+        self.round_started()
+
+    def close(self):
+        """Write everything still queued and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    # --- Round events ---
+
+    def round_started(self):
+        self._guesses     = []
+        self._consumables = []
+        self._streak      = self.manager.streak_count
+        self._started     = self._last_action = time.monotonic()
+
+    def guessed(self, letter, result):
+        self._guesses.append(letter)
+        self._last_action = time.monotonic()
+
+    def purchased(self, item_id, item_list):
+        if item_id in _CONSUMABLE_IDS:
+            self._consumables.append(item_id)
+        self._last_action = time.monotonic()
+
+    def round_ended(self, outcome, earned):
+        if self._failed:
+            return
+        m   = self.manager
+        row = (
+            time.time(), m.seed, m.phrase.word, m.topic.topic, m.corpus.difficulties[m.puzzle_index],
+            outcome, self._streak, ''.join(self._guesses), m.strikes.count, ','.join(self._consumables),
+            earned, self._last_action - self._started,
+        )
+        self._queue.put(row)
+        self.recorded += 1
+        if self.on_round:
+            self.on_round(dict(zip(COLUMNS, row)))
+
+    # --- Writer thread ---
+
+    def _write_rows(self, path):
+        try:
+            db = sqlite3.connect(path)
+            db.execute('PRAGMA journal_mode = WAL')
+            db.execute('PRAGMA synchronous = NORMAL')  # Safe with WAL; a crash can lose the last batch, not corrupt
+            db.execute(SCHEMA)
+        except sqlite3.Error as e:
+            self._failed = True
+            print(f'Run history disabled: {e}', file=sys.stderr)
+            return
+
+        while True:
+            rows = [self._queue.get()]
+            while len(rows) < BATCH_SIZE:
+                try:
+                    rows.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            done = None in rows
+            with db:
+                db.executemany(INSERT, [row for row in rows if row is not None])
+            if done:
+                break
+        db.close()
+
+
+def read_rounds(path=DEFAULT_PATH, after_id=0):
+    """Yield (id, row dict) for every recorded round with an id above after_id, oldest first."""
+    db = sqlite3.connect(path)
+    try:
+        cursor = db.execute(f'SELECT id, {", ".join(COLUMNS)} FROM rounds WHERE id > ? ORDER BY id', (after_id,))
+        for row in cursor:
+            yield row[0], dict(zip(COLUMNS, row[1:]))
+    finally:
+        db.close()
\ No newline at end of file
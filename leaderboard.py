@@ -0,0 +1,205 @@
+import argparse
+import heapq
+import os
+import sqlite3
+import time
+from array import array
+
+from paths import app_dir
+
+
+DEFAULT_PATH = os.path.join(app_dir(), 'leaderboard.db')
+
+# Runs kept in full for the top list; every other run is only counted
+TOP_K = 100
+
+# Pending runs are written in one transaction once there are this many, or
+# once the oldest has waited this long (and always on close)
+FLUSH_EVERY   = 64
+FLUSH_SECONDS = 30.0
+
+# What runs can be ranked by, each with its own count table
+METRICS = {'streak': 'streak_counts', 'prestige_count': 'prestige_counts', 'stars': 'star_counts'}
+
+
+class RunCounts:
+    """
+    How many runs ended at each value of one metric (a streak, prestige
+    count or star count), in a Fenwick tree so counting the runs above a
+    value takes O(log max value) however many runs there are. Memory
+    follows the highest value, not the number of runs.
+    """
+
+    def __init__(self, size=64):
+        self.counts = array('Q', bytes(8 * size))   # Plain histogram, for growing and saving
+        self._tree  = array('Q', bytes(8 * size))
+        self.total  = 0
+
+    def add(self, value, runs=1):
+        if value >= len(self.counts):
+            self._grow(value + 1)
+        self.counts[value] += runs
+        self.total += runs
+        i = value + 1
+        while i <= len(self._tree):
+            self._tree[i - 1] += runs
+            i += i & -i
+
+    def at_most(self, value):
+        """Runs that ended at value or less."""
+        i, count = min(value + 1, len(self._tree)), 0
+        while i > 0:
+            count += self._tree[i - 1]
+            i -= i & -i
+        return count
+
+    def above(self, value):
+        return self.total - self.at_most(value)
+
+    def _grow(self, needed):
+        size = len(self.counts)
+        while size < needed:
+            size *= 2
+        self.counts.extend(array('Q', bytes(8 * (size - len(self.counts)))))
+        # Rebuild in O(size): each node passes its sum on to its parent
+        tree = array('Q', self.counts)
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent - 1] += tree[i - 1]
+        self._tree = tree
+
+
+class Leaderboard:
+    """
+    Finished runs ranked by streak, prestige count and stars, saved in an
+    SQLite file.
+
+    Every run is counted in one RunCounts tree per metric (see METRICS),
+    so rank() answers "where would a streak of N place", or N prestiges or
+    stars, in O(log max value) even with millions of runs recorded; the lose
+    popup asks it before the run is recorded. Only the best TOP_K runs by
+    streak are kept in full (streak, prestiges and stars at the end of the
+    run, and when), in a min-heap.
+
+    Ranks count ties as equal: a run ranks one below the number of runs with
+    a strictly higher value. Among equal streaks the earlier run is listed
+    first.
+
+    record() only queues the write. Pending runs are saved together once
+    there are FLUSH_EVERY of them, or by flush_if_due() once the oldest is
+    FLUSH_SECONDS old — main.py calls it every frame. close() saves the rest.
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.counts   = {metric: RunCounts() for metric in METRICS}
+        self._top     = []     # Min-heap of (streak, -seq, prestige_count, stars, recorded_at)
+        self._pending = {metric: {} for metric in METRICS}   # {metric: {value: runs}} not yet saved
+        self._pending_runs  = 0
+        self._pending_since = None
+        self._top_changed   = False
+
+        self._db = sqlite3.connect(path)
+        self._db.executescript('''
+            CREATE TABLE IF NOT EXISTS streak_counts (streak INTEGER PRIMARY KEY, runs INTEGER NOT NULL);
+            CREATE TABLE IF NOT EXISTS prestige_counts (prestige_count INTEGER PRIMARY KEY, runs INTEGER NOT NULL);
+            CREATE TABLE IF NOT EXISTS star_counts (stars INTEGER PRIMARY KEY, runs INTEGER NOT NULL);
+            CREATE TABLE IF NOT EXISTS top_runs (
+                seq INTEGER PRIMARY KEY, streak INTEGER NOT NULL, prestige_count INTEGER NOT NULL,
+                stars INTEGER NOT NULL, recorded_at REAL NOT NULL);
+        ''')
+        for metric, table in METRICS.items():
+            for value, runs in self._db.execute(f'SELECT {metric}, runs FROM {table}'):
+                self.counts[metric].add(value, runs)
+        for seq, streak, prestige_count, stars, recorded_at in self._db.execute('SELECT * FROM top_runs'):
+            self._top.append((streak, -seq, prestige_count, stars, recorded_at))
+        heapq.heapify(self._top)
+
+    def __len__(self):
+        return self.counts['streak'].total
+
+    def rank(self, value, metric='streak'):
+        """The rank a run ending at value of metric (see METRICS) has, or would have if recorded now."""
+        return self.counts[metric].above(value) + 1
+
+    def record(self, streak, prestige_count=0, stars=0):
+        """Add a finished run and return its rank by streak."""
+        seq = len(self) + 1
+        for metric, value in (('streak', streak), ('prestige_count', prestige_count), ('stars', stars)):
+            self.counts[metric].add(value)
+            pending = self._pending[metric]
+            pending[value] = pending.get(value, 0) + 1
+        entry = (streak, -seq, prestige_count, stars, time.time())
+        if len(self._top) < TOP_K:
+            heapq.heappush(self._top, entry)
+            self._top_changed = True
+        elif entry > self._top[0]:
+            heapq.heapreplace(self._top, entry)
+            self._top_changed = True
+
+        self._pending_runs += 1
+        if self._pending_since is None:
+            self._pending_since = time.monotonic()
+        if self._pending_runs >= FLUSH_EVERY:
+            self.flush()
+        else:
+            self.flush_if_due()
+        return self.rank(streak)
+
+    def top(self, n=10):
+        """The best n runs as dicts, best first."""
+        best = heapq.nlargest(n, self._top)
+        return [{'streak': streak, 'prestige_count': prestige_count, 'stars': stars, 'recorded_at': recorded_at}
+                for streak, _, prestige_count, stars, recorded_at in best]
+
+    # --- Saving ---
+
+    def flush_if_due(self):
+        """Flush if the oldest pending run has waited FLUSH_SECONDS. Cheap enough to call every frame."""
+        if self._pending_since is not None and time.monotonic() - self._pending_since >= FLUSH_SECONDS:
+            self.flush()
+
+    def flush(self):
+        """Write every pending run in one transaction."""
+        if not self._pending_runs:
+            return
+        with self._db:
+            for metric, table in METRICS.items():
+                self._db.executemany(
+                    f'INSERT INTO {table} ({metric}, runs) VALUES (?, ?) '
+                    f'ON CONFLICT ({metric}) DO UPDATE SET runs = runs + excluded.runs',
+                    self._pending[metric].items())
+            if self._top_changed:
+                # At most TOP_K rows, so rewriting them is cheaper than tracking which changed
+                self._db.execute('DELETE FROM top_runs')
+                self._db.executemany('INSERT INTO top_runs VALUES (?, ?, ?, ?, ?)',
+                                     [(-neg_seq, streak, prestige_count, stars, recorded_at)
+                                      for streak, neg_seq, prestige_count, stars, recorded_at in self._top])
+        self._pending       = {metric: {} for metric in METRICS}
+        self._pending_runs  = 0
+        self._pending_since = None
+        self._top_changed   = False
+
+    def close(self):
+        self.flush()
+        self._db.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Show the best recorded runs')
+    parser.add_argument('--path', default=DEFAULT_PATH)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--rank', type=int, default=None, metavar='VALUE',
+                        help='Also show where a run ending at this value ranks')
+    parser.add_argument('--by', choices=METRICS, default='streak', help='Metric --rank ranks by')
+    args = parser.parse_args()
+
+    board = Leaderboard(args.path)
+    print(f'{len(board):,} runs recorded')
+    for place, run in enumerate(board.top(args.top), 1):
+        when = time.strftime('%Y-%m-%d', time.localtime(run['recorded_at']))
+        print(f'{place:>4}.  streak {run["streak"]:>4}   prestiges {run["prestige_count"]:>3}   '
+              f'stars {run["stars"]:>4}   {when}')
+    if args.rank is not None:
+        print(f'A run with {args.rank} {args.by} ranks #{board.rank(args.rank, args.by):,} by {args.by}')
+    board.close()
\ No newline at end of file
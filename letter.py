@@ -18,13 +18,16 @@ class Letter:
 
         self.font = font
 
-    def draw(self, screen):
+    def draw(self, screen, offset=(0, 0)):
         """
         Draw the letter slot. Always draws the outline box.
         If the letter has been revealed, draws the character centered inside.
+        offset is subtracted from the slot position so the slot can be drawn
+        onto a surface that does not start at the screen origin.
         """
-        pygame.draw.rect(screen, 'white', self.rect, 2)
+        rect = self.rect.move(-offset[0], -offset[1])
+        pygame.draw.rect(screen, 'white', rect, 2)
         if self.letter:
             surface = self.font.render(self.letter, True, 'white')
-            letter_rect = surface.get_rect(center=self.rect.center)
+            letter_rect = surface.get_rect(center=rect.center)
             screen.blit(surface, letter_rect)
\ No newline at end of file
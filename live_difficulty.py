@@ -0,0 +1,208 @@
+import argparse
+import sqlite3
+from array import array
+
+import history
+from corpus import default_corpus
+from stats import difficulty_band
+
+
+# Bump whenever the counters change what they measure; saved counters from
+# another version are thrown away and rebuilt from the history log
+TUNING_VERSION = 1
+
+# Each play of a puzzle scales its earlier plays by DECAY, so its counters
+# follow roughly its last 1 / (1 - DECAY) plays
+DECAY = 0.8
+
+# Decayed plays that weigh as much as the precomputed difficulty: with p
+# plays, p / (p + PRIOR_PLAYS) of the tuned difficulty comes from play
+PRIOR_PLAYS = 3.0
+
+# Hardness of one round: its wrong guesses, plus these for a loss and for
+# each consumable bought
+LOSS_WEIGHT       = 3.0
+CONSUMABLE_WEIGHT = 1.0
+
+# Bounds on how far play can scale a puzzle's difficulty
+MIN_RATIO = 0.5
+MAX_RATIO = 2.0
+
+# Tuned difficulty is the precomputed one times a whole number of
+# 1/SCALE_STEPS steps, so a replay can store the steps and get the exact
+# same floats back
+SCALE_STEPS = 1000
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS puzzle_play (
+        puzzle      TEXT PRIMARY KEY,
+        plays       REAL NOT NULL,
+        solves      REAL NOT NULL,
+        wrong       REAL NOT NULL,
+        consumables REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS puzzle_play_state (
+        version INTEGER NOT NULL,
+        last_id INTEGER NOT NULL
+    );
+'''
+
+
+class DifficultyTuner:
+    """
+    Per-puzzle counters of how rounds actually went — plays, solves, wrong
+    guesses and consumables bought — and the pool difficulties tuned from
+    them.
+
+    The counters decay exponentially (see DECAY), so add() folds in a round
+    in O(1) and old plays fade out. recalibrate() rescales each played
+    puzzle's difficulty by how much harder it played than the other puzzles
+    in its stats.DIFFICULTY_BANDS band, blended with the precomputed
+    difficulty by how often it has been played (see PRIOR_PLAYS). It writes
+    into scales (uint16, SCALE_STEPS = unchanged) and difficulties, a float64
+    array parallel to corpus.difficulties that GameManager pools by instead;
+    the corpus itself is never modified.
+
+    main.py catches the counters up from history.db once at launch (see
+    load()) and hands the game a copy of the tuned values, so the pools
+    don't shift under a replay mid-session.
+    """
+
+    def __init__(self, corpus=None):
+        self.corpus = corpus if corpus is not None else default_corpus()
+        count = len(self.corpus)
+        self.plays        = array('d', bytes(8 * count))
+        self.solves       = array('d', bytes(8 * count))
+        self.wrong        = array('d', bytes(8 * count))
+        self.consumables  = array('d', bytes(8 * count))
+        self.scales       = array('H', [SCALE_STEPS]) * count
+        self.difficulties = array('d', self.corpus.difficulties)
+        self.last_id      = 0       # Last history row counted
+        self._observed    = set()   # Indices of every puzzle with plays
+        self._changed     = set()   # Indices whose counters changed since load
+        self._rewrite     = True    # Saved counters are stale; save() replaces them all
+
+    def add(self, row):
+        """Fold in one history row (a dict with history.COLUMNS keys)."""
+        try:
+            i = self.corpus.index_of(row['puzzle'])
+        except KeyError:
+            return  # Puzzle no longer in the corpus
+        bought = row['consumables'].count(',') + 1 if row['consumables'] else 0
+        self.plays[i]       = self.plays[i] * DECAY + 1
+        self.solves[i]      = self.solves[i] * DECAY + (row['outcome'] == 'won')
+        self.wrong[i]       = self.wrong[i] * DECAY + row['strikes_used']
+        self.consumables[i] = self.consumables[i] * DECAY + bought
+        self._observed.add(i)
+        self._changed.add(i)
+
+    def hardness(self, i):
+        """Average hardness of puzzle i's rounds, decay-weighted (see LOSS_WEIGHT)."""
+        plays = self.plays[i]
+        return (self.wrong[i] + LOSS_WEIGHT * (plays - self.solves[i])
+                + CONSUMABLE_WEIGHT * self.consumables[i]) / plays
+
+    def recalibrate(self):
+        """Recompute difficulties for every played puzzle, in O(played puzzles)."""
+        base  = self.corpus.difficulties
+        bands = {}   # {band label: [hardness × plays, plays]}
+        for i in self._observed:
+            totals = bands.setdefault(difficulty_band(base[i]), [0.0, 0.0])
+            totals[0] += self.hardness(i) * self.plays[i]
+            totals[1] += self.plays[i]
+
+        for i in self._observed:
+            band_hardness, band_plays = bands[difficulty_band(base[i])]
+            ratio = (self.hardness(i) + 1) / (band_hardness / band_plays + 1)
+            ratio = min(max(ratio, MIN_RATIO), MAX_RATIO)
+            blend = self.plays[i] / (self.plays[i] + PRIOR_PLAYS)
+            self.scales[i]       = round(SCALE_STEPS * (1 + blend * (ratio - 1)))
+            self.difficulties[i] = base[i] * self.scales[i] / SCALE_STEPS
+
+    def overrides(self):
+        """{puzzle index: scale in SCALE_STEPS} for every puzzle play has moved, for tuned_difficulties() and replays."""
+        return {i: self.scales[i] for i in sorted(self._observed) if self.scales[i] != SCALE_STEPS}
+
+    def _restore(self, puzzle, plays, solves, wrong, consumables):
+        try:
+            i = self.corpus.index_of(puzzle)
+        except KeyError:
+            return
+        self.plays[i], self.solves[i], self.wrong[i], self.consumables[i] = plays, solves, wrong, consumables
+        self._observed.add(i)
+
+
+def tuned_difficulties(overrides, corpus=None):
+    """A copy of corpus.difficulties scaled by overrides, as from DifficultyTuner.overrides()."""
+    corpus = corpus if corpus is not None else default_corpus()
+    table  = array('d', corpus.difficulties)
+    for i, steps in overrides.items():
+        table[i] = table[i] * steps / SCALE_STEPS
+    return table
+
+
+def load(corpus=None, path=history.DEFAULT_PATH, rebuild=False):
+    """
+    Return a recalibrated DifficultyTuner for the history log at path: the
+    saved counters with every round logged since folded in. Counters from
+    another TUNING_VERSION, or rebuild, mean a full rebuild from the log.
+    """
+    tuner = DifficultyTuner(corpus)
+    db    = sqlite3.connect(path)
+    try:
+        db.execute(history.SCHEMA)
+        db.executescript(SCHEMA)
+        saved = db.execute('SELECT version, last_id FROM puzzle_play_state').fetchone()
+        if saved and saved[0] == TUNING_VERSION and not rebuild:
+            tuner.last_id  = saved[1]
+            tuner._rewrite = False
+            for counters in db.execute('SELECT puzzle, plays, solves, wrong, consumables FROM puzzle_play'):
+                tuner._restore(*counters)
+    finally:
+        db.close()
+
+    for row_id, row in history.read_rounds(path, after_id=tuner.last_id):
+        tuner.add(row)
+        tuner.last_id = row_id
+    tuner.recalibrate()
+    return tuner
+
+
+def save(tuner, path=history.DEFAULT_PATH):
+    """Save the counters that changed since load(), as covering the log up to tuner.last_id."""
+    db = sqlite3.connect(path)
+    try:
+        with db:
+            if tuner._rewrite:
+                db.execute('DELETE FROM puzzle_play')
+            texts = tuner.corpus.texts
+            db.executemany('INSERT OR REPLACE INTO puzzle_play VALUES (?, ?, ?, ?, ?)',
+                           [(texts[i], tuner.plays[i], tuner.solves[i], tuner.wrong[i], tuner.consumables[i])
+                            for i in tuner._changed])
+            db.execute('DELETE FROM puzzle_play_state')
+            db.execute('INSERT INTO puzzle_play_state VALUES (?, ?)', (TUNING_VERSION, tuner.last_id))
+    finally:
+        db.close()
+    tuner._changed.clear()
+    tuner._rewrite = False
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Show the puzzle difficulties tuned from the run history')
+    parser.add_argument('--path', default=history.DEFAULT_PATH)
+    parser.add_argument('--rebuild', action='store_true', help='Recount every puzzle from the whole log')
+    parser.add_argument('--top', type=int, default=10, help='Puzzles to list in each direction')
+    args = parser.parse_args()
+
+    tuner = load(path=args.path, rebuild=args.rebuild)
+    save(tuner, args.path)
+    base  = tuner.corpus.difficulties
+    moved = sorted(tuner.overrides(), key=tuner.scales.__getitem__)
+    print(f'{len(tuner._observed):,} puzzles played, {len(moved):,} retuned')
+    for title, rows in (('Easier than expected', moved[:args.top]),
+                        ('Harder than expected', moved[::-1][:args.top])):
+        print(f'\n  {title:<36}{"plays":>7}{"solved":>8}{"was":>9}{"now":>9}')
+        for i in rows:
+            solved = tuner.solves[i] / tuner.plays[i]
+            print(f'  {tuner.corpus.texts[i][:34]:<36}{tuner.plays[i]:>7.1f}{solved:>8.0%}'
+                  f'{base[i]:>9.0f}{tuner.difficulties[i]:>9.0f}')
\ No newline at end of file
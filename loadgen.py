@@ -0,0 +1,244 @@
+import argparse
+import asyncio
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+from collections import Counter
+
+from bots import ALPHABET, ENGLISH_FREQUENCY
+from client import GameClient
+from puzzles import PUZZLES
+from server import raise_open_file_limit
+from shop_items import UPGRADES, CONSUMABLES, PRESTIGE_ITEMS
+
+
+# Request types reported on their own; everything else is grouped under its op name too
+REPORTED_OPS = ('guess', 'buy', 'prestige', 'dismiss', 'new')
+
+SHOP_BEHAVIOURS = {
+    'none':        [],
+    'consumables': [item['id'] for item in CONSUMABLES],
+    'greedy':      [item['id'] for item in UPGRADES + CONSUMABLES + PRESTIGE_ITEMS],
+}
+
+# (category, word lengths) → phrases, so a player only pattern-matches plausible candidates
+_CANDIDATES = {}
+for _text, _category in PUZZLES:
+    _CANDIDATES.setdefault((_category, tuple(len(w) for w in _text.split())), []).append(_text)
+
+
+class Latencies:
+    """Request latencies in seconds, grouped by op, plus error counts."""
+
+    def __init__(self):
+        self.samples = {}
+        self.errors  = Counter()
+
+    def add(self, op, seconds, ok):
+        self.samples.setdefault(op, []).append(seconds)
+        if not ok:
+            self.errors[op] += 1
+
+    @property
+    def total(self):
+        return sum(len(s) for s in self.samples.values())
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class SimulatedPlayer:
+    """
+    One simulated player on its own connection. Between requests it waits an
+    exponentially distributed think time. Each guess is right with roughly
+    the given accuracy: a "right" guess is the most common missing letter
+    among corpus phrases that fit the board (which is the answer once the
+    board narrows to one phrase), a "wrong" guess is a letter none of them
+    contain. The player never sees the hidden phrase.
+
+    Before a guess it may shop (shop_rate chance, from the items allowed by
+    its shop behaviour — unaffordable purchases still count as requests),
+    and it prestiges as soon as the server says it can.
+    """
+
+    def __init__(self, client, rng, latencies, think, accuracy, shop, shop_rate):
+        self.client    = client
+        self.rng       = rng
+        self.latencies = latencies
+        self.think     = think
+        self.accuracy  = accuracy
+        self.shop      = SHOP_BEHAVIOURS[shop]
+        self.shop_rate = shop_rate
+
+    async def request(self, op, **args):
+        start    = time.perf_counter()
+        response = await self.client.request(op, **args)
+        self.latencies.add(op, time.perf_counter() - start, response['ok'])
+        return response
+
+    async def run(self, deadline):
+        state = (await self.request('new', seed=self.rng.randrange(2**32)))['state']
+        while time.perf_counter() < deadline:
+            if self.think:
+                await asyncio.sleep(self.rng.expovariate(1 / self.think))
+
+            if state['pending']:
+                response = await self.request('dismiss')
+            elif state['can_prestige']:
+                response = await self.request('prestige')
+            elif self.shop and self.rng.random() < self.shop_rate:
+                response = await self.request('buy', item=self.rng.choice(self.shop))
+            else:
+                response = await self.request('guess', letter=self.pick_letter(state))
+            if response['ok']:
+                state = response['state']
+
+    def pick_letter(self, state):
+        guessed    = state['guessed']
+        unguessed  = [c for c in ALPHABET if c not in guessed]
+        candidates = self._candidates(state)
+        counts     = Counter(c for text in candidates for c in set(text) if c != ' ' and c not in guessed)
+
+        if self.rng.random() < self.accuracy:
+            if counts:
+                return max(counts, key=lambda c: (counts[c], -ENGLISH_FREQUENCY.index(c)))
+            return next(c for c in ENGLISH_FREQUENCY if c not in guessed)
+        misses = [c for c in unguessed if c not in counts]
+        return self.rng.choice(misses or unguessed)
+
+    @staticmethod
+    def _candidates(state):
+        board   = state['board']
+        key     = (state['category'], tuple(len(w) for w in board.split(' ')))
+        hidden  = f'[^{state["guessed"]} ]' if state['guessed'] else '[^ ]'
+        pattern = re.compile(''.join(hidden if c == '_' else re.escape(c) for c in board))
+        return [text for text in _CANDIDATES.get(key, ()) if pattern.fullmatch(text)]
+
+
+# ---------------------------------------------------------------------------
+# Running a test
+# ---------------------------------------------------------------------------
+
+async def run_player(target, rng, latencies, args, deadline):
+    # Spread connections over the ramp so thousands of players don't hit the listen backlog at once
+    await asyncio.sleep(rng.uniform(0, args.ramp))
+    client = await GameClient.connect(**target)
+    player = SimulatedPlayer(client, rng, latencies, args.think_ms / 1000,
+                             args.accuracy, args.shop, args.shop_rate)
+    try:
+        await player.run(deadline)
+    finally:
+        await client.close()
+
+
+async def server_stats(target):
+    client = await GameClient.connect(**target)
+    try:
+        return (await client.request('stats'))['result']
+    finally:
+        await client.close()
+
+
+async def wait_for_server(target, timeout=10.0):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            return await server_stats(target)
+        except OSError:
+            if time.perf_counter() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+async def load_test(args):
+    """Run the configured load and return (latencies, elapsed seconds, server stats at peak)."""
+    target    = dict(host=args.host, port=args.port, unix=args.unix)
+    latencies = Latencies()
+    await wait_for_server(target)
+
+    master   = random.Random(args.seed)
+    start    = time.perf_counter()
+    deadline = start + args.ramp + args.duration
+    players  = [asyncio.create_task(run_player(target, random.Random(master.randrange(2**32)),
+                                               latencies, args, deadline))
+                for _ in range(args.players)]
+
+    # Sample the server while every player is still connected
+    await asyncio.sleep(max(0.0, deadline - time.perf_counter() - 0.5))
+    peak = await server_stats(target)
+
+    results = await asyncio.gather(*players, return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    failed  = [r for r in results if isinstance(r, BaseException)]
+    if failed:
+        print(f'{len(failed)} players dropped: {failed[0]!r}', file=sys.stderr)
+    return latencies, elapsed, peak
+
+
+def format_report(latencies, elapsed, stats, players):
+    lines = [
+        f'{players} players, {latencies.total:,} requests in {elapsed:.1f}s '
+        f'({latencies.total / elapsed:,.0f} req/s)',
+        '',
+        f'  {"op":<10}{"count":>10}{"errors":>8}{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}{"max ms":>10}',
+    ]
+    ops = [op for op in REPORTED_OPS if op in latencies.samples]
+    ops += sorted(op for op in latencies.samples if op not in REPORTED_OPS)
+    for op in ops:
+        samples = sorted(latencies.samples[op])
+        lines.append(f'  {op:<10}{len(samples):>10,}{latencies.errors[op]:>8,}'
+                     + ''.join(f'{percentile(samples, p) * 1000:>10.2f}' for p in (50, 95, 99))
+                     + f'{samples[-1] * 1000:>10.2f}')
+    for op in REPORTED_OPS[:3]:
+        if op not in latencies.samples:
+            lines.append(f'  {op:<10}{0:>10}  (no samples — try a longer run or higher accuracy)')
+
+    rss = stats.get('rss_kb')
+    # With --workers each stats request lands on one worker, so this is that worker's share
+    lines += ['', f'server pid {stats["pid"]}: {stats["sessions"]:,} sessions ({stats["hibernated"]:,} hibernated), '
+                  f'{stats["connections"]:,} connections, '
+                  + (f'RSS {rss / 1024:,.1f} MB' if rss is not None else 'RSS unknown')]
+    return '\n'.join(lines)
+
+
+def spawn_server(args):
+    command = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'server.py')]
+    command += ['--unix', args.unix] if args.unix else ['--host', args.host, '--port', str(args.port)]
+    command += ['--workers', str(args.workers)]
+    return subprocess.Popen(command)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Simulated-player load test for server.py')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7777)
+    parser.add_argument('--unix', metavar='PATH', default=None, help='Connect over a Unix socket instead of TCP')
+    parser.add_argument('--spawn', action='store_true', help='Start server.py for the test and stop it afterwards')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes for a --spawn server')
+    parser.add_argument('--players', type=int, default=1000, help='Concurrent simulated players')
+    parser.add_argument('--duration', type=float, default=30.0, help='Seconds to run after the ramp')
+    parser.add_argument('--ramp', type=float, default=5.0, help='Seconds over which players connect')
+    parser.add_argument('--think-ms', type=float, default=500.0, help='Mean think time between requests (0 = none)')
+    parser.add_argument('--accuracy', type=float, default=0.8, help='Chance each guess is a correct letter')
+    parser.add_argument('--shop', choices=sorted(SHOP_BEHAVIOURS), default='consumables')
+    parser.add_argument('--shop-rate', type=float, default=0.05, help='Chance of shopping before each guess')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    raise_open_file_limit()
+    server = spawn_server(args) if args.spawn else None
+    try:
+        latencies, elapsed, stats = asyncio.run(load_test(args))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+    print(format_report(latencies, elapsed, stats, args.players))
\ No newline at end of file
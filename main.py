@@ -1,12 +1,76 @@
+import argparse
+import os
+import time
+
 import pygame
 
+import replay
+from bots import OracleBot
 from constants import SCREEN_SIZE
-from game_manager import GameManager, PRESTIGE_UNLOCK_STREAK
+from game_manager import GameManager, MAX_SEED, PRESTIGE_UNLOCK_STREAK
+import live_difficulty
+import stats
+from history import RunHistory
+from leaderboard import Leaderboard
 from menu_bar import MenuBar
 from old_man import OldMan
+from alloc_tracker import AllocTracker
+from paths import app_dir
 from popup import Popup
+from profiler import FrameProfiler
+from remote import RemoteGame
 from shop import Shop
 from score import Score
+from stats_screen import StatsScreen
+
+
+# --- Command Line ---
+def seed_arg(text):
+    """--seed value: the replay header stores it as a uint64."""
+    try:
+        seed = int(text)
+    except ValueError:
+        seed = -1
+    if not 0 <= seed <= MAX_SEED:
+        raise argparse.ArgumentTypeError(f'must be an integer from 0 to {MAX_SEED}')
+    return seed
+
+
+parser = argparse.ArgumentParser(description='Word Game')
+parser.add_argument('--seed', type=seed_arg, default=None,
+                    help='Seed for the run (random if omitted)')
+parser.add_argument('--record', metavar='PATH', default=None,
+                    help='Where to save the input replay on exit (default: replays/ next to the game)')
+parser.add_argument('--replay', metavar='PATH', default=None,
+                    help='Play back a recorded replay instead of reading input')
+parser.add_argument('--uncapped', action='store_true',
+                    help='With --replay, apply one event per frame with no frame cap')
+parser.add_argument('--autoplay', action='store_true',
+                    help='Let the built-in solver play at uncapped speed until a target is reached')
+parser.add_argument('--target-streak', type=int, default=None, metavar='N',
+                    help='With --autoplay, stop once the streak reaches N')
+parser.add_argument('--target-stars', type=int, default=None, metavar='N',
+                    help='With --autoplay, stop once N spendable stars are held (prestiges as soon as possible)')
+parser.add_argument('--target-prestiges', type=int, default=None, metavar='N',
+                    help='With --autoplay, stop after N prestiges')
+parser.add_argument('--profile-frames', type=int, default=300, metavar='N',
+                    help='Frames captured when F9 starts a profile')
+parser.add_argument('--trace-allocs', type=int, default=0, metavar='N',
+                    help='Track allocations with tracemalloc and print a report every N frames (slow)')
+parser.add_argument('--render-every', type=int, default=100, metavar='N',
+                    help='With --autoplay, draw one frame per N solver actions (0 = only when done)')
+parser.add_argument('--connect', metavar='HOST:PORT', default=None,
+                    help='Play as a thin client of a server.py session instead of running the rules locally')
+parser.add_argument('--connect-unix', metavar='PATH', default=None,
+                    help='Like --connect, over a Unix socket')
+args = parser.parse_args()
+if args.autoplay and args.replay:
+    parser.error('--autoplay cannot be combined with --replay')
+if args.autoplay and args.target_streak is None and args.target_stars is None and args.target_prestiges is None:
+    parser.error('--autoplay needs --target-streak, --target-stars or --target-prestiges')
+remote = args.connect is not None or args.connect_unix is not None
+if remote and (args.replay or args.autoplay):
+    parser.error('--connect cannot be combined with --replay or --autoplay')
 
 
 # --- Initialization ---
@@ -18,31 +82,118 @@ running = True
 
 font = pygame.font.SysFont('Arial', 32)
 
+# Replay playback re-drives the game from a recorded seed and input log;
+# otherwise every state-changing input is recorded so the run can be replayed
+player   = None
+recorder = None
+seed     = args.seed
+tuned    = {}
+if args.replay:
+    seed, tuned, events = replay.load(args.replay)
+    player = replay.ReplayPlayer(events, uncapped=args.uncapped)
+
+# A local game pools puzzles by difficulties tuned from the run history, caught up once here;
+# the replay records them, and a replay plays back with the ones it recorded
+local = player is None and not args.autoplay and not remote
+if local:
+    tuner = live_difficulty.load()
+    live_difficulty.save(tuner)
+    tuned = tuner.overrides()
+
 shop     = Shop(font, *SCREEN_SIZE)
 score    = Score(font)
 menu_bar = MenuBar(font, SCREEN_SIZE[0], shop)
 
-manager = GameManager(font, shop)
+# A thin client mirrors a server session; recorded replays still play back locally
+if args.connect:
+    host, _, port = args.connect.rpartition(':')
+    manager = RemoteGame.connect(font, shop, host or '127.0.0.1', int(port), seed=seed)
+elif args.connect_unix:
+    manager = RemoteGame.connect(font, shop, unix=args.connect_unix, seed=seed)
+else:
+    manager = GameManager(font, shop, seed=seed,
+                          difficulties=live_difficulty.tuned_difficulties(tuned) if tuned else None)
 shop.manager     = manager
 score.manager    = manager
 menu_bar.manager = manager
 
+# Every finished round of a local game is logged to history.db; replays and autoplay runs aren't
+# Tab opens a stats screen over that history, kept up to date round by round
+history      = None
+round_stats  = None
+stats_screen = None
+if local:
+    round_stats = stats.load()   # Before the history's writer opens the database
+    history = RunHistory(manager)
+    history.on_round       = round_stats.add
+    manager.on_round_start = history.round_started
+    manager.on_guess       = history.guessed
+    manager.on_round_end   = history.round_ended
+    stats_screen = StatsScreen(font, *SCREEN_SIZE, round_stats)
+
+
+def on_purchase(item_id, item_list):
+    recorder.record(*replay.purchase_event(item_id, item_list))
+    if history is not None:
+        history.purchased(item_id, item_list)
+
+
+if player is None:
+    recorder = replay.ReplayRecorder(manager.seed, tuned)
+    shop.on_purchase = on_purchase
+
 old_man = OldMan(font, *SCREEN_SIZE)
 
+# F9 profiles the next few frames and writes the results to profiles/ next to the game
+profiler = FrameProfiler(os.path.join(app_dir(), 'profiles'), frames=args.profile_frames)
+
+# --trace-allocs reports per-frame garbage by draw call; see alloc_tracker.py
+alloc_tracker = None
+if args.trace_allocs:
+    alloc_tracker = AllocTracker()
+    alloc_tracker.start()
+    alloc_tracker.instrument()
+
+# Autoplay drives the oracle solver through the same actions as the event loop,
+# so the run is recorded like any other and can be replayed
+autoplay = OracleBot(seed=manager.seed) if args.autoplay else None
+autoplay_prestiges = args.target_stars is not None or args.target_prestiges is not None
+
+# Finished runs are ranked on the leaderboard; replays and autoplay runs don't count
+leaderboard = Leaderboard() if player is None and autoplay is None else None
+
 popup          = None   # Active win/lose/game-complete popup
 pending_lose   = False  # True when lose popup is showing but lose() hasn't fired
 prestige_popup = None   # Active prestige popup
 
 
+def record(op, payload=0):
+    """Log a state-changing input to the replay, unless we are playing one back."""
+    if recorder:
+        recorder.record(op, payload)
+
+
+def end_run(end):
+    """Call end (manager.lose or manager.prestige) and enter the finished run on the leaderboard."""
+    streak = manager.streak_count
+    end()
+    if leaderboard is not None:
+        leaderboard.record(streak, manager.prestige_count, manager.stars)
+
+
+# --- State-changing actions ---
+# Shared by the event loop and replay playback so both drive the game identically.
+
 def dismiss_popup():
     """Handle popup dismissal — win advances the round, lose resets the run."""
     global popup, pending_lose
+    record(replay.DISMISS)
     if pending_lose:
         pending_lose = False
-        manager.lose()
+        end_run(manager.lose)
         popup = None
     elif popup.game_complete:
-        manager.lose()
+        end_run(manager.lose)
         popup = None
     else:
         advanced = manager.win()
@@ -53,24 +204,147 @@ def dismiss_popup():
             popup = None
 
 
+def guess_letter(letter):
+    """Submit a letter guess and open the win/lose popup if the round ended."""
+    global popup, pending_lose
+    if letter not in replay.ALPHABET or letter in manager.alphabet.guessed:
+        return
+    record(replay.GUESS, replay.ALPHABET.index(letter))
+    result = manager.guess(letter)
+
+    if result == 'solved':
+        shop.visible = False
+        popup = Popup('You Win!', font, *SCREEN_SIZE,
+                      phrase=manager.phrase.word)
+
+    elif result == 'game_over':
+        pending_lose = True
+        shop.visible = False
+        popup = Popup('You Lose!', font, *SCREEN_SIZE,
+                      phrase=manager.phrase.word,
+                      streak=manager.streak_count,
+                      rank=leaderboard.rank(manager.streak_count) if leaderboard is not None else None,
+                      lost_star_buffer=manager.star_buffer)
+
+
+def check_solved_by_consumable():
+    """A consumable (reveal vowel/consonant) may have solved the puzzle."""
+    global popup
+    if manager.solved_by_consumable:
+        manager.solved_by_consumable = False
+        shop.visible = False
+        popup = Popup('You Win!', font, *SCREEN_SIZE,
+                      phrase=manager.phrase.word)
+
+
+def confirm_prestige():
+    global prestige_popup
+    record(replay.PRESTIGE_CONFIRM)
+    end_run(manager.prestige)
+    prestige_popup = None
+
+
+def debug_boost():
+    if remote:
+        return  # The server has no debug op
+    record(replay.DEBUG_BOOST)
+    manager.money += 10_000
+    manager.streak_count += 9
+    manager.mark_changed()
+
+
+def autoplay_done():
+    """True once any autoplay target has been reached."""
+    return ((args.target_streak is not None and manager.streak_count >= args.target_streak)
+            or (args.target_stars is not None and manager.stars >= args.target_stars)
+            or (args.target_prestiges is not None and manager.prestige_count >= args.target_prestiges))
+
+
+def autoplay_step():
+    """Take one autoplay action: dismiss a popup, prestige, or guess the next letter."""
+    if popup:
+        dismiss_popup()
+    elif autoplay_prestiges and manager.can_prestige:
+        confirm_prestige()
+    else:
+        guess_letter(autoplay.pick_letter(manager))
+
+
+def apply_replay_event(op, payload):
+    """Re-apply one recorded input through the same actions the event loop uses."""
+    if op == replay.GUESS:
+        guess_letter(replay.ALPHABET[payload])
+    elif op == replay.DISMISS:
+        if popup:
+            dismiss_popup()
+    elif op == replay.PRESTIGE_CONFIRM:
+        confirm_prestige()
+    elif op == replay.DEBUG_BOOST:
+        debug_boost()
+    else:
+        item_id, item_list = replay.purchase_item(op, payload)
+        if op == replay.BUY_CONSUMABLE:
+            shop._try_purchase_consumable(item_id)
+            check_solved_by_consumable()
+        else:
+            shop._try_purchase_item(item_id, item_list)
+
+
 # --- Game Loop ---
 while running:
+    if alloc_tracker:
+        alloc_tracker.begin_frame()
+
+    # Replay playback takes over input until the log runs out
+    if player:
+        for op, payload in player.due():
+            apply_replay_event(op, payload)
+        if player.finished:
+            player = None
+
+    # Autoplay runs a batch of actions per frame, so most states are never drawn
+    if autoplay:
+        for _ in range(args.render_every or 1_000):
+            # Beating the game ends the run, so a target not reached by then never will be
+            beaten = popup is not None and popup.game_complete
+            if autoplay_done() or beaten:
+                status = 'done' if autoplay_done() else 'stopped, game beaten before reaching the target'
+                print(f'Autoplay {status}: streak {manager.streak_count}, '
+                      f'{manager.stars} stars, {manager.prestige_count} prestiges')
+                autoplay = None
+                break
+            autoplay_step()
+        if autoplay and not args.render_every:
+            # Nothing is drawn until a target is reached, but closing the window still works
+            running = not pygame.event.peek(pygame.QUIT)
+            pygame.event.clear()
+            continue
+
     for event in pygame.event.get():
 
         if event.type == pygame.QUIT:
             running = False
 
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F9 and not profiler.active:
+            profiler.start()
+            pygame.display.set_caption(f'Word Game — profiling {profiler.frames} frames')
+
+        if player or autoplay:
+            continue
+
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
 
             # Old Man overlay has highest priority — consumes all clicks while open
             if old_man.handle_click(event.pos):
                 pass
 
+            elif stats_screen and stats_screen.handle_click(event.pos):
+                pass
+
             elif prestige_popup:
                 result = prestige_popup.handle_click(event.pos)
                 if result == 'confirm':
-                    manager.prestige()
-                    prestige_popup = None
+                    confirm_prestige()
                 elif result:  # True = close/No button
                     prestige_popup = None
 
@@ -80,8 +354,7 @@ while running:
             elif not popup:
                 clicked = menu_bar.handle_click(event.pos)
                 if clicked == 'debug_money':
-                    manager.money += 10_000
-                    manager.streak_count += 9
+                    debug_boost()
                 elif clicked == 'prestige':
                     prestige_popup = Popup(
                         'PRESTIGE', font, *SCREEN_SIZE,
@@ -95,20 +368,19 @@ while running:
                     old_man.visible = not old_man.visible
                 elif clicked is None:
                     shop.handle_click(event.pos)
-                    # A consumable (reveal vowel/consonant) may have solved the puzzle
-                    if manager.solved_by_consumable:
-                        manager.solved_by_consumable = False
-                        shop.visible = False
-                        popup = Popup('You Win!', font, *SCREEN_SIZE,
-                                      phrase=manager.phrase.word)
+                    check_solved_by_consumable()
 
         if event.type == pygame.MOUSEWHEEL:
             shop.scroll(event.y)
 
         if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_TAB and stats_screen and not old_man.visible:
+                stats_screen.visible = not stats_screen.visible
             if event.key == pygame.K_RETURN:
                 if old_man.visible:
                     old_man.visible = False
+                elif stats_screen and stats_screen.visible:
+                    stats_screen.visible = False
                 elif prestige_popup:
                     prestige_popup = None
                 elif popup:
@@ -118,25 +390,9 @@ while running:
 
         # Only accept letter guesses when no overlay is open
         if event.type == pygame.KEYDOWN and popup is None and not shop.visible \
-                and not prestige_popup and not old_man.visible:
+                and not prestige_popup and not old_man.visible and not (stats_screen and stats_screen.visible):
             if event.unicode.isalpha():
-                letter = event.unicode.upper()
-
-                if letter not in manager.alphabet.guessed:
-                    result = manager.guess(letter)
-
-                    if result == 'solved':
-                        shop.visible = False
-                        popup = Popup('You Win!', font, *SCREEN_SIZE,
-                                      phrase=manager.phrase.word)
-
-                    elif result == 'game_over':
-                        pending_lose = True
-                        shop.visible = False
-                        popup = Popup('You Lose!', font, *SCREEN_SIZE,
-                                      phrase=manager.phrase.word,
-                                      streak=manager.streak_count,
-                                      lost_star_buffer=manager.star_buffer)
+                guess_letter(event.unicode.upper())
 
     # --- Drawing ---
     screen.fill('black')
@@ -152,8 +408,49 @@ while running:
         prestige_popup.draw(screen)
 
     old_man.draw(screen)
+    if stats_screen:
+        stats_screen.draw(screen)
 
     pygame.display.update()
-    clock.tick(30)
+    clock.tick(0 if autoplay or (player and player.uncapped) else 30)
+    if leaderboard is not None:
+        leaderboard.flush_if_due()
+
+    if alloc_tracker:
+        alloc_tracker.end_frame()
+        if alloc_tracker.frames == args.trace_allocs:
+            print(alloc_tracker.report())
+            alloc_tracker.reset()
+
+    profile_path = profiler.frame_end()
+    if profile_path:
+        print(f'Profile written to {profile_path}')
+        pygame.display.set_caption('Word Game')
+
+# Quitting on a popup still settles what it shows, as dismissing would: a won round is logged
+# (and if it beat the game, the run ranked), a lost or completed run is ranked and logged.
+# A run quit partway through isn't ranked. None of this is recorded in the replay, which
+# just stops at the popup
+if (leaderboard is not None or history is not None) and popup:
+    if pending_lose or popup.game_complete or not manager.win():
+        end_run(manager.lose)
+
+# Saved before the replay, so a failure writing that can't lose them
+if leaderboard is not None:
+    leaderboard.close()
+if history is not None:
+    history.close()
+    stats.save(round_stats)   # Once the log has caught up, so the totals match it
+
+if recorder:
+    if args.record:
+        recorder.save(args.record)
+    else:
+        replay_dir = os.path.join(app_dir(), 'replays')
+        os.makedirs(replay_dir, exist_ok=True)
+        recorder.save(os.path.join(replay_dir, time.strftime('replay-%Y%m%d-%H%M%S.wgr')))
+
+if remote:
+    manager.close()
 
-pygame.quit()
+pygame.quit()
\ No newline at end of file
@@ -33,8 +33,11 @@ class MenuBar:
             ('debug_money', 'Debug',    False, False),  # Debug only — remove before release
         ]
 
-        # Rects are rebuilt each frame in draw() and stored for hit-testing in handle_click()
-        self._rects = {}
+        # Rects and rendered buttons are rebuilt in draw() whenever manager.version
+        # changes; _rects is also used for hit-testing in handle_click()
+        self._rects   = {}
+        self._buttons = []     # (rect, fill, border, label surface, label rect)
+        self._version = None
 
     def _visible_buttons(self):
         """Return list of (id, label, gold) for buttons that should currently be shown."""
@@ -73,10 +76,11 @@ class MenuBar:
                 return btn_id
         return None
 
-    def draw(self, screen):
-        """Draw all visible buttons centred at the top of the screen."""
+    def _build_buttons(self):
+        """Lay out and render the visible buttons for the current state."""
         visible = self._visible_buttons()
-        self._rects = self._build_rects(visible)
+        self._rects   = self._build_rects(visible)
+        self._buttons = []
 
         for btn_id, label, gold in visible:
             rect = self._rects[btn_id]
@@ -91,7 +95,17 @@ class MenuBar:
                 fill   = 'black'
                 color  = 'white'
 
+            surf = self.font.render(label, True, color)
+            self._buttons.append((rect, fill, border, surf, surf.get_rect(center=rect.center)))
+
+    def draw(self, screen):
+        """Draw all visible buttons centred at the top of the screen."""
+        version = self.manager.version if self.manager else None
+        if self._version != version or not self._buttons:
+            self._build_buttons()
+            self._version = version
+
+        for rect, fill, border, surf, surf_rect in self._buttons:
             pygame.draw.rect(screen, fill,   rect)
             pygame.draw.rect(screen, border, rect, 2)
-            surf = self.font.render(label, True, color)
-            screen.blit(surf, surf.get_rect(center=rect.center))
\ No newline at end of file
+            screen.blit(surf, surf_rect)
\ No newline at end of file
@@ -1,5 +1,8 @@
 import pygame
 
+from overlay import dim_layer
+from text_layout import wrap_text
+
 
 class OldMan:
     """
@@ -10,6 +13,10 @@ class OldMan:
     Visibility is toggled by setting old_man.visible = True/False, or via
     handle_click() which closes the panel when the Close button is pressed.
 
+    The panel is composed onto its own surface the first time it is drawn
+    and again only when message changes; every other frame is a blit of the
+    cached dim layer and a blit of the panel.
+
     Usage in main.py:
         old_man = OldMan(font, *SCREEN_SIZE)
         # open it:
@@ -31,6 +38,7 @@ class OldMan:
         self.screen_h   = screen_height
 
         self.visible = False
+        self._panel  = None  # Cached panel composite — rebuilt when message changes
         self.message = "Oh, you saved me! Thank you! But, wait... WHERE IS MY HAT??"
 
         # Main panel — centred on screen
@@ -46,6 +54,15 @@ class OldMan:
     # Public
     # ------------------------------------------------------------------
 
+    @property
+    def message(self):
+        return self._message
+
+    @message.setter
+    def message(self, value):
+        self._message = value
+        self._panel   = None
+
     def handle_click(self, pos):
         """
         If the overlay is visible, consume the click.
@@ -63,57 +80,68 @@ class OldMan:
             return
 
         # Dim the game behind the panel
-        dim = pygame.Surface((self.screen_w, self.screen_h), pygame.SRCALPHA)
-        dim.fill((0, 0, 0, 160))
-        screen.blit(dim, (0, 0))
+        screen.blit(dim_layer((self.screen_w, self.screen_h)), (0, 0))
+
+        if self._panel is None:
+            self._panel = self._build_panel()
+        screen.blit(self._panel, self.panel_rect)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _build_panel(self):
+        """Compose the panel, stick figure, dialogue and Close button onto one surface."""
+        surface = pygame.Surface(self.panel_rect.size)
+        panel   = surface.get_rect()
 
         # Panel background + border
-        pygame.draw.rect(screen, 'black', self.panel_rect)
-        pygame.draw.rect(screen, 'white', self.panel_rect, 2)
+        pygame.draw.rect(surface, 'black', panel)
+        pygame.draw.rect(surface, 'white', panel, 2)
 
         # Title
         title = self.font.render('OLD MAN', True, 'white')
-        screen.blit(title, title.get_rect(
-            centerx=self.panel_rect.centerx,
-            top=self.panel_rect.top + 16,
+        surface.blit(title, title.get_rect(
+            centerx=panel.centerx,
+            top=panel.top + 16,
         ))
 
         # Divider below title
-        div_y = self.panel_rect.top + 58
-        pygame.draw.line(screen, '#444444',
-                         (self.panel_rect.left + 20, div_y),
-                         (self.panel_rect.right - 20, div_y), 1)
+        div_y = panel.top + 58
+        pygame.draw.line(surface, '#444444',
+                         (panel.left + 20, div_y),
+                         (panel.right - 20, div_y), 1)
 
         # ------------------------------------------------------------------
         # Stick figure
         # ------------------------------------------------------------------
-        cx      = self.panel_rect.centerx
+        cx      = panel.centerx
         fig_top = div_y + 18
 
         # Head
         head_r = 20
         head_c = (cx, fig_top + head_r)
-        pygame.draw.circle(screen, 'white', head_c, head_r, 2)
+        pygame.draw.circle(surface, 'white', head_c, head_r, 2)
 
         # Body
         body_top    = head_c[1] + head_r
         body_bottom = body_top + 52
-        pygame.draw.line(screen, 'white', (cx, body_top), (cx, body_bottom), 2)
+        pygame.draw.line(surface, 'white', (cx, body_top), (cx, body_bottom), 2)
 
         # Arms — angled downward to look tired/old
         arm_y = body_top + 18
-        pygame.draw.line(screen, 'white', (cx, arm_y), (cx - 34, arm_y + 20), 2)
-        pygame.draw.line(screen, 'white', (cx, arm_y), (cx + 34, arm_y + 20), 2)
+        pygame.draw.line(surface, 'white', (cx, arm_y), (cx - 34, arm_y + 20), 2)
+        pygame.draw.line(surface, 'white', (cx, arm_y), (cx + 34, arm_y + 20), 2)
 
         # Legs
         leg_bottom = body_bottom + 44
-        pygame.draw.line(screen, 'white', (cx, body_bottom), (cx - 22, leg_bottom), 2)
-        pygame.draw.line(screen, 'white', (cx, body_bottom), (cx + 22, leg_bottom), 2)
+        pygame.draw.line(surface, 'white', (cx, body_bottom), (cx - 22, leg_bottom), 2)
+        pygame.draw.line(surface, 'white', (cx, body_bottom), (cx + 22, leg_bottom), 2)
 
         # Walking stick on the right side
         stick_top_x = cx + 34
         stick_top_y = arm_y + 20
-        pygame.draw.line(screen, 'white',
+        pygame.draw.line(surface, 'white',
                          (stick_top_x, stick_top_y),
                          (stick_top_x + 8, leg_bottom), 2)
 
@@ -122,41 +150,28 @@ class OldMan:
         # ------------------------------------------------------------------
         dlg_top  = leg_bottom + 16
         dlg_rect = pygame.Rect(
-            self.panel_rect.left  + 24,
+            panel.left  + 24,
             dlg_top,
-            self.panel_rect.width - 48,
+            panel.width - 48,
             76,
         )
-        pygame.draw.rect(screen, '#000000', dlg_rect)
-        pygame.draw.rect(screen, '#666666', dlg_rect, 1)
+        pygame.draw.rect(surface, '#000000', dlg_rect)
+        pygame.draw.rect(surface, '#666666', dlg_rect, 1)
 
-        self._draw_wrapped(screen, self.message, dlg_rect)
+        self._draw_wrapped(surface, self.message, dlg_rect)
 
         # Close button
-        pygame.draw.rect(screen, 'black', self.close_rect)
-        pygame.draw.rect(screen, 'white', self.close_rect, 2)
+        close_rect = self.close_rect.move(-self.panel_rect.left, -self.panel_rect.top)
+        pygame.draw.rect(surface, 'black', close_rect)
+        pygame.draw.rect(surface, 'white', close_rect, 2)
         close_surf = self.font.render('Close', True, 'white')
-        screen.blit(close_surf, close_surf.get_rect(center=self.close_rect.center))
+        surface.blit(close_surf, close_surf.get_rect(center=close_rect.center))
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
+        return surface
 
     def _draw_wrapped(self, screen, text, rect):
         """Word-wrap text to fit inside rect and centre it vertically."""
-        words = text.split()
-        lines = []
-        line  = ''
-        for word in words:
-            test = (line + ' ' + word).strip()
-            if self.small_font.size(test)[0] <= rect.width - 16:
-                line = test
-            else:
-                if line:
-                    lines.append(line)
-                line = word
-        if line:
-            lines.append(line)
+        lines = wrap_text(text, self.small_font, rect.width - 16)
 
         lh      = self.small_font.get_linesize()
         total_h = len(lines) * lh
@@ -0,0 +1,15 @@
+import pygame
+
+
+# Full-screen dim layers, one per screen size, shared by every overlay
+_dim_layers = {}
+
+
+def dim_layer(size):
+    """Return the translucent black layer overlays draw to dim the game behind them."""
+    dim = _dim_layers.get(size)
+    if dim is None:
+        dim = pygame.Surface(size, pygame.SRCALPHA)
+        dim.fill((0, 0, 0, 160))
+        _dim_layers[size] = dim
+    return dim
\ No newline at end of file
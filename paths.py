@@ -0,0 +1,12 @@
+import os
+import sys
+
+
+def app_dir():
+    """
+    Directory that files written by the game (replays, profiles, saves) live in.
+    Next to the executable for PyInstaller builds, next to the sources otherwise.
+    """
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.abspath(__file__))
\ No newline at end of file
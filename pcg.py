@@ -0,0 +1,59 @@
+import os
+import random
+
+
+MASK64     = (1 << 64) - 1
+MULTIPLIER = 6364136223846793005
+INCREMENT  = 1442695040888963407   # PCG's default stream; must be odd
+
+
+class PCG32(random.Random):
+    """
+    random.Random driven by a PCG32 generator (pcg-random.org) instead of
+    the Mersenne Twister. All of Random's methods (choice, sample, shuffle,
+    randrange, ...) work unchanged on top of getrandbits().
+
+    The whole state is one 64-bit integer, so a game's random source can be
+    saved in 8 bytes (see snapshot.py) where the Twister needs 2.5 KB. The
+    quality is more than enough for picking puzzles and letters; it is
+    not for cryptography.
+
+    Seeds are integers, taken modulo 2**64.
+    """
+
+    def seed(self, a=None, version=2):
+        if a is None:
+            a = int.from_bytes(os.urandom(8), 'little')
+        if not isinstance(a, int):
+            raise TypeError('PCG32 seeds must be integers')
+        # Standard PCG seeding: one step from zero, add the seed, one more step
+        self.state = (INCREMENT + (a & MASK64)) & MASK64
+        self.state = (self.state * MULTIPLIER + INCREMENT) & MASK64
+        self.gauss_next = None
+
+    def _next32(self):
+        old        = self.state
+        self.state = (old * MULTIPLIER + INCREMENT) & MASK64
+        xorshifted = (((old >> 18) ^ old) >> 27) & 0xFFFFFFFF
+        rot        = old >> 59
+        return ((xorshifted >> rot) | (xorshifted << (-rot & 31))) & 0xFFFFFFFF
+
+    def getrandbits(self, k):
+        if k <= 32:
+            if k < 0:
+                raise ValueError('number of bits must be non-negative')
+            return self._next32() >> (32 - k) if k else 0
+        words = (k + 31) // 32
+        value = 0
+        for i in range(words):
+            value |= self._next32() << (32 * i)
+        return value >> (32 * words - k)
+
+    def random(self):
+        return self.getrandbits(53) * (1.0 / (1 << 53))
+
+    def getstate(self):
+        return self.state, self.gauss_next
+
+    def setstate(self, state):
+        self.state, self.gauss_next = state
\ No newline at end of file
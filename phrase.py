@@ -1,3 +1,5 @@
+import pygame
+
 from constants import LETTER_SLOT_WIDTH, LETTER_SLOT_HEIGHT, GAP
 from letter import Letter
 
@@ -7,6 +9,10 @@ class Phrase:
     Represents the secret phrase the player is trying to guess.
     Breaks the phrase into lines that fit the screen width, centers
     them vertically, and manages a Letter slot for each non-space character.
+
+    The board is rendered to its own surface the first time it is drawn.
+    After that only the slots revealed by guess() are redrawn onto it, so
+    each frame costs a single blit regardless of phrase length.
     """
 
     def __init__(self, word, font, screen_width, screen_height):
@@ -82,6 +88,16 @@ class Phrase:
                     self.letters.append(Letter(x, y, font))
                     x += LETTER_SLOT_WIDTH + GAP
 
+        # --- Board Surface ---
+        # Covers the bounding box of every slot. Built lazily in draw() so a
+        # phrase that is never shown (e.g. headless play) never renders anything.
+        if self.letters:
+            self.board_rect = self.letters[0].rect.unionall([l.rect for l in self.letters[1:]])
+        else:
+            self.board_rect = pygame.Rect(0, 0, 0, 0)
+        self._board = None
+        self._dirty_slots = []  # Slot indices revealed since the board was last patched
+
     def guess(self, letter):
         """
         Reveal all instances of the guessed letter in the phrase.
@@ -96,15 +112,40 @@ class Phrase:
                 continue
             if char == letter.upper():
                 self.letters[non_space_index].letter = char
+                self._dirty_slots.append(non_space_index)
                 matched = True
             non_space_index += 1
         return matched
 
+    def reveal(self, slot, letter):
+        """Show letter in one slot. Thin clients are sent revealed slots rather than the phrase itself."""
+        self.letters[slot].letter = letter
+        self._dirty_slots.append(slot)
+
     def is_solved(self):
         """Return True if every letter slot has been revealed."""
         return all(letter.letter is not None for letter in self.letters)
 
-    def draw(self, screen):
-        """Draw all letter slots to the screen."""
+    def _build_board(self):
+        """Render every slot onto a fresh transparent board surface."""
+        self._board = pygame.Surface(self.board_rect.size, pygame.SRCALPHA)
         for letter in self.letters:
-            letter.draw(screen)
\ No newline at end of file
+            letter.draw(self._board, self.board_rect.topleft)
+        self._dirty_slots = []
+
+    def _patch_board(self):
+        """Redraw only the slots revealed since the last patch."""
+        origin = self.board_rect.topleft
+        for index in self._dirty_slots:
+            letter = self.letters[index]
+            self._board.fill((0, 0, 0, 0), letter.rect.move(-origin[0], -origin[1]))
+            letter.draw(self._board, origin)
+        self._dirty_slots = []
+
+    def draw(self, screen):
+        """Draw the phrase board to the screen, patching any newly revealed slots first."""
+        if self._board is None:
+            self._build_board()
+        elif self._dirty_slots:
+            self._patch_board()
+        screen.blit(self._board, self.board_rect)
\ No newline at end of file
@@ -1,26 +1,34 @@
 import pygame
 
+from text_layout import wrap_text
+
 
 class Popup:
     """
     Modal overlay shown at the end of a round.
     Displays a win or lose message, the secret phrase, and optionally
-    the player's final streak if they lost. Contains a Play Again button
+    the player's final streak and leaderboard rank if they lost. Contains a Play Again button
     to start the next round.
 
     game_complete=True is used for the special "You Beat the Game!" screen
     shown when the player clears every puzzle in a run. It omits the phrase
     and streak, and the Play Again button resets everything from scratch.
+
+    All content is fixed once the popup is created, so it is composed onto a
+    single surface on first draw (and again only if message changes) and
+    blitted as-is every frame after that.
     """
 
     def __init__(self, message, font, screen_width, screen_height,
-                 phrase='', streak=None, game_complete=False, lost_star_buffer=0,
+                 phrase='', streak=None, rank=None, game_complete=False, lost_star_buffer=0,
                  prestige=False, star_buffer=0, can_prestige=False, prestige_unlock_streak=50):
         self.font = font
         self.small_font = pygame.font.SysFont('Arial', 22)
+        self._surface = None  # Cached composite — built on first draw, rebuilt when message changes
         self.message = message
         self.phrase = phrase
         self.streak = streak
+        self.rank = rank
         self.game_complete = game_complete
         self.lost_star_buffer = lost_star_buffer
         self.prestige = prestige
@@ -33,7 +41,7 @@ class Popup:
         self.max_text_width = popup_width - padding * 2
 
         # Pre-wrap the phrase into lines that fit the popup width
-        self.phrase_lines = self._wrap_text(phrase, self.font, self.max_text_width)
+        self.phrase_lines = wrap_text(phrase, self.font, self.max_text_width)
 
         # Calculate height dynamically based on content
         if prestige:
@@ -45,8 +53,9 @@ class Popup:
         else:
             phrase_height = len(self.phrase_lines) * (self.font.get_height() + 4)
             streak_height = (self.font.get_height() + 10) if streak is not None else 0
+            rank_height = (self.small_font.get_height() + 6) if rank is not None else 0
             buffer_height = (self.font.get_height() + 10) if lost_star_buffer > 0 else 0
-            content_height = 30 + self.font.get_height() + 10 + phrase_height + streak_height + buffer_height + 20
+            content_height = 30 + self.font.get_height() + 10 + phrase_height + streak_height + rank_height + buffer_height + 20
             total_height = max(250, content_height + 63)  # 63 = button height + margins
 
         self.rect = pygame.Rect(0, 0, popup_width, total_height)
@@ -61,32 +70,22 @@ class Popup:
         self.confirm_rect = pygame.Rect(self.rect.centerx + btn_gap // 2,         self.rect.bottom - 15 - btn_h, btn_w, btn_h)
         self.cancel_rect  = pygame.Rect(self.rect.centerx - btn_gap // 2 - btn_w, self.rect.bottom - 15 - btn_h, btn_w, btn_h)
 
-    def _wrap_text(self, text, font, max_width):
-        """Split text into lines that fit within max_width pixels."""
-        if not text:
-            return []
-        words = text.split(' ')
-        lines = []
-        current_line = []
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            if font.size(test_line)[0] <= max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-        if current_line:
-            lines.append(' '.join(current_line))
-        return lines
-
-    def _draw_prestige(self, screen):
+    @property
+    def message(self):
+        return self._message
+
+    @message.setter
+    def message(self, value):
+        self._message = value
+        self._surface = None
+
+    def _draw_prestige(self, screen, box):
         """Draw the prestige popup — locked info or confirm screen depending on can_prestige."""
-        pygame.draw.rect(screen, 'black', self.rect)
-        pygame.draw.rect(screen, 'gold',  self.rect, 2)
+        pygame.draw.rect(screen, 'black', box)
+        pygame.draw.rect(screen, 'gold',  box, 2)
 
-        cx = self.rect.centerx
-        y  = self.rect.top + 24
+        cx = box.centerx
+        y  = box.top + 24
 
         title = self.font.render('PRESTIGE', True, 'gold')
         screen.blit(title, title.get_rect(centerx=cx, top=y))
@@ -117,22 +116,26 @@ class Popup:
             screen.blit(s, s.get_rect(centerx=cx, top=y))
             y += s.get_height() + 6
 
+        confirm_rect = self._local(self.confirm_rect)
+        cancel_rect  = self._local(self.cancel_rect)
+        button_rect  = self._local(self.button_rect)
+
         if self.can_prestige:
             # Yes button
-            pygame.draw.rect(screen, 'black', self.confirm_rect)
-            pygame.draw.rect(screen, 'gold',  self.confirm_rect, 2)
+            pygame.draw.rect(screen, 'black', confirm_rect)
+            pygame.draw.rect(screen, 'gold',  confirm_rect, 2)
             cs = self.font.render('Yes', True, 'gold')
-            screen.blit(cs, cs.get_rect(center=self.confirm_rect.center))
+            screen.blit(cs, cs.get_rect(center=confirm_rect.center))
             # No button
-            pygame.draw.rect(screen, 'black',   self.cancel_rect)
-            pygame.draw.rect(screen, '#666666', self.cancel_rect, 2)
+            pygame.draw.rect(screen, 'black',   cancel_rect)
+            pygame.draw.rect(screen, '#666666', cancel_rect, 2)
             ns = self.font.render('No', True, '#aaaaaa')
-            screen.blit(ns, ns.get_rect(center=self.cancel_rect.center))
+            screen.blit(ns, ns.get_rect(center=cancel_rect.center))
         else:
-            pygame.draw.rect(screen, 'black', self.button_rect)
-            pygame.draw.rect(screen, 'gold',  self.button_rect, 2)
+            pygame.draw.rect(screen, 'black', button_rect)
+            pygame.draw.rect(screen, 'gold',  button_rect, 2)
             cs = self.font.render('Close', True, 'gold')
-            screen.blit(cs, cs.get_rect(center=self.button_rect.center))
+            screen.blit(cs, cs.get_rect(center=button_rect.center))
 
     def handle_click(self, pos):
         """Return True if the Play Again/Close button was clicked, 'confirm' for prestige confirm, 'cancel' for No."""
@@ -144,66 +147,89 @@ class Popup:
         return self.button_rect.collidepoint(pos)
 
     def draw(self, screen):
+        """Blit the popup composite, building it first if needed."""
+        if self._surface is None:
+            self._surface = self._build_surface()
+        screen.blit(self._surface, self.rect)
+
+    def _local(self, rect):
+        """Translate a screen-space rect into the popup surface's coordinates."""
+        return rect.move(-self.rect.left, -self.rect.top)
+
+    def _build_surface(self):
         """
-        Draw the popup box, win/lose message, secret phrase, optional
-        streak count, and the Play Again button.
+        Compose the popup box, win/lose message, secret phrase, optional
+        streak count, and the Play Again button onto one surface.
         """
+        surface = pygame.Surface(self.rect.size)
+        box     = surface.get_rect()
+
         # Background and border
-        pygame.draw.rect(screen, 'black', self.rect)
-        pygame.draw.rect(screen, 'white', self.rect, 2)
+        pygame.draw.rect(surface, 'black', box)
+        pygame.draw.rect(surface, 'white', box, 2)
 
         # Prestige popup — entirely separate layout
         if self.prestige:
-            self._draw_prestige(screen)
-            return
+            self._draw_prestige(surface, box)
+            return surface
 
         # Win/lose/complete message
         msg_color = 'gold' if self.game_complete else 'white' 
         msg_surface = self.font.render(self.message, True, msg_color)
-        msg_rect = msg_surface.get_rect(centerx=self.rect.centerx, top=self.rect.top + 30)
-        screen.blit(msg_surface, msg_rect)
+        msg_rect = msg_surface.get_rect(centerx=box.centerx, top=box.top + 30)
+        surface.blit(msg_surface, msg_rect)
 
         next_top = msg_rect.bottom + 10
 
         if self.game_complete:
             # Congratulatory subtext
             sub_surface = self.small_font.render("You've solved every puzzle. Consider going outside...", True, 'green')
-            sub_rect = sub_surface.get_rect(centerx=self.rect.centerx, top=next_top)
-            screen.blit(sub_surface, sub_rect)
+            sub_rect = sub_surface.get_rect(centerx=box.centerx, top=next_top)
+            surface.blit(sub_surface, sub_rect)
 
             if self.streak is not None:
                 streak_surface = self.font.render(f'Streak: {self.streak}', True, 'white')
-                streak_rect = streak_surface.get_rect(centerx=self.rect.centerx,
+                streak_rect = streak_surface.get_rect(centerx=box.centerx,
                                                       top=next_top + 40)
-                screen.blit(streak_surface, streak_rect)
+                surface.blit(streak_surface, streak_rect)
 
         else:
             # Secret phrase shown in grey below the message, wrapped to fit
             y = next_top
             for line in self.phrase_lines:
                 line_surface = self.font.render(line, True, 'grey')
-                line_rect = line_surface.get_rect(centerx=self.rect.centerx, top=y)
-                screen.blit(line_surface, line_rect)
+                line_rect = line_surface.get_rect(centerx=box.centerx, top=y)
+                surface.blit(line_surface, line_rect)
                 y += self.font.get_height() + 4
 
             # Final streak count
             if self.streak is not None:
                 streak_surface = self.font.render(f'Streak: {self.streak}', True, 'white')
-                streak_rect = streak_surface.get_rect(centerx=self.rect.centerx, top=y + 6)
-                screen.blit(streak_surface, streak_rect)
+                streak_rect = streak_surface.get_rect(centerx=box.centerx, top=y + 6)
+                surface.blit(streak_surface, streak_rect)
                 y = streak_rect.bottom + 6
 
+            # Where this run placed among every recorded run
+            if self.rank is not None:
+                rank_surface = self.small_font.render(f'You ranked #{self.rank:,}', True, '#aaaaaa')
+                rank_rect = rank_surface.get_rect(centerx=box.centerx, top=y)
+                surface.blit(rank_surface, rank_rect)
+                y = rank_rect.bottom + 6
+
             # Lost star buffer warning
             if self.lost_star_buffer > 0:
                 star_label = f'Stars lost: {self.lost_star_buffer}'
                 star_surface = self.font.render(star_label, True, 'gold')
-                star_rect = star_surface.get_rect(centerx=self.rect.centerx, top=y + 6)
-                screen.blit(star_surface, star_rect)
+                star_rect = star_surface.get_rect(centerx=box.centerx, top=y + 6)
+                surface.blit(star_surface, star_rect)
 
         # Play Again button
-        pygame.draw.rect(screen, 'black', self.button_rect)
-        pygame.draw.rect(screen, 'white', self.button_rect, 2)
+        button_rect = self._local(self.button_rect)
+        pygame.draw.rect(surface, 'black', button_rect)
+        pygame.draw.rect(surface, 'white', button_rect, 2)
         btn_label = 'New Game' if self.game_complete else 'Play Again'
         btn_surface = self.font.render(btn_label, True, 'white')
-        btn_rect = btn_surface.get_rect(center=self.button_rect.center)
-        screen.blit(btn_surface, btn_rect)
\ No newline at end of file
+        btn_rect = btn_surface.get_rect(center=button_rect.center)
+        surface.blit(btn_surface, btn_rect)
+
+        return surface
\ No newline at end of file
@@ -0,0 +1,63 @@
+import cProfile
+import io
+import os
+import pstats
+import time
+
+
+class FrameProfiler:
+    """
+    Profiles a fixed number of main loop frames with cProfile, then writes
+    a .prof file (for snakeviz, pstats, etc.) and a plain-text summary of the
+    top functions. Meant for players to capture a profile on their own
+    machine and send both files back.
+
+    start() begins a capture; call frame_end() once at the end of every
+    frame. The capture stops by itself after frames frames. The standard
+    library has no sampling profiler, so this uses cProfile, which slows
+    the captured frames down somewhat.
+    """
+
+    def __init__(self, out_dir, frames=300, top=40):
+        self.out_dir = out_dir
+        self.frames  = frames
+        self.top     = top
+        self._profile   = None
+        self._remaining = 0
+
+    @property
+    def active(self):
+        return self._profile is not None
+
+    def start(self):
+        """Begin a capture. Ignored if one is already running."""
+        if self.active:
+            return
+        self._profile   = cProfile.Profile()
+        self._remaining = self.frames
+        self._profile.enable()
+
+    def frame_end(self):
+        """Count a finished frame. Returns the written .prof path when the capture completes, else None."""
+        if not self.active:
+            return None
+        self._remaining -= 1
+        if self._remaining > 0:
+            return None
+        self._profile.disable()
+        profile, self._profile = self._profile, None
+        return self._write(profile)
+
+    def _write(self, profile):
+        os.makedirs(self.out_dir, exist_ok=True)
+        base = os.path.join(self.out_dir, time.strftime('profile-%Y%m%d-%H%M%S'))
+        profile.dump_stats(base + '.prof')
+
+        summary = io.StringIO()
+        summary.write(f'{self.frames} frames\n\n')
+        stats = pstats.Stats(profile, stream=summary).strip_dirs()
+        stats.sort_stats('cumulative').print_stats(self.top)
+        stats.sort_stats('tottime').print_stats(self.top)
+        with open(base + '.txt', 'w') as f:
+            f.write(summary.getvalue())
+        return base + '.prof'
\ No newline at end of file
@@ -0,0 +1,201 @@
+import json
+import socket
+
+from alphabet import Alphabet
+from constants import SCREEN_SIZE
+from phrase import Phrase
+from shop_items import CONSUMABLES
+from strikes import Strikes
+from topic import Topic
+
+
+class RemoteError(RuntimeError):
+    """The server refused a request."""
+
+
+def _field(name):
+    """Read-only attribute backed by a field of the mirrored session state."""
+    return property(lambda self: self.state[name])
+
+
+class RemoteGame:
+    """
+    Thin-client stand-in for GameManager. The rules run in a server.py
+    session; this mirrors that session's state and exposes it under
+    GameManager's attribute names, so Score, MenuBar and Shop read it
+    unchanged and draw() renders it with the usual Phrase, Alphabet,
+    Strikes and Topic widgets.
+
+    The session is opened in delta mode: after the first full state, each
+    response carries only what changed (see session.state_delta). For a
+    guess that is usually the revealed slots and the letter, plus the strike
+    count or money when those move. Requests are synchronous, so each action
+    waits for its reply inside the frame that made it.
+
+    The hidden phrase only arrives once a round has ended. Until then the
+    board is laid out from the masked board string, which has the same
+    shape as the phrase, and filled in slot by slot.
+    """
+
+    def __init__(self, font, shop, sock, seed=None):
+        self.font  = font
+        self.shop  = shop
+        self._sock = sock
+        self._file = sock.makefile('rwb')
+
+        self.responses      = 0
+        self.bytes_received = 0
+
+        self.version = 0
+        self.state   = {}     # Mirror of the session state; board and guessed as of round start (see phrase, alphabet)
+        self.phrase  = None
+        self.alphabet = None
+        self.strikes = None
+        self.topic   = None
+        self.purchased_upgrades   = set()
+        self.prestige_owned       = set()
+        self.solved_by_consumable = False
+        self._remote_derived      = {}  # {derived() name: value} for values only the server can compute
+
+        shop.purchase_handler = self.buy
+        self.seed = self._request('new', seed=seed, deltas=True)
+
+    @classmethod
+    def connect(cls, font, shop, host='127.0.0.1', port=7777, unix=None, seed=None):
+        if unix:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(unix)
+        else:
+            sock = socket.create_connection((host, port))
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # Requests are tiny and latency-bound
+        return cls(font, shop, sock, seed)
+
+    def close(self):
+        self._file.close()
+        self._sock.close()
+
+    # --- Mirrored state ---
+
+    streak_count           = _field('streak')
+    money                  = _field('money')
+    stars                  = _field('stars')
+    star_buffer            = _field('star_buffer')
+    stars_display_unlocked = _field('stars_shown')
+    can_prestige           = _field('can_prestige')
+    prestige_count         = _field('prestige_count')
+    bonus_strikes          = _field('bonus_strikes')
+    free_guess_active      = _field('free_guess')
+    star_streak_discounts  = _field('discounts')
+    consumable_purchases   = _field('consumables')
+
+    @property
+    def old_man_unlocked(self):
+        return 'old_man' in self.prestige_owned
+
+    def mark_changed(self):
+        self.version += 1
+
+    def derived(self, name, compute):
+        """Same contract as GameManager.derived; values that depend on the hidden phrase come from the server."""
+        if name in self._remote_derived:
+            return self._remote_derived[name]
+        return compute()
+
+    # --- Actions ---
+
+    def guess(self, letter):
+        return self._request('guess', letter=letter)
+
+    def win(self):
+        self._request('dismiss')
+        return self.state['pending'] is None
+
+    def lose(self):
+        self._request('dismiss')
+        self.shop.reset()
+
+    def prestige(self):
+        self._request('prestige')
+        self.shop.reset()
+
+    def buy(self, item_id):
+        bought = self._request('buy', item=item_id)
+        if self.state['pending'] == 'won':
+            self.solved_by_consumable = True
+        return bought
+
+    # --- Protocol ---
+
+    def _request(self, op, **args):
+        self._file.write(json.dumps({'op': op, **args}, separators=(',', ':')).encode() + b'\n')
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError('server closed the connection')
+        self.responses      += 1
+        self.bytes_received += len(line)
+
+        response = json.loads(line)
+        if not response['ok']:
+            raise RemoteError(response['error'])
+        if 'state' in response:
+            self.state = response['state']
+            self._start_round()
+        else:
+            self._apply_delta(response['delta'])
+        self._sync()
+        return response['result']
+
+    def _apply_delta(self, delta):
+        if 'round' in delta:
+            self.state.update(delta)
+            self._start_round()
+            return
+
+        for letter, slots in delta.pop('reveal', {}).items():
+            for slot in slots:
+                self.phrase.reveal(slot, letter)
+        for letter in delta.pop('guessed', ''):
+            self.alphabet.guess(letter)
+        self.state.update(delta)
+        if 'strikes' in delta:
+            self.strikes.count = delta['strikes']
+
+    def _start_round(self):
+        """Rebuild the round widgets from the mirrored state, as GameManager._start_round does from a puzzle."""
+        board = self.state['board']
+        self.phrase = Phrase(board, self.font, *SCREEN_SIZE)
+        for slot, char in enumerate(c for c in board if c != ' '):
+            if char != '_':
+                self.phrase.reveal(slot, char)
+
+        self.alphabet = Alphabet(self.font, *SCREEN_SIZE)
+        for letter in self.state['guessed']:
+            self.alphabet.guess(letter)
+
+        self.strikes = Strikes(self.font, SCREEN_SIZE[0], self.state['max_strikes'])
+        self.strikes.count = self.state['strikes']
+
+        self.topic = Topic(self.state['category'], self.font, *SCREEN_SIZE)
+        if self.phrase.letters:
+            self.topic.update_position(max(letter.rect.bottom for letter in self.phrase.letters))
+
+    def _sync(self):
+        """Refresh values derived from the mirrored state after every response."""
+        state = self.state
+        if state['phrase']:
+            self.phrase.word = state['phrase']  # Round over — the popup shows the answer
+        self.purchased_upgrades = set(state['upgrades'])
+        self.prestige_owned     = set(state['prestige_owned'])
+        self._remote_derived    = {('consumable_disabled', c['id']): c['id'] in state['disabled']
+                                   for c in CONSUMABLES}
+        self.mark_changed()
+
+    # --- Draw ---
+
+    def draw(self, screen):
+        """Draw all round objects."""
+        self.phrase.draw(screen)
+        self.alphabet.draw(screen)
+        self.strikes.draw(screen, self.bonus_strikes, self.free_guess_active)
+        self.topic.draw(screen)
\ No newline at end of file
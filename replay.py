@@ -0,0 +1,192 @@
+import struct
+import time
+
+from shop_items import UPGRADES, CONSUMABLES, PRESTIGE_ITEMS
+
+
+# ---------------------------------------------------------------------------
+# Replay file format
+# ---------------------------------------------------------------------------
+#
+#   header   4s   MAGIC
+#            B    VERSION
+#            Q    GameManager seed (little-endian)
+#   tuned    varint  count of puzzles with a difficulty tuned from play
+#            per puzzle: varint gap from the previous puzzle index, then
+#            varint scale in live_difficulty.SCALE_STEPS
+#   events   varint  milliseconds since the previous event
+#            B       opcode << 5 | payload
+#
+# Every state-changing input fits in one byte: a 3-bit opcode plus a 5-bit
+# payload (letter index or index into the matching item list), so a typical
+# event costs two bytes and a whole run is a few hundred bytes.
+# ---------------------------------------------------------------------------
+
+MAGIC   = b'WGRP'
+VERSION = 3   # 3: tuned difficulties, which decide the pools; v2 is read as having none
+HEADER  = struct.Struct('<4sBQ')
+
+# Opcodes
+GUESS            = 0  # payload: letter index, A=0
+BUY_UPGRADE      = 1  # payload: index into UPGRADES
+BUY_CONSUMABLE   = 2  # payload: index into CONSUMABLES
+BUY_PRESTIGE     = 3  # payload: index into PRESTIGE_ITEMS
+DISMISS          = 4  # win/lose/game-complete popup closed
+PRESTIGE_CONFIRM = 5  # prestige popup confirmed
+DEBUG_BOOST      = 6  # debug button: +10,000 money, +9 streak
+
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Purchase opcode for each shop item list
+PURCHASE_OPS = (
+    (BUY_UPGRADE,    UPGRADES),
+    (BUY_CONSUMABLE, CONSUMABLES),
+    (BUY_PRESTIGE,   PRESTIGE_ITEMS),
+)
+
+
+def purchase_event(item_id, item_list):
+    """Return the (opcode, payload) pair recording a purchase of item_id from item_list."""
+    for op, items in PURCHASE_OPS:
+        if items is item_list:
+            index = next(i for i, item in enumerate(items) if item['id'] == item_id)
+            return op, index
+    raise ValueError(f'Unknown item list for {item_id!r}')
+
+
+def purchase_item(op, payload):
+    """Inverse of purchase_event — return (item_id, item_list) for a purchase opcode."""
+    for purchase_op, items in PURCHASE_OPS:
+        if purchase_op == op:
+            return items[payload]['id'], items
+    raise ValueError(f'Not a purchase opcode: {op}')
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class ReplayRecorder:
+    """
+    Collects state-changing inputs as they happen and encodes them into the
+    compact replay format. Timestamps are taken from a monotonic clock so
+    playback can reproduce the original pacing.
+    """
+
+    def __init__(self, seed, tuned=None):
+        self.seed    = seed
+        self.tuned   = tuned or {}   # {puzzle index: scale} the game was pooled with
+        self._events = bytearray()
+        self._last   = time.monotonic()
+
+    def record(self, op, payload=0):
+        """Append one event with the time elapsed since the previous one."""
+        now        = time.monotonic()
+        delta      = max(0, round((now - self._last) * 1000))
+        self._last = now
+        _write_varint(self._events, delta)
+        self._events.append(op << 5 | payload)
+
+    def to_bytes(self):
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.seed))
+        _write_varint(out, len(self.tuned))
+        previous = 0
+        for index in sorted(self.tuned):
+            _write_varint(out, index - previous)
+            _write_varint(out, self.tuned[index])
+            previous = index
+        return bytes(out + self._events)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+
+def decode(data):
+    """
+    Decode replay bytes into (seed, tuned, events): tuned is {puzzle index:
+    scale} for live_difficulty.tuned_difficulties
+    and events is a list of (time_ms, opcode, payload) with time_ms measured
+    from the start of the recording.
+    """
+    magic, version, seed = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError('Not a replay file')
+    if version not in (2, VERSION):
+        raise ValueError(f'Unsupported replay version {version}')
+
+    tuned = {}
+    pos   = HEADER.size
+    if version >= 3:
+        count, pos = _read_varint(data, pos)
+        index = 0
+        for _ in range(count):
+            gap, pos = _read_varint(data, pos)
+            index += gap
+            tuned[index], pos = _read_varint(data, pos)
+
+    events = []
+    t      = 0
+    while pos < len(data):
+        delta, pos = _read_varint(data, pos)
+        byte = data[pos]
+        pos += 1
+        t += delta
+        events.append((t, byte >> 5, byte & 0x1F))
+    return seed, tuned, events
+
+
+def load(path):
+    """Read a replay file from disk and decode it."""
+    with open(path, 'rb') as f:
+        return decode(f.read())
+
+
+class ReplayPlayer:
+    """
+    Feeds recorded events back in order.
+
+    Real-speed playback releases every event whose timestamp has passed on
+    the playback clock. Uncapped playback ignores timestamps and releases one
+    event per call so the frame loop can run as fast as it likes.
+    """
+
+    def __init__(self, events, uncapped=False):
+        self.events   = events
+        self.uncapped = uncapped
+        self._index   = 0
+        self._start   = time.monotonic()
+
+    @property
+    def finished(self):
+        return self._index >= len(self.events)
+
+    def due(self):
+        """Return the (opcode, payload) pairs that should be applied this frame."""
+        if self.finished:
+            return []
+        if self.uncapped:
+            _, op, payload = self.events[self._index]
+            self._index += 1
+            return [(op, payload)]
+        elapsed = (time.monotonic() - self._start) * 1000
+        due = []
+        while not self.finished and self.events[self._index][0] <= elapsed:
+            _, op, payload = self.events[self._index]
+            due.append((op, payload))
+            self._index += 1
+        return due
\ No newline at end of file
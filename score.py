@@ -17,24 +17,37 @@ class Score:
         # Measure the widest label once so numbers always line up in a fixed column.
         self._value_x = font.size('STREAK  ')[0] + 20
 
-    def draw(self, screen):
-        """Draw streak, money, and optionally the star row."""
-        if not self.manager:
-            return
+        # Rendered (surface, pos) pairs, rebuilt only when manager.version changes
+        self._blits   = []
+        self._version = None
+
+    def _build_blits(self):
+        """Render the streak, money, and star rows for the current state."""
         vx = self._value_x
         m  = self.manager
 
-        screen.blit(self.font.render('STREAK', True, 'white'), (20, 20))
-        screen.blit(self.font.render(str(m.streak_count), True, 'white'), (vx, 20))
-
-        screen.blit(self.font.render('MONEY', True, 'green'), (20, 60))
-        screen.blit(self.font.render(str(m.money), True, 'green'), (vx, 60))
+        blits = [
+            (self.font.render('STREAK', True, 'white'), (20, 20)),
+            (self.font.render(str(m.streak_count), True, 'white'), (vx, 20)),
+            (self.font.render('MONEY', True, 'green'), (20, 60)),
+            (self.font.render(str(m.money), True, 'green'), (vx, 60)),
+        ]
 
         # Stars row appears once the first milestone is reached and never hides again.
         # Shows spendable stars and, if any are pending in the buffer, a (+n) indicator.
         if m.stars_display_unlocked:
-            screen.blit(self.font.render('STARS', True, 'gold'), (20, 100))
+            blits.append((self.font.render('STARS', True, 'gold'), (20, 100)))
             star_text = str(m.stars)
             if m.star_buffer > 0:
                 star_text += f' (+{m.star_buffer})'
-            screen.blit(self.font.render(star_text, True, 'gold'), (vx, 100))
\ No newline at end of file
+            blits.append((self.font.render(star_text, True, 'gold'), (vx, 100)))
+        return blits
+
+    def draw(self, screen):
+        """Draw streak, money, and optionally the star row."""
+        if not self.manager:
+            return
+        if self._version != self.manager.version:
+            self._blits   = self._build_blits()
+            self._version = self.manager.version
+        screen.blits(self._blits, doreturn=False)
\ No newline at end of file
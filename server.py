@@ -0,0 +1,233 @@
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional — the default event loop works, just slower
+    uvloop = None
+
+from game_manager import MAX_SEED
+from session import SessionError
+from session_store import SessionStore, DEFAULT_MAX_LIVE, DEFAULT_IDLE_SECONDS
+
+
+# Longest request line accepted; anything longer drops the connection
+MAX_LINE = 4096
+
+# Flush to the socket once this much output is queued, instead of after every reply
+WRITE_HIGH_WATER = 64 * 1024
+
+
+class GameServer:
+    """
+    Headless multi-session server. Every connection gets its own GameSession,
+    created on its first request, and all sessions share one asyncio loop.
+
+    Protocol: newline-delimited JSON, one request per line, one response line
+    per request, in order. A request's id, if it has one, is echoed back.
+      → {"id": 1, "op": "guess", "letter": "E"}
+      ← {"id": 1, "ok": true, "result": "correct", "state": {...}}
+      ← {"id": 1, "ok": false, "error": "E already guessed"}
+
+    Ops: new (optional "seed" — starts a fresh game), state, guess (letter),
+    buy (item), dismiss, prestige. See GameSession for what each returns.
+    stats is answered by the server itself and needs no session.
+
+    new with "deltas": true makes later responses carry "delta" — only what
+    changed — instead of the full "state"; see session.state_delta.
+
+    corpus, if given, is the puzzle Corpus every session plays from (shard
+    workers pass the shared one); otherwise sessions use the built-in set.
+
+    Sessions live in a SessionStore: a connection only holds its session's
+    key, and sessions idle for idle_seconds, or beyond max_live, are
+    hibernated to disk until their next request.
+    """
+
+    def __init__(self, corpus=None, max_live=DEFAULT_MAX_LIVE, idle_seconds=DEFAULT_IDLE_SECONDS):
+        self.corpus      = corpus
+        self.store       = SessionStore(corpus, max_live=max_live, idle_seconds=idle_seconds)
+        self.connections = 0
+        self.requests    = 0
+
+    def close(self):
+        self.store.close()
+
+    async def serve_tcp(self, host, port):
+        server = await asyncio.start_server(self._handle_connection, host, port, limit=MAX_LINE)
+        async with server:
+            await asyncio.gather(server.serve_forever(), self.sweep_idle())
+
+    async def serve_unix(self, path):
+        server = await asyncio.start_unix_server(self._handle_connection, path, limit=MAX_LINE)
+        async with server:
+            await asyncio.gather(server.serve_forever(), self.sweep_idle())
+
+    async def sweep_idle(self):
+        """Hibernate idle sessions, checking a few times per idle period, forever."""
+        while True:
+            await asyncio.sleep(self.store.idle_seconds / 4)
+            try:
+                self.store.sweep()
+            except Exception as e:  # A failed sweep leaves sessions live; it mustn't stop the server
+                print(f'Idle sweep failed: {e!r}', file=sys.stderr)
+
+    async def serve_socket(self, sock):
+        """Serve one already-accepted connection, as handed to a shard worker by the supervisor."""
+        reader, writer = await asyncio.open_connection(sock=sock, limit=MAX_LINE)
+        await self._handle_connection(reader, writer)
+
+    async def _handle_connection(self, reader, writer):
+        self.connections += 1
+        key = None
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError, ConnectionError):
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+
+                response, key = self._respond(line, key)
+                if response['id'] is None:
+                    del response['id']  # Thin clients skip ids; this keeps their replies short
+                writer.write(json.dumps(response, separators=(',', ':')).encode() + b'\n')
+                if writer.transport.get_write_buffer_size() > WRITE_HIGH_WATER:
+                    await writer.drain()
+        finally:
+            self.connections -= 1
+            if key is not None:
+                self.store.discard(key)
+            writer.close()
+
+    def _respond(self, line, key):
+        """Decode and apply one request line. Returns (response dict, session key for the connection)."""
+        self.requests += 1
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise SessionError('request must be a JSON object')
+            request_id = request.get('id')
+
+            if request.get('op') == 'stats':
+                return {'id': request_id, 'ok': True, 'result': self.stats()}, key
+
+            if request.get('op') == 'new':
+                seed = request.get('seed')
+                if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)
+                                         or not 0 <= seed <= MAX_SEED):
+                    raise SessionError('seed must be an integer from 0 to 2**64 - 1')
+                if key is not None:
+                    self.store.discard(key)
+                key, session = self.store.create(seed, deltas=bool(request.get('deltas')))
+                body = {'result': session.manager.seed, **session.view(full=True)}
+            else:
+                if key is None:
+                    key, session = self.store.create()
+                else:
+                    session = self.store.get(key)
+                body = session.handle(request)
+            return {'id': request_id, 'ok': True, **body}, key
+
+        except (SessionError, json.JSONDecodeError, UnicodeDecodeError) as e:
+            return {'id': request_id, 'ok': False, 'error': str(e)}, key
+        except Exception as e:  # A bug one request trips over mustn't cost the player their connection
+            print(f'Request {line[:200]!r} failed: {e!r}', file=sys.stderr)
+            return {'id': request_id, 'ok': False, 'error': 'internal error'}, key
+
+    def stats(self):
+        """Server-wide counters for load testing; rss_kb may be None on platforms without resource."""
+        return {
+            'connections': self.connections,
+            'sessions':    len(self.store),
+            'live':        self.store.live,
+            'hibernated':  self.store.hibernated,
+            'requests':    self.requests,
+            'pid':         os.getpid(),
+            'rss_kb':      rss_kb(),
+        }
+
+
+def rss_kb():
+    """Resident set size of this process in KiB, or the peak RSS where the current one isn't available."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak   # macOS reports bytes
+
+
+def raise_open_file_limit():
+    """Lift the soft open-file limit to the hard limit so one process can hold 10k+ sockets."""
+    try:
+        import resource
+    except ImportError:  # Not available on Windows, where the limit works differently
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Host headless game sessions over TCP or a Unix socket')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7777)
+    parser.add_argument('--unix', metavar='PATH', default=None, help='Listen on a Unix socket instead of TCP')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes to spread sessions over (Unix only, see shards.py)')
+    parser.add_argument('--max-live', type=int, default=DEFAULT_MAX_LIVE,
+                        help='Sessions kept in memory per process; the least recently used are hibernated to disk')
+    parser.add_argument('--idle-seconds', type=float, default=DEFAULT_IDLE_SECONDS,
+                        help='Hibernate sessions after this long without a request')
+    args = parser.parse_args()
+
+    raise_open_file_limit()
+    if args.unix and os.path.exists(args.unix):
+        os.remove(args.unix)
+
+    if args.workers > 1:
+        from shards import ShardSupervisor
+        signal.signal(signal.SIGTERM, signal.default_int_handler)  # Shut workers down and clean up on kill too
+        try:
+            supervisor = ShardSupervisor(args.workers, args.max_live, args.idle_seconds)
+        except RuntimeError as e:
+            parser.error(str(e))
+        supervisor.start()
+        try:
+            if args.unix:
+                supervisor.serve_unix(args.unix)
+            else:
+                supervisor.serve_tcp(args.host, args.port)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            supervisor.stop()
+    else:
+        if uvloop:
+            uvloop.install()
+        server = GameServer(max_live=args.max_live, idle_seconds=args.idle_seconds)
+        try:
+            if args.unix:
+                asyncio.run(server.serve_unix(args.unix))
+            else:
+                asyncio.run(server.serve_tcp(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
\ No newline at end of file
@@ -0,0 +1,234 @@
+import struct
+
+import snapshot
+from constants import SCREEN_SIZE
+from game_manager import GameManager
+from shop import Shop
+from shop_items import UPGRADES, CONSUMABLES, PRESTIGE_ITEMS
+
+
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# item id → the list it belongs to, for routing 'buy' requests
+ITEM_LISTS = {item['id']: items for items in (UPGRADES, CONSUMABLES, PRESTIGE_ITEMS) for item in items}
+
+# State fields a delta always carries when a new round starts, even if unchanged
+ROUND_FIELDS = ('round', 'board', 'category', 'guessed', 'strikes', 'max_strikes')
+
+# Saved session: pending outcome (index into PENDING), flags (bit 0 deltas,
+# bit 1 synced), round count — then a snapshot.dump of the manager
+PENDING        = (None, 'won', 'lost', 'complete')
+SESSION_HEADER = struct.Struct('<BBI')
+
+
+class SessionError(ValueError):
+    """A request the session can't carry out — bad arguments or the wrong moment. Sent back as an error."""
+
+
+class GameSession:
+    """
+    One player's headless game for the server: a GameManager and Shop driven
+    the way main.py drives them. The win/lose popup becomes self.pending
+    ('won', 'lost' or 'complete'); while it is set only dismiss() is allowed,
+    and dismissing calls win() or lose() exactly like closing the popup.
+
+    Every public method returns a small result value; state() is the view a
+    client needs to draw the game, and never reveals unguessed letters until
+    the round has ended.
+
+    With deltas set, view() sends a full state once and after that only
+    what changed since the last view (see state_delta), for thin clients
+    that keep their own copy of the state.
+    """
+
+    def __init__(self, seed=None, corpus=None, deltas=False):
+        self.shop    = Shop(None, *SCREEN_SIZE)
+        self.manager = GameManager(None, self.shop, seed=seed, corpus=corpus)
+        self.shop.manager = self.manager
+        self.pending = None
+        self.round   = 0       # Counts rounds started, so clients can tell a new puzzle from the same one
+        self.deltas  = deltas
+        self._synced = None    # Last state a delta client was sent
+
+    # --- Actions ---
+
+    def guess(self, letter):
+        """Guess a letter. Returns the GameManager.guess result."""
+        if self.pending:
+            raise SessionError('round is over — dismiss first')
+        if not isinstance(letter, str) or len(letter) != 1 or letter.upper() not in ALPHABET:
+            raise SessionError('letter must be a single A-Z character')
+        letter = letter.upper()
+        if letter in self.manager.alphabet.guessed:
+            raise SessionError(f'{letter} already guessed')
+
+        result = self.manager.guess(letter)
+        if result == 'solved':
+            self.pending = 'won'
+        elif result == 'game_over':
+            self.pending = 'lost'
+        return result
+
+    def buy(self, item_id):
+        """Buy an upgrade, consumable or prestige item by id. Returns True if the purchase went through."""
+        if self.pending:
+            raise SessionError('round is over — dismiss first')
+        if not isinstance(item_id, str):
+            raise SessionError('item must be a string id')
+        item_list = ITEM_LISTS.get(item_id)
+        if item_list is None:
+            raise SessionError(f'unknown item {item_id!r}')
+
+        if item_list is CONSUMABLES:
+            bought = self.shop._try_purchase_consumable(item_id)
+            if self.manager.solved_by_consumable:
+                self.manager.solved_by_consumable = False
+                self.pending = 'won'
+            return bought
+        return self.shop._try_purchase_item(item_id, item_list)
+
+    def dismiss(self):
+        """Close the round-end popup. Returns the outcome that was dismissed."""
+        outcome = self.pending
+        if outcome == 'won':
+            self.pending = None if self.manager.win() else 'complete'
+        elif outcome in ('lost', 'complete'):
+            self.pending = None
+            self.manager.lose()
+        else:
+            raise SessionError('nothing to dismiss')
+        if self.pending is None:
+            self.round += 1
+        return outcome
+
+    def prestige(self):
+        """Cash in buffered stars and start a new run. Returns the stars gained."""
+        if self.pending:
+            raise SessionError('round is over — dismiss first')
+        if not self.manager.can_prestige:
+            raise SessionError('prestige not available yet')
+        gained = self.manager.star_buffer
+        self.manager.prestige()
+        self.round += 1
+        return gained
+
+    # --- View ---
+
+    def state(self):
+        m       = self.manager
+        guessed = m.alphabet.guessed
+        return {
+            'version':        m.version,
+            'round':          self.round,
+            'board':          ''.join(c if c == ' ' or c in guessed else '_' for c in m.phrase.word),
+            'category':       m.topic.topic,
+            'guessed':        ''.join(sorted(guessed)),
+            'phrase':         m.phrase.word if self.pending else None,
+            'pending':        self.pending,
+            'strikes':        m.strikes.count,
+            'max_strikes':    m.strikes.max_strikes,
+            'bonus_strikes':  m.bonus_strikes,
+            'free_guess':     m.free_guess_active,
+            'streak':         m.streak_count,
+            'money':          m.money,
+            'stars':          m.stars,
+            'star_buffer':    m.star_buffer,
+            'stars_shown':    m.stars_display_unlocked,
+            'can_prestige':   m.can_prestige,
+            'prestige_count': m.prestige_count,
+            'upgrades':       sorted(m.purchased_upgrades),
+            'consumables':    dict(m.consumable_purchases),
+            'prestige_owned': sorted(m.prestige_owned),
+            'discounts':      m.star_streak_discounts,
+            # Availability depends on the hidden phrase, so clients can't work it out themselves
+            'disabled':       [c['id'] for c in CONSUMABLES if self.shop._is_consumable_disabled(c['id'])],
+        }
+
+    def view(self, full=False):
+        """
+        The state part of a response: {'state': full state}, or for a delta
+        session that has already been sent one, {'delta': changes}. full
+        forces a full state and restarts the deltas from it.
+        """
+        state = self.state()
+        if not self.deltas:
+            return {'state': state}
+        synced, self._synced = self._synced, state
+        if full or synced is None:
+            return {'state': state}
+        return {'delta': state_delta(synced, state)}
+
+    # --- Protocol ---
+
+    def handle(self, request):
+        """
+        Apply one decoded protocol request and return the response body:
+        {'result': ..., 'state': {...}}. Raises SessionError for bad requests.
+        """
+        op = request.get('op')
+        if op == 'guess':
+            result = self.guess(request.get('letter'))
+        elif op == 'buy':
+            result = self.buy(request.get('item'))
+        elif op == 'dismiss':
+            result = self.dismiss()
+        elif op == 'prestige':
+            result = self.prestige()
+        elif op == 'state':
+            return {'result': None, **self.view(full=True)}
+        else:
+            raise SessionError(f'unknown op {op!r}')
+        return {'result': result, **self.view()}
+
+    # --- Saving ---
+
+    def dump(self):
+        """Return the whole session as bytes, for session_store to hibernate."""
+        flags = self.deltas | (self._synced is not None) << 1
+        return SESSION_HEADER.pack(PENDING.index(self.pending), flags, self.round) + snapshot.dump(self.manager)
+
+    @classmethod
+    def restore(cls, data, corpus=None):
+        """
+        Rebuild a session from dump() bytes. A delta client's last sent
+        state isn't stored: every request ends by sending the current
+        state, so it is recomputed from the restored game.
+        """
+        pending, flags, round_count = SESSION_HEADER.unpack_from(data)
+        session = cls.__new__(cls)
+        session.shop    = Shop(None, *SCREEN_SIZE)
+        session.manager = snapshot.restore(data[SESSION_HEADER.size:], None, session.shop, corpus)
+        session.shop.manager = session.manager
+        session.pending = PENDING[pending]
+        session.round   = round_count
+        session.deltas  = bool(flags & 1)
+        session._synced = session.state() if flags & 2 else None
+        return session
+
+
+def state_delta(old, new):
+    """
+    The changes from state old to state new, as sent to delta clients.
+
+    Fields that changed are sent with their new value, except within a
+    round, where the board becomes 'reveal' ({letter: [slot, ...]}, slots
+    counting letters only) and 'guessed' holds only the newly guessed
+    letters. When a new round starts, every field in ROUND_FIELDS is sent
+    in full. version is left out — it changes on every action.
+    """
+    delta = {k: v for k, v in new.items() if k != 'version' and old[k] != v}
+    if new['round'] != old['round']:
+        delta.update((k, new[k]) for k in ROUND_FIELDS)
+        return delta
+
+    if 'board' in delta:
+        reveal = {}
+        slots  = [(a, b) for a, b in zip(old['board'], new['board']) if b != ' ']
+        for slot, (before, after) in enumerate(slots):
+            if before != after:
+                reveal.setdefault(after, []).append(slot)
+        del delta['board']
+        delta['reveal'] = reveal
+    if 'guessed' in delta:
+        delta['guessed'] = ''.join(c for c in new['guessed'] if c not in old['guessed'])
+    return delta
\ No newline at end of file
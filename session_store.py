@@ -0,0 +1,153 @@
+import itertools
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+
+from session import GameSession
+
+
+# Live sessions kept in memory before the least recently used are hibernated
+DEFAULT_MAX_LIVE = 2000
+
+# Seconds without a request before a session is hibernated
+DEFAULT_IDLE_SECONDS = 60.0
+
+# Over budget, hibernate down to this fraction of max_live in one batch, so
+# a busy store writes in batches rather than once per request
+LOW_WATER = 0.9
+
+
+class SessionStore:
+    """
+    Holds a server's GameSessions by key. Recently used sessions stay live;
+    sessions that go idle_seconds without a request, or the least recently
+    used ones once more than max_live are live, are hibernated: saved with
+    GameSession.dump (a few hundred bytes) into an SQLite table and dropped
+    from memory. get() rehydrates a hibernated session transparently, so
+    memory follows the number of active players rather than connected ones.
+
+    The table is scratch space, not a save file — sessions still end with
+    their connection, and without a path the database is a temporary file
+    removed by close(). Durability is switched off to keep writes cheap.
+
+    Idle sessions are only hibernated when sweep() runs; the server calls it
+    periodically. The live budget is enforced on every create() and get().
+    """
+
+    def __init__(self, corpus=None, path=None, max_live=DEFAULT_MAX_LIVE, idle_seconds=DEFAULT_IDLE_SECONDS):
+        if max_live < 1:
+            raise ValueError('max_live must be at least 1')
+        self.corpus       = corpus
+        self.max_live     = max_live
+        self.idle_seconds = idle_seconds
+        self.hibernations = 0
+        self.rehydrations = 0
+        self._live        = OrderedDict()  # {key: (session, last used)}, least recently used first
+        self._hibernated  = 0
+        self._keys        = itertools.count(1)
+
+        self._temp_path = None
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix='sessions-', suffix='.db')
+            os.close(fd)
+            self._temp_path = path
+        self._db = sqlite3.connect(path)
+        self._db.execute('PRAGMA journal_mode = OFF')
+        self._db.execute('PRAGMA synchronous = OFF')
+        self._db.execute('DROP TABLE IF EXISTS sessions')  # Sessions never outlive their server
+        self._db.execute('CREATE TABLE sessions (key INTEGER PRIMARY KEY, data BLOB NOT NULL)')
+
+    def __len__(self):
+        return len(self._live) + self._hibernated
+
+    @property
+    def live(self):
+        return len(self._live)
+
+    @property
+    def hibernated(self):
+        return self._hibernated
+
+    def close(self):
+        self._db.close()
+        if self._temp_path:
+            os.remove(self._temp_path)
+            self._temp_path = None
+
+    # --- Sessions ---
+
+    def create(self, seed=None, deltas=False):
+        """Start a new session. Returns (key, session)."""
+        key     = next(self._keys)
+        session = GameSession(seed, self.corpus, deltas=deltas)
+        self._live[key] = session, time.monotonic()
+        self._enforce_budget()
+        return key, session
+
+    def get(self, key):
+        """The session for key, rehydrated first if it was hibernated."""
+        entry = self._live.pop(key, None)
+        if entry is not None:
+            session = entry[0]
+        else:
+            row = self._db.execute('SELECT data FROM sessions WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                raise KeyError(key)
+            self._db.execute('DELETE FROM sessions WHERE key = ?', (key,))
+            self._db.commit()
+            self._hibernated -= 1
+            self.rehydrations += 1
+            session = GameSession.restore(row[0], self.corpus)
+        self._live[key] = session, time.monotonic()
+        self._enforce_budget()
+        return session
+
+    def discard(self, key):
+        """Forget a session, live or hibernated."""
+        if self._live.pop(key, None) is None:
+            if self._db.execute('DELETE FROM sessions WHERE key = ?', (key,)).rowcount:
+                self._db.commit()
+                self._hibernated -= 1
+
+    # --- Hibernation ---
+
+    def sweep(self):
+        """Hibernate every session idle for idle_seconds or more. Returns how many were hibernated."""
+        cutoff = time.monotonic() - self.idle_seconds
+        idle   = []
+        for key, (_, last_used) in self._live.items():
+            if last_used > cutoff:
+                break  # Ordered by last use, so the rest are more recent
+            idle.append(key)
+        return self._hibernate(idle)
+
+    def _enforce_budget(self):
+        if len(self._live) > self.max_live:
+            # Never the most recent session — its caller is about to use it
+            excess = len(self._live) - max(int(self.max_live * LOW_WATER), 1)
+            self._hibernate(list(itertools.islice(self._live, excess)))
+
+    def _hibernate(self, keys):
+        rows = []
+        for key in keys:
+            session = self._live[key][0]
+            try:
+                rows.append((key, session.dump()))
+            except Exception as e:
+                # Keep it live, as if just used, so the next sweep doesn't retry it straight away
+                print(f'Could not hibernate session {key}: {e!r}', file=sys.stderr)
+                self._live[key] = session, time.monotonic()
+                self._live.move_to_end(key)
+        if not rows:
+            return 0
+        # Sessions leave memory only once they are safely in the table
+        self._db.executemany('INSERT INTO sessions (key, data) VALUES (?, ?)', rows)
+        self._db.commit()
+        for key, _ in rows:
+            del self._live[key]
+        self._hibernated  += len(rows)
+        self.hibernations += len(rows)
+        return len(rows)
\ No newline at end of file
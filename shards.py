@@ -0,0 +1,148 @@
+import asyncio
+import multiprocessing
+import os
+import socket
+import tempfile
+import zlib
+
+from corpus import Corpus, default_corpus
+from server import GameServer, uvloop
+from session_store import DEFAULT_MAX_LIVE, DEFAULT_IDLE_SECONDS
+
+
+# Pending connections the supervisor's listening socket queues before refusing new ones
+BACKLOG = 1024
+
+
+class ShardSupervisor:
+    """
+    Spreads sessions over several worker processes, each running its own
+    GameServer on its own event loop, so serving isn't limited to one core
+    by the GIL.
+
+    The supervisor owns the listening socket. It accepts each connection
+    and hashes the connection's number to pick a worker, then passes the
+    socket itself to that worker over a Unix socketpair. Every session lives
+    on its connection, so a session stays on one worker for its whole life.
+
+    The puzzle corpus, with its difficulties precomputed, is packed once
+    into a temporary file that every worker maps read-only (see
+    corpus.Corpus.open). Workers are started fresh rather than forked, and
+    they never import puzzles.py or difficulty_table.py, so there is one
+    copy of the puzzle data in memory however many workers run.
+
+    Passing sockets between processes needs a Unix platform. max_live and
+    idle_seconds apply to each worker's GameServer.
+    """
+
+    def __init__(self, workers, max_live=DEFAULT_MAX_LIVE, idle_seconds=DEFAULT_IDLE_SECONDS):
+        if not hasattr(socket, 'send_fds'):
+            raise RuntimeError('sharding needs a Unix platform (socket.send_fds)')
+        self.workers      = workers
+        self.max_live     = max_live
+        self.idle_seconds = idle_seconds
+        self.accepted     = 0
+        self.corpus_path  = None
+        self._processes   = []
+        self._controls    = []
+
+    # --- Lifecycle ---
+
+    def start(self):
+        """Write the shared corpus and start the worker processes."""
+        fd, self.corpus_path = tempfile.mkstemp(prefix='corpus-', suffix='.bin')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(default_corpus().pack())
+
+        context = multiprocessing.get_context('spawn')
+        for _ in range(self.workers):
+            control, child_end = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+            process = context.Process(target=_worker_main, daemon=True,
+                                      args=(child_end, self.corpus_path, self.max_live, self.idle_seconds))
+            process.start()
+            child_end.close()
+            self._processes.append(process)
+            self._controls.append(control)
+
+    def stop(self):
+        for control in self._controls:
+            control.close()  # Workers exit when their control socket closes
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        if self.corpus_path:
+            os.remove(self.corpus_path)
+        self._processes, self._controls, self.corpus_path = [], [], None
+
+    # --- Serving ---
+
+    def serve_tcp(self, host, port):
+        self._serve(socket.create_server((host, port), backlog=BACKLOG))
+
+    def serve_unix(self, path):
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(path)
+        listener.listen(BACKLOG)
+        self._serve(listener)
+
+    def _serve(self, listener):
+        with listener:
+            while True:
+                conn, _ = listener.accept()
+                with conn:
+                    self._dispatch(conn)
+
+    def shard_for(self, key):
+        """Worker index for a session key. Stable, and spreads sequential keys evenly."""
+        return zlib.crc32(key.to_bytes(8, 'little')) % self.workers
+
+    def _dispatch(self, conn):
+        # The worker gets its own duplicate of the descriptor; the caller closes ours
+        shard = self.shard_for(self.accepted)
+        self.accepted += 1
+        socket.send_fds(self._controls[shard], [b'c'], [conn.fileno()])
+
+
+# ---------------------------------------------------------------------------
+# Worker process
+# ---------------------------------------------------------------------------
+
+def _worker_main(control, corpus_path, max_live, idle_seconds):
+    if uvloop:
+        uvloop.install()
+    server = GameServer(Corpus.open(corpus_path), max_live, idle_seconds)
+    try:
+        asyncio.run(_serve_forwarded(server, control))
+    except KeyboardInterrupt:  # Ctrl+C reaches the whole process group; the supervisor handles shutdown
+        pass
+    finally:
+        server.close()
+
+
+async def _serve_forwarded(server, control):
+    """Serve every socket the supervisor sends over control until the supervisor goes away."""
+    loop   = asyncio.get_running_loop()
+    closed = loop.create_future()
+    tasks  = set()  # The loop only keeps weak references to tasks
+    control.setblocking(False)
+
+    def on_readable():
+        try:
+            # One byte per message, with that message's descriptor attached
+            message, fds, _, _ = socket.recv_fds(control, 1, 1)
+        except BlockingIOError:
+            return
+        if not message:
+            loop.remove_reader(control.fileno())
+            closed.set_result(None)
+            return
+        for fd in fds:
+            task = loop.create_task(server.serve_socket(socket.socket(fileno=fd)))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+    loop.add_reader(control.fileno(), on_readable)
+    sweeper = loop.create_task(server.sweep_idle())
+    await closed
+    sweeper.cancel()
\ No newline at end of file
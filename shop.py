@@ -25,8 +25,8 @@ class Shop:
     """
 
     def __init__(self, font, screen_width, screen_height):
-        self.font       = font
-        self.small_font = pygame.font.SysFont('Arial', 20)
+        self.font        = font
+        self._small_font = None  # Created on first draw so headless play never needs pygame.font
         self.screen_width  = screen_width
         self.screen_height = screen_height
 
@@ -42,8 +42,19 @@ class Shop:
         self.on_free_guess        = None
         self.on_bonus_strike      = None
 
+        # Called with (item_id, item_list) after every successful purchase — set by main.py
+        self.on_purchase = None
+
+        # Thin client: called with item_id in place of a local purchase, returns
+        # whether it went through — set by RemoteGame
+        self.purchase_handler = None
+
         self.manager = None  # set by main.py after construction
 
+        # Item rows are drawn into one surface, rebuilt only when manager.version or the tab changes
+        self._rows     = None
+        self._rows_key = None
+
         self.popup_rect = pygame.Rect(0, 0, 600, 480)
         self.popup_rect.center = (screen_width // 2, screen_height // 2)
 
@@ -68,6 +79,12 @@ class Shop:
     # State helpers
     # -------------------------------------------------------------------------
 
+    @property
+    def small_font(self):
+        if self._small_font is None:
+            self._small_font = pygame.font.SysFont('Arial', 20)
+        return self._small_font
+
     def reset(self):
         """Reset tab and scroll state on loss. Upgrade ownership reset by GameManager."""
         self.active_tab = 'upgrades'
@@ -201,6 +218,10 @@ class Shop:
     def _is_consumable_disabled(self, consumable_id):
         if not self.manager:
             return False
+        return self.manager.derived(('consumable_disabled', consumable_id),
+                                    lambda: self._consumable_disabled(consumable_id))
+
+    def _consumable_disabled(self, consumable_id):
         if consumable_id == 'free_guess':
             return self.manager.free_guess_active
         if consumable_id == 'bonus_strike':
@@ -227,6 +248,8 @@ class Shop:
 
     def _try_purchase_item(self, item_id, item_list):
         """Unified purchase handler for upgrades and prestige items."""
+        if self.purchase_handler:
+            return self._delegate_purchase(item_id, item_list)
         item = next((x for x in item_list if x['id'] == item_id), None)
         if not item or not self._item_available(item, item_list):
             return False
@@ -247,10 +270,15 @@ class Shop:
             self.manager.purchased_upgrades.add(key)
         else:
             self.manager.purchase_prestige_item(item_id)
+        self.manager.mark_changed()
 
+        if self.on_purchase:
+            self.on_purchase(item_id, item_list)
         return True
 
     def _try_purchase_consumable(self, consumable_id):
+        if self.purchase_handler:
+            return self._delegate_purchase(consumable_id, CONSUMABLES)
         consumable = next((c for c in CONSUMABLES if c['id'] == consumable_id), None)
         if not consumable or self._is_consumable_disabled(consumable_id):
             return False
@@ -258,6 +286,7 @@ class Shop:
         if not self.manager.spend(cost):
             return False
         self.manager.consumable_purchases[consumable_id] =             self.manager.consumable_purchases.get(consumable_id, 0) + 1
+        self.manager.mark_changed()
         callbacks = {
             'reveal_consonant':  self.on_reveal_consonant,
             'reveal_vowel':      self.on_reveal_vowel,
@@ -268,8 +297,16 @@ class Shop:
         cb = callbacks.get(consumable_id)
         if cb:
             cb()
+        if self.on_purchase:
+            self.on_purchase(consumable_id, CONSUMABLES)
         return True
 
+    def _delegate_purchase(self, item_id, item_list):
+        bought = self.purchase_handler(item_id)
+        if bought and self.on_purchase:
+            self.on_purchase(item_id, item_list)
+        return bought
+
     # -------------------------------------------------------------------------
     # Scroll
     # -------------------------------------------------------------------------
@@ -349,14 +386,22 @@ class Shop:
     # -------------------------------------------------------------------------
 
     def _draw_tab_content(self, screen):
-        if self.active_tab == 'consumables':
-            self._draw_item_rows(screen, CONSUMABLES, is_consumable=True)
-        elif self.active_tab == 'upgrades':
-            self._draw_item_rows(screen, self._visible_items(UPGRADES))
-        else:
-            self._draw_item_rows(screen, self._visible_items(PRESTIGE_ITEMS))
+        key = (self.manager.version, self.active_tab)
+        if self._rows_key != key:
+            if self.active_tab == 'consumables':
+                self._rows = self._build_item_rows(CONSUMABLES, is_consumable=True)
+            elif self.active_tab == 'upgrades':
+                self._rows = self._build_item_rows(self._visible_items(UPGRADES))
+            else:
+                self._rows = self._build_item_rows(self._visible_items(PRESTIGE_ITEMS))
+            self._rows_key = key
 
-    def _draw_item_rows(self, screen, items, is_consumable=False):
+        scroll       = self.scroll_offsets[self.active_tab]
+        visible_area = pygame.Rect(0, scroll, self.popup_rect.width, self.content_height)
+        screen.blit(self._rows, (self.popup_rect.left, self.content_top), visible_area)
+
+    def _build_item_rows(self, items, is_consumable=False):
+        """Draw every row of the active tab onto one tall surface and return it."""
         item_list = CONSUMABLES if is_consumable else (
             UPGRADES if self.active_tab == 'upgrades' else PRESTIGE_ITEMS
         )
@@ -424,9 +469,7 @@ class Shop:
                                  (20, y + ROW_HEIGHT - 1),
                                  (self.popup_rect.width - 20, y + ROW_HEIGHT - 1), 1)
 
-        scroll       = self.scroll_offsets[self.active_tab]
-        visible_area = pygame.Rect(0, scroll, self.popup_rect.width, self.content_height)
-        screen.blit(surface, (self.popup_rect.left, self.content_top), visible_area)
+        return surface
 
     def draw(self, screen):
         if not self.visible:
@@ -0,0 +1,178 @@
+import struct
+from array import array
+
+from game_manager import GameManager
+from replay import _read_varint, _write_varint
+from shop_items import UPGRADES, CONSUMABLES, PRESTIGE_ITEMS
+
+
+# ---------------------------------------------------------------------------
+# Snapshot format
+# ---------------------------------------------------------------------------
+#
+#   header   4s   MAGIC
+#            B    VERSION
+#            Q    GameManager seed
+#            Q    PCG32 state
+#            I    corpus fingerprint           (all little-endian)
+#   fields   varints, in FIELDS order, then one per UPGRADES entry (times
+#            bought) and one per CONSUMABLES entry (uses this run)
+#   flags    varint  FLAGS bits
+#   prestige varint  bit i set if PRESTIGE_ITEMS[i] is owned
+#   round    varint  puzzle index
+#            varint  guessed letters, bit 0 = A
+#            varint  revealed slots, bit 0 = first non-space character
+#   pool     varint  corpus size N
+#            N bits  seen puzzles, then N bits remaining puzzles, each
+#                    padded to whole bytes, bit i of byte j = puzzle 8j + i
+#
+# Puzzles are stored by index, so a snapshot only restores against the same
+# corpus; the fingerprint catches a mismatch. With the built-in 900 puzzles
+# a snapshot is under 300 bytes, most of it the two pool bitsets.
+# ---------------------------------------------------------------------------
+
+MAGIC   = b'WGSN'
+VERSION = 1
+HEADER  = struct.Struct('<4sBQQI')
+
+# Plain integer attributes, in stored order
+FIELDS = (
+    'version',
+    'streak_count',
+    'previous_streak',
+    'money',
+    'total_rounds_completed',
+    'stars',
+    'prestige_count',
+    'star_streak_discounts',
+    'bonus_strikes',
+    'current_tier',
+)
+
+# Boolean attributes, bit i of the flags varint
+FLAGS = ('_stars_display_unlocked', 'free_guess_active', 'solved_by_consumable')
+
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Set bit positions of every byte value, for decoding bitsets
+_BITS = tuple(tuple(i for i in range(8) if byte >> i & 1) for byte in range(256))
+
+
+def dump(manager):
+    """Return manager's complete game state as snapshot bytes."""
+    state, _ = manager.rng.getstate()  # gauss_next isn't kept; the game never calls gauss()
+    corpus   = manager.corpus
+    out      = bytearray(HEADER.pack(MAGIC, VERSION, manager.seed, state, corpus.fingerprint))
+
+    for name in FIELDS:
+        _write_varint(out, getattr(manager, name))
+    _write_varint(out, manager.strikes.count)
+    _write_varint(out, manager.strikes.max_strikes)
+    for item in UPGRADES:
+        # Each purchase is its own key: 'id' for single slots, 'id_1', 'id_2', ... otherwise
+        item_id = item['id']
+        _write_varint(out, sum(1 for k in manager.purchased_upgrades
+                               if k == item_id or k.startswith(item_id + '_')))
+    for item in CONSUMABLES:
+        _write_varint(out, manager.consumable_purchases.get(item['id'], 0))
+
+    _write_varint(out, sum(1 << i for i, name in enumerate(FLAGS) if getattr(manager, name)))
+    _write_varint(out, sum(1 << i for i, item in enumerate(PRESTIGE_ITEMS)
+                           if item['id'] in manager.prestige_owned))
+
+    _write_varint(out, manager.puzzle_index)
+    guessed = manager.alphabet.guessed
+    _write_varint(out, sum(1 << i for i, c in enumerate(ALPHABET) if c in guessed))
+    _write_varint(out, sum(1 << i for i, slot in enumerate(manager.phrase.letters) if slot.letter))
+
+    _write_varint(out, len(corpus))
+    out += _pack_bits(map(corpus.index_of, manager.seen_puzzles), len(corpus))
+    out += _pack_bits(manager.remaining_puzzles, len(corpus))
+    return bytes(out)
+
+
+def restore(data, font, shop, corpus=None):
+    """
+    Rebuild the GameManager that dump() saved, reading puzzles from corpus
+    (the built-in puzzles by default). Like a freshly constructed manager,
+    the result still needs shop.manager pointed at it.
+    """
+    magic, version, seed, state, fingerprint = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError('Not a game snapshot')
+    if version != VERSION:
+        raise ValueError(f'Unsupported snapshot version {version}')
+
+    manager = GameManager.__new__(GameManager)
+    manager._init_state(font, shop, seed, corpus)
+    if manager.corpus.fingerprint != fingerprint:
+        raise ValueError('Snapshot was taken with a different puzzle corpus')
+    manager.rng.setstate((state, None))
+
+    pos = HEADER.size
+    for name in FIELDS:
+        value, pos = _read_varint(data, pos)
+        setattr(manager, name, value)
+    strikes_count, pos = _read_varint(data, pos)
+    max_strikes,   pos = _read_varint(data, pos)
+    for item in UPGRADES:
+        count, pos = _read_varint(data, pos)
+        item_id = item['id']
+        if item.get('max_owned', 1) > 1:
+            manager.purchased_upgrades.update(f'{item_id}_{n}' for n in range(1, count + 1))
+        elif count:
+            manager.purchased_upgrades.add(item_id)
+    for item in CONSUMABLES:
+        count, pos = _read_varint(data, pos)
+        if count:
+            manager.consumable_purchases[item['id']] = count
+
+    flags, pos = _read_varint(data, pos)
+    for i, name in enumerate(FLAGS):
+        setattr(manager, name, bool(flags >> i & 1))
+    owned, pos = _read_varint(data, pos)
+    for i, item in enumerate(PRESTIGE_ITEMS):
+        if owned >> i & 1:
+            item_id = item['id']
+            manager.prestige_owned.add(item_id)
+            if item_id.startswith('topic_'):
+                manager.unlocked_color_topics.add(item_id)
+    manager.old_man_unlocked = 'old_man' in manager.prestige_owned
+
+    index,    pos = _read_varint(data, pos)
+    guessed,  pos = _read_varint(data, pos)
+    revealed, pos = _read_varint(data, pos)
+    manager._build_round(index, max_strikes)
+    manager.strikes.count = strikes_count
+    letters = manager.phrase.word.replace(' ', '')
+    for slot in range(len(letters)):
+        if revealed >> slot & 1:
+            manager.phrase.reveal(slot, letters[slot])
+    for i, c in enumerate(ALPHABET):
+        if guessed >> i & 1:
+            manager.alphabet.guess(c)
+
+    size, pos = _read_varint(data, pos)
+    if size != len(manager.corpus):
+        raise ValueError('Snapshot was taken with a different puzzle corpus')
+    width = (size + 7) // 8
+    texts = manager.corpus.texts
+    manager.seen_puzzles.update(texts[i] for i in _unpack_bits(data[pos:pos + width]))
+    manager.remaining_puzzles = array('I', _unpack_bits(data[pos + width:pos + 2 * width]))
+    return manager
+
+
+def _pack_bits(indices, size):
+    bits = bytearray((size + 7) // 8)
+    for i in indices:
+        bits[i >> 3] |= 1 << (i & 7)
+    return bits
+
+
+def _unpack_bits(bits):
+    """Yield the set bit positions of bits in ascending order."""
+    for j, byte in enumerate(bits):
+        if byte:
+            base = j << 3
+            for i in _BITS[byte]:
+                yield base + i
\ No newline at end of file
@@ -0,0 +1,172 @@
+import argparse
+import json
+import sqlite3
+import time
+from bisect import bisect_right
+from collections import Counter
+
+import history
+
+
+# Bump whenever RoundStats changes what it aggregates; saved aggregates from
+# another version are thrown away and rebuilt from the history log
+STATS_VERSION = 1
+
+# (lowest difficulty, label), matching the steps of GameManager's pool ranges
+DIFFICULTY_BANDS = (
+    (0,   'Easy'),
+    (200, 'Medium'),
+    (350, 'Hard'),
+    (500, 'Very hard'),
+    (700, 'Expert'),
+)
+_BAND_FLOORS = [floor for floor, _ in DIFFICULTY_BANDS]
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS round_stats (
+        version INTEGER NOT NULL,
+        last_id INTEGER NOT NULL,
+        data    TEXT    NOT NULL
+    )
+'''
+
+
+def difficulty_band(difficulty):
+    """Label of the DIFFICULTY_BANDS band difficulty falls in."""
+    return DIFFICULTY_BANDS[max(bisect_right(_BAND_FLOORS, difficulty) - 1, 0)][1]
+
+
+class RoundStats:
+    """
+    Running totals over every round in the history log, for the stats
+    screen. add() folds in one round in O(1), so the totals stay current
+    without rescanning history; they are saved alongside the log (see
+    save()) and loaded on the next start.
+
+    A run's final streak is the streak of the round that lost it, so
+    final_streaks only counts runs that ended in a loss.
+
+    version increases on every add(), so a screen drawing these totals can
+    tell when to redraw.
+    """
+
+    def __init__(self):
+        self.rounds        = 0
+        self.wins          = 0
+        self.strikes       = 0
+        self.by_category   = {}         # {category: [wins, rounds]}
+        self.by_band       = {}         # {band label: [wins, rounds]}
+        self.consumables   = Counter()  # {consumable id: times bought}
+        self.money_by_day  = {}         # {'YYYY-MM-DD': [money earned, rounds]}
+        self.final_streaks = Counter()  # {streak: runs lost at that streak}
+        self.version       = 0
+
+    def add(self, row):
+        """Fold in one history row (a dict with history.COLUMNS keys)."""
+        won = row['outcome'] == 'won'
+        self.rounds  += 1
+        self.wins    += won
+        self.strikes += row['strikes_used']
+        for totals in (self.by_category.setdefault(row['category'], [0, 0]),
+                       self.by_band.setdefault(difficulty_band(row['difficulty']), [0, 0])):
+            totals[0] += won
+            totals[1] += 1
+        if row['consumables']:
+            self.consumables.update(row['consumables'].split(','))
+        day = self.money_by_day.setdefault(time.strftime('%Y-%m-%d', time.localtime(row['recorded_at'])), [0, 0])
+        day[0] += row['money_earned']
+        day[1] += 1
+        if not won:
+            self.final_streaks[row['streak']] += 1
+        self.version += 1
+
+    def win_rate(self):
+        return self.wins / self.rounds if self.rounds else 0.0
+
+    def average_strikes(self):
+        return self.strikes / self.rounds if self.rounds else 0.0
+
+    # --- Saving ---
+
+    def to_json(self):
+        return json.dumps({
+            'rounds':        self.rounds,
+            'wins':          self.wins,
+            'strikes':       self.strikes,
+            'by_category':   self.by_category,
+            'by_band':       self.by_band,
+            'consumables':   self.consumables,
+            'money_by_day':  self.money_by_day,
+            'final_streaks': self.final_streaks,
+        }, separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, text):
+        data  = json.loads(text)
+        stats = cls()
+        stats.rounds        = data['rounds']
+        stats.wins          = data['wins']
+        stats.strikes       = data['strikes']
+        stats.by_category   = data['by_category']
+        stats.by_band       = data['by_band']
+        stats.consumables   = Counter(data['consumables'])
+        stats.money_by_day  = data['money_by_day']
+        stats.final_streaks = Counter({int(streak): runs for streak, runs in data['final_streaks'].items()})
+        return stats
+
+
+def load(path=history.DEFAULT_PATH, rebuild=False):
+    """
+    Return the saved RoundStats for the history log at path, with any
+    rounds logged since the save folded in (e.g. after a crash). Saved
+    totals from another STATS_VERSION, or rebuild, mean a full rebuild
+    from the log.
+    """
+    db = sqlite3.connect(path)
+    try:
+        db.execute(history.SCHEMA)
+        db.execute(SCHEMA)
+        saved = db.execute('SELECT version, last_id, data FROM round_stats').fetchone()
+    finally:
+        db.close()
+
+    stats, last_id = RoundStats(), 0
+    if saved and saved[0] == STATS_VERSION and not rebuild:
+        stats, last_id = RoundStats.from_json(saved[2]), saved[1]
+    for _, row in history.read_rounds(path, after_id=last_id):
+        stats.add(row)
+    return stats
+
+
+def save(stats, path=history.DEFAULT_PATH):
+    """
+    Save stats as covering every round logged so far. Call it only once
+    the log has caught up with stats (after RunHistory.close()).
+    """
+    db = sqlite3.connect(path)
+    try:
+        with db:
+            last_id = db.execute('SELECT COALESCE(MAX(id), 0) FROM rounds').fetchone()[0]
+            db.execute('DELETE FROM round_stats')
+            db.execute('INSERT INTO round_stats VALUES (?, ?, ?)', (STATS_VERSION, last_id, stats.to_json()))
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Print statistics from the run history')
+    parser.add_argument('--path', default=history.DEFAULT_PATH)
+    parser.add_argument('--rebuild', action='store_true', help='Recompute the saved totals from the whole log')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = load(args.path, rebuild=args.rebuild)
+    if args.rebuild:
+        save(stats, args.path)
+    print(f'{stats.rounds:,} rounds, {stats.win_rate():.0%} won, {stats.average_strikes():.2f} strikes per round '
+          f'(loaded in {(time.perf_counter() - start) * 1000:.0f} ms)')
+    for title, table in (('Category', stats.by_category), ('Difficulty', stats.by_band)):
+        print(f'\n  {title:<22}{"won":>8}{"rounds":>10}')
+        for name, (wins, rounds) in sorted(table.items(), key=lambda item: -item[1][1]):
+            print(f'  {name:<22}{wins / rounds:>8.0%}{rounds:>10,}')
+    print('\n  Most bought: ' + ', '.join(f'{item} ×{n}' for item, n in stats.consumables.most_common(5)))
\ No newline at end of file
@@ -0,0 +1,176 @@
+import pygame
+
+from overlay import dim_layer
+from shop_items import CONSUMABLES
+from stats import DIFFICULTY_BANDS
+
+
+# Final-streak buckets for the run streak chart: (lowest streak, label)
+STREAK_BUCKETS = ((0, '0'), (1, '1–4'), (5, '5–9'), (10, '10–19'), (20, '20–49'), (50, '50+'))
+
+# Days shown in the money per round chart, and its tallest column in pixels
+CHART_DAYS   = 14
+CHART_HEIGHT = 160
+
+_CONSUMABLE_LABELS = {item['id']: item['label'] for item in CONSUMABLES}
+
+
+class StatsScreen:
+    """
+    Full-screen overlay summarising the run history from a stats.RoundStats:
+    overall win rate and strikes, win rate by difficulty band and by
+    category, how runs ended, the most bought consumables and money per
+    round for the last CHART_DAYS days played.
+
+    Everything comes from the running totals, so opening the screen costs
+    the same however long the history is. The panel is composed onto one
+    surface and rebuilt only when stats.version moves, i.e. after a round.
+
+    Toggled with Tab in main.py; clicks are consumed while it is open and
+    the Close button hides it, as with OldMan.
+    """
+
+    PANEL_W = 1040
+    PANEL_H = 660
+
+    def __init__(self, font, screen_width, screen_height, stats):
+        self.font       = font
+        self.small_font = pygame.font.SysFont('Arial', 18)
+        self.screen_w   = screen_width
+        self.screen_h   = screen_height
+        self.stats      = stats
+
+        self.visible  = False
+        self._panel   = None
+        self._version = None   # stats.version the panel was built from
+
+        self.panel_rect = pygame.Rect(0, 0, self.PANEL_W, self.PANEL_H)
+        self.panel_rect.center = (screen_width // 2, screen_height // 2)
+
+        self.close_rect = pygame.Rect(0, 0, 140, 44)
+        self.close_rect.centerx = self.panel_rect.centerx
+        self.close_rect.bottom  = self.panel_rect.bottom - 18
+
+    def handle_click(self, pos):
+        """Consume the click if visible, closing on the Close button. Returns True if visible."""
+        if not self.visible:
+            return False
+        if self.close_rect.collidepoint(pos):
+            self.visible = False
+        return True
+
+    def draw(self, screen):
+        if not self.visible:
+            return
+        screen.blit(dim_layer((self.screen_w, self.screen_h)), (0, 0))
+        if self._panel is None or self._version != self.stats.version:
+            self._panel   = self._build_panel()
+            self._version = self.stats.version
+        screen.blit(self._panel, self.panel_rect)
+
+    # --- Composition ---
+
+    def _build_panel(self):
+        surface = pygame.Surface(self.panel_rect.size)
+        panel   = surface.get_rect()
+        stats   = self.stats
+        pygame.draw.rect(surface, 'black', panel)
+        pygame.draw.rect(surface, 'white', panel, 2)
+
+        title = self.font.render('STATS', True, 'white')
+        surface.blit(title, title.get_rect(centerx=panel.centerx, top=panel.top + 16))
+        div_y = panel.top + 58
+        pygame.draw.line(surface, '#444444', (panel.left + 20, div_y), (panel.right - 20, div_y), 1)
+
+        col_w  = (panel.width - 90) // 2
+        left   = panel.left + 30
+        right  = left + col_w + 30
+
+        # --- Left column ---
+        y = self._heading(surface, 'Overall', left, div_y + 14)
+        y = self._line(surface, f'Rounds played: {stats.rounds:,}', left, y)
+        y = self._line(surface, f'Won: {stats.win_rate():.0%}', left, y)
+        y = self._line(surface, f'Strikes per round: {stats.average_strikes():.2f}', left, y)
+
+        y = self._heading(surface, 'Win rate by difficulty', left, y + 12)
+        y = self._win_rates(surface, [(label, stats.by_band.get(label)) for _, label in DIFFICULTY_BANDS],
+                            left, y, col_w)
+
+        y = self._heading(surface, 'Runs lost at streak', left, y + 12)
+        runs   = [0] * len(STREAK_BUCKETS)
+        floors = [floor for floor, _ in STREAK_BUCKETS]
+        for streak, count in stats.final_streaks.items():
+            runs[max(i for i, floor in enumerate(floors) if streak >= floor)] += count
+        most = max(runs) or 1
+        self._bars(surface, [(label, n / most, f'{n:,}') for (_, label), n in zip(STREAK_BUCKETS, runs)],
+                   left, y, col_w)
+
+        # --- Right column ---
+        y = self._heading(surface, 'Win rate by category', right, div_y + 14)
+        categories = sorted(stats.by_category.items(), key=lambda item: -item[1][1])
+        y = self._win_rates(surface, [(name.title(), totals) for name, totals in categories], right, y, col_w)
+
+        y = self._heading(surface, 'Most bought consumables', right, y + 12)
+        bought = stats.consumables.most_common(5)
+        most   = bought[0][1] if bought else 1
+        y = self._bars(surface, [(_CONSUMABLE_LABELS.get(item, item), n / most, f'{n:,}') for item, n in bought],
+                       right, y, col_w)
+        if not bought:
+            y = self._line(surface, 'None yet', right, y, '#888888')
+
+        y = self._heading(surface, f'Money per round, last {CHART_DAYS} days played', right, y + 12)
+        space = self.close_rect.top - self.panel_rect.top - y - 20
+        self._money_chart(surface, pygame.Rect(right, y + 4, col_w, min(space, CHART_HEIGHT)))
+
+        close_rect = self.close_rect.move(-self.panel_rect.left, -self.panel_rect.top)
+        pygame.draw.rect(surface, 'black', close_rect)
+        pygame.draw.rect(surface, 'white', close_rect, 2)
+        close_surf = self.font.render('Close', True, 'white')
+        surface.blit(close_surf, close_surf.get_rect(center=close_rect.center))
+        return surface
+
+    def _heading(self, surface, text, x, y):
+        surf = self.small_font.render(text, True, 'gold')
+        surface.blit(surf, (x, y))
+        return y + surf.get_height() + 4
+
+    def _line(self, surface, text, x, y, color='white'):
+        surf = self.small_font.render(text, True, color)
+        surface.blit(surf, (x, y))
+        return y + self.small_font.get_linesize()
+
+    def _win_rates(self, surface, rows, x, y, width):
+        """Bars of win rate for (label, [wins, rounds] or None) rows."""
+        return self._bars(surface, [(label, totals[0] / totals[1], f'{totals[0] / totals[1]:.0%} of {totals[1]:,}')
+                                    if totals else (label, 0, '—')
+                                    for label, totals in rows], x, y, width)
+
+    def _bars(self, surface, rows, x, y, width):
+        """One line per (label, fraction 0–1, value text): label, a bar, then the value."""
+        label_w, value_w = 150, 90
+        bar_w  = width - label_w - value_w - 10
+        line_h = self.small_font.get_linesize()
+        for label, fraction, value in rows:
+            surface.blit(self.small_font.render(label, True, '#DDDDDD'), (x, y))
+            bar = pygame.Rect(x + label_w, y + 4, bar_w, line_h - 8)
+            pygame.draw.rect(surface, '#333333', bar)
+            pygame.draw.rect(surface, 'white', (bar.left, bar.top, round(bar.width * fraction), bar.height))
+            value_surf = self.small_font.render(value, True, '#AAAAAA')
+            surface.blit(value_surf, value_surf.get_rect(right=x + width, top=y))
+            y += line_h
+        return y
+
+    def _money_chart(self, surface, rect):
+        """Average money per round for each of the last CHART_DAYS days played, as columns."""
+        days = sorted(self.stats.money_by_day.items())[-CHART_DAYS:]
+        if not days or rect.height < 20:
+            self._line(surface, 'No rounds yet', rect.left, rect.top, '#888888')
+            return
+        averages = [money / rounds for _, (money, rounds) in days]
+        top      = max(averages) or 1
+        slot_w   = rect.width // CHART_DAYS
+        for i, average in enumerate(averages):
+            height = max(1, round((rect.height - 20) * average / top))
+            pygame.draw.rect(surface, 'green', (rect.left + i * slot_w + 2, rect.bottom - height, slot_w - 4, height))
+        peak = self.small_font.render(f'${top:,.0f}', True, '#AAAAAA')
+        surface.blit(peak, peak.get_rect(right=rect.right, top=rect.top))
\ No newline at end of file
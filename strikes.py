@@ -13,11 +13,17 @@ class Strikes:
 
     def __init__(self, font, screen_width, max_strikes=3):
         self.font       = font
-        self.small_font = pygame.font.SysFont("Arial", 20)
+        self._small_font = None  # Created on first draw so headless play never needs pygame.font
         self.screen_width = screen_width
         self.max_strikes = max_strikes
         self.count = 0
 
+    @property
+    def small_font(self):
+        if self._small_font is None:
+            self._small_font = pygame.font.SysFont("Arial", 20)
+        return self._small_font
+
     def _build_slots(self, num_slots):
         """Build a list of rects for num_slots X marks, flush to the top right."""
         total_width = num_slots * LETTER_SLOT_WIDTH + (num_slots - 1) * GAP
@@ -0,0 +1,11 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')   # Headless, e.g. in CI
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from alloc_tracker import check_budgets
+
+
+def test_allocation_budgets():
+    """Every steady-state screen stays within its per-frame budget in alloc_tracker.BUDGETS."""
+    assert check_budgets() == []
\ No newline at end of file
@@ -0,0 +1,50 @@
+from functools import lru_cache
+
+
+# Advance width of every word measured so far, per font: {font: {word: width}}
+_word_widths = {}
+
+
+def word_width(font, word):
+    """Return the rendered pixel width of word in font, measuring it only once."""
+    widths = _word_widths.get(font)
+    if widths is None:
+        widths = _word_widths[font] = {}
+    width = widths.get(word)
+    if width is None:
+        width = widths[word] = font.size(word)[0]
+    return width
+
+
+@lru_cache(maxsize=1024)
+def wrap_text(text, font, max_width):
+    """
+    Split text into lines that fit within max_width pixels.
+
+    Each word is measured once per font and a line's width is kept as a
+    running sum of word and space advances, so wrapping is linear in the
+    number of words. Results are memoized by (text, font, max_width) and
+    returned as a tuple so callers can't mutate the cached value.
+    A single word wider than max_width gets a line to itself.
+    """
+    words = text.split()
+    if not words:
+        return ()
+
+    space = word_width(font, ' ')
+    lines = []
+    current_line  = [words[0]]
+    current_width = word_width(font, words[0])
+
+    for word in words[1:]:
+        width = word_width(font, word)
+        if current_width + space + width <= max_width:
+            current_line.append(word)
+            current_width += space + width
+        else:
+            lines.append(' '.join(current_line))
+            current_line  = [word]
+            current_width = width
+
+    lines.append(' '.join(current_line))
+    return tuple(lines)
\ No newline at end of file
@@ -0,0 +1,113 @@
+import argparse
+import math
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+from bots import STRATEGIES, play_round
+from constants import SCREEN_SIZE
+from game_manager import GameManager
+from shop import Shop
+
+
+def play_game(strategy_name, seed, rounds):
+    """
+    Play one headless game of rounds rounds with the named strategy.
+    Both the game and the bot are seeded from seed, so the same seed gives
+    every strategy the same puzzle order. Returns plain data so results can
+    cross process boundaries cheaply.
+    """
+    shop     = Shop(None, *SCREEN_SIZE)
+    manager  = GameManager(None, shop, seed=seed)
+    shop.manager = manager
+    strategy = STRATEGIES[strategy_name](seed=seed)
+
+    run_streaks  = []   # Streak at the end of each run (loss, cleared game or prestige)
+    money_curve  = []   # Money held after each round
+    stars_earned = 0
+
+    for _ in range(rounds):
+        buffered = manager.star_buffer
+        outcome  = play_round(manager, shop, strategy)
+        if outcome == 'prestige':
+            stars_earned += buffered
+        if outcome in ('lost', 'complete', 'prestige'):
+            run_streaks.append(manager.previous_streak)
+        money_curve.append(manager.money)
+
+    # The run still in progress counts as well
+    run_streaks.append(manager.streak_count)
+    return {
+        'strategy':     strategy_name,
+        'seed':         seed,
+        'best_streak':  max(run_streaks),
+        'mean_streak':  statistics.fmean(run_streaks),
+        'stars_earned': stars_earned,
+        'prestiges':    manager.prestige_count,
+        'money_curve':  money_curve,
+    }
+
+
+def _play_game_args(args):
+    return play_game(*args)
+
+
+def run_tournament(strategy_names, seeds, rounds, workers=None):
+    """Play every strategy over the same seed set across a process pool. Returns a list of game results."""
+    jobs = [(name, seed, rounds) for name in strategy_names for seed in seeds]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_play_game_args, jobs, chunksize=max(1, len(jobs) // 64)))
+
+
+def mean_ci(values):
+    """Return (mean, half-width of the 95% confidence interval) using the normal approximation."""
+    mean = statistics.fmean(values)
+    if len(values) < 2:
+        return mean, 0.0
+    return mean, 1.96 * statistics.stdev(values) / math.sqrt(len(values))
+
+
+def summarize(results, checkpoints=5):
+    """
+    Aggregate game results per strategy into (mean, ci) pairs for best streak,
+    mean run streak, stars earned and prestiges, plus the money curve sampled
+    at evenly spaced rounds.
+    """
+    summary = {}
+    for name in dict.fromkeys(r['strategy'] for r in results):
+        games  = [r for r in results if r['strategy'] == name]
+        rounds = len(games[0]['money_curve'])
+        marks  = sorted({max(1, rounds * (i + 1) // checkpoints) for i in range(checkpoints)})
+        summary[name] = {
+            'games':        len(games),
+            'best_streak':  mean_ci([g['best_streak'] for g in games]),
+            'mean_streak':  mean_ci([g['mean_streak'] for g in games]),
+            'stars_earned': mean_ci([g['stars_earned'] for g in games]),
+            'prestiges':    mean_ci([g['prestiges'] for g in games]),
+            'money_curve':  {m: mean_ci([g['money_curve'][m - 1] for g in games]) for m in marks},
+        }
+    return summary
+
+
+def format_summary(summary):
+    lines = []
+    for name, s in summary.items():
+        lines.append(f'{name}  ({s["games"]} games)')
+        for key in ('best_streak', 'mean_streak', 'stars_earned', 'prestiges'):
+            mean, ci = s[key]
+            lines.append(f'  {key:<13} {mean:10.2f} ± {ci:.2f}')
+        curve = '  '.join(f'r{m}: {mean:.0f}±{ci:.0f}' for m, (mean, ci) in s['money_curve'].items())
+        lines.append(f'  money         {curve}')
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Play bot strategies against a fixed seed set and compare them')
+    parser.add_argument('--strategies', nargs='+', default=['frequency', 'rarity', 'greedy_shopper'],
+                        choices=sorted(STRATEGIES))
+    parser.add_argument('--seeds', type=int, default=100, help='Number of seeds (0..N-1) each strategy plays')
+    parser.add_argument('--rounds', type=int, default=200, help='Rounds played per game')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    results = run_tournament(args.strategies, range(args.seeds), args.rounds, args.workers)
+    print(format_summary(summarize(results)))
\ No newline at end of file
@@ -0,0 +1,412 @@
+import numpy as np
+
+from difficulty import calculate_difficulties, puzzle_difficulty
+from puzzles import PUZZLES
+from shop_items import UPGRADES, CONSUMABLES
+
+
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+CONSONANT_MASK = np.array([c not in 'AEIOU' for c in ALPHABET])
+VOWEL_MASK     = ~CONSONANT_MASK
+
+# --- Action layout ---
+#   0-25                   guess letter A-Z
+#   26 .. 26+C-1           buy CONSUMABLES[i]
+#   26+C .. 26+C+U-1       buy UPGRADES[i]
+# Actions that are not allowed right now (letter already guessed, item
+# disabled, maxed or unaffordable) are no-ops.
+NUM_LETTERS      = 26
+CONSUMABLE_BASE  = NUM_LETTERS
+UPGRADE_BASE     = CONSUMABLE_BASE + len(CONSUMABLES)
+NUM_ACTIONS      = UPGRADE_BASE + len(UPGRADES)
+
+_CONSUMABLE_INDEX = {item['id']: i for i, item in enumerate(CONSUMABLES)}
+_UPGRADE_INDEX    = {item['id']: i for i, item in enumerate(UPGRADES)}
+
+# Cost tables are precomputed in Python so growth rounding matches Shop._next_cost exactly.
+# Purchases past the last step reuse its (already unaffordable) cost.
+_MAX_COST_STEPS = 128
+_MAX_COST       = 2 ** 62
+
+
+def _cost_table(items):
+    table = np.empty((len(items), _MAX_COST_STEPS), dtype=np.int64)
+    for i, item in enumerate(items):
+        growth = item.get('cost_growth')
+        for n in range(_MAX_COST_STEPS):
+            cost = round(item['cost'] * (growth ** n)) if growth is not None else item['cost']
+            table[i, n] = min(cost, _MAX_COST)
+    return table
+
+
+def _difficulty_bounds(streak):
+    """Vectorized GameManager._get_difficulty_range — returns (min, max) arrays for each streak."""
+    lo = np.select([streak >= 30, streak >= 20, streak >= 12, streak >= 8], [500, 350, 200, 100], 0)
+    hi = np.select([streak >= 20, streak >= 12, streak >= 8, streak >= 4], [np.inf, 700, 500, 350], 200)
+    return lo.astype(np.float64), hi.astype(np.float64)
+
+
+def _difficulty_tier(streak):
+    """Vectorized GameManager._get_difficulty_tier."""
+    return np.select([streak >= 11, streak >= 9, streak >= 7, streak >= 5, streak >= 3], [5, 4, 3, 2, 1], 0)
+
+
+class VectorEnv:
+    """
+    Steps num_envs independent games at once for training and evaluating
+    guessing agents offline.
+
+    The rules mirror GameManager.guess, the shop consumables and upgrades,
+    win/lose money and streak handling, but all state lives in NumPy arrays
+    indexed by environment so a step is a fixed number of vector operations
+    regardless of num_envs. An episode is one round: when a round is won
+    or lost, done is set for that environment and it moves straight on to
+    its next round (a loss also resets the run, exactly like lose()).
+
+    Puzzles are drawn by GameManager's pool rules: each environment holds a
+    pool built like _build_pool when its run starts and whenever its
+    difficulty tier changes, and each round takes a puzzle out of it
+    uniformly at random. A pool is the first pool_size entries of a row of
+    puzzle indices, and a draw swap-removes one, so it costs the same
+    however big the corpus is; every fresh run starts from a copy of one
+    precomputed pool. A win that leaves the pool empty ends the run, like
+    dismissing the game-complete popup.
+
+    Observations are a dict of arrays:
+      board         (N, L) int8   letter index in revealed slots, -1 hidden, -2 past the phrase end
+      revealed      (N, L) bool   revealed-slot mask
+      guessed       (N, 26) bool  guessed-letter mask
+      strikes, max_strikes, bonus_strikes, money, streak, category  (N,) ints
+      free_guess    (N,) bool
+    Rewards are +1 for a won round, -1 for a lost round, 0 otherwise.
+    """
+
+    def __init__(self, num_envs, seed=None, puzzles=PUZZLES):
+        self.num_envs = num_envs
+        self.rng      = np.random.default_rng(seed)
+
+        # --- Static puzzle tables ---
+        self.puzzles    = list(puzzles)
+        self.categories = sorted({category for _, category in self.puzzles})
+        num_puzzles     = len(self.puzzles)
+        max_slots       = max(len(text.replace(' ', '')) for text, _ in self.puzzles)
+
+        self.codes          = np.full((num_puzzles, max_slots), -2, dtype=np.int8)
+        self.puzzle_letters = np.zeros((num_puzzles, 26), dtype=bool)
+        for i, (text, _) in enumerate(self.puzzles):
+            letters = [ALPHABET.index(c) for c in text if c != ' ']
+            self.codes[i, :len(letters)] = letters
+            self.puzzle_letters[i, letters] = True
+        self.padding          = self.codes < 0
+        self.puzzle_category  = np.array([self.categories.index(c) for _, c in self.puzzles], dtype=np.int16)
+        # Payouts use the formula, pools the calibrated difficulty, as in GameManager
+        self.difficulty       = np.asarray(calculate_difficulties(self.puzzles), dtype=np.float64)
+        self.pool_difficulty  = np.array([puzzle_difficulty(text, category) for text, category in self.puzzles])
+
+        self.consumable_costs = _cost_table(CONSUMABLES)
+        self.upgrade_costs    = _cost_table(UPGRADES)
+        self.upgrade_max      = np.array([item['max_owned'] for item in UPGRADES], dtype=np.int64)
+        self.upgrade_requires = np.array([_UPGRADE_INDEX[item['requires']] if item['requires'] else -1
+                                          for item in UPGRADES])
+        self.upgrade_per_purchase_prereq = np.array([bool(item['requires']) and item['cost_growth'] is not None
+                                                     for item in UPGRADES])
+
+        # --- Per-environment state ---
+        n = num_envs
+        self.puzzle        = np.zeros(n, dtype=np.int64)
+        self.revealed      = np.zeros((n, max_slots), dtype=bool)
+        self.guessed       = np.zeros((n, 26), dtype=bool)
+        self.strikes       = np.zeros(n, dtype=np.int64)
+        self.max_strikes   = np.full(n, 3, dtype=np.int64)
+        self.bonus_strikes = np.zeros(n, dtype=np.int64)
+        self.free_guess    = np.zeros(n, dtype=bool)
+        self.money         = np.zeros(n, dtype=np.int64)
+        self.streak        = np.zeros(n, dtype=np.int64)
+        self.upgrades      = np.zeros((n, len(UPGRADES)), dtype=np.int64)
+        self.consumables   = np.zeros((n, len(CONSUMABLES)), dtype=np.int64)
+        self.seen          = np.zeros((n, num_puzzles), dtype=bool)
+        self.pool          = np.zeros((n, num_puzzles), dtype=np.int32)   # Pool indices in [:pool_size]
+        self.pool_size     = np.zeros(n, dtype=np.int64)
+        self.tier          = np.zeros(n, dtype=np.int64)
+
+        # Every run starts at streak 0 with nothing seen, so with the same pool
+        fresh = self._pool_masks(np.zeros(1, dtype=np.int64), np.zeros((1, num_puzzles), dtype=bool))[0]
+        self.fresh_pool = np.flatnonzero(fresh).astype(np.int32)
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def reset(self):
+        """Start a fresh run in every environment and return the first observations."""
+        everyone = np.arange(self.num_envs)
+        self.bonus_strikes[:] = 0
+        self._reset_run(everyone)
+        return self.observe()
+
+    def step(self, actions):
+        """
+        Apply one action per environment.
+        Returns (observations, rewards, dones, info) where info holds the
+        'won' and 'lost' masks for rounds that ended on this step.
+        """
+        actions = np.asarray(actions)
+        won  = np.zeros(self.num_envs, dtype=bool)
+        lost = np.zeros(self.num_envs, dtype=bool)
+
+        letter_envs = np.flatnonzero(actions < NUM_LETTERS)
+        if letter_envs.size:
+            self._guess(letter_envs, actions[letter_envs], won, lost)
+
+        for i in range(len(CONSUMABLES)):
+            envs = np.flatnonzero(actions == CONSUMABLE_BASE + i)
+            if envs.size:
+                self._buy_consumable(i, envs, won)
+
+        for i in range(len(UPGRADES)):
+            envs = np.flatnonzero(actions == UPGRADE_BASE + i)
+            if envs.size:
+                self._buy_upgrade(i, envs)
+
+        won_envs  = np.flatnonzero(won)
+        lost_envs = np.flatnonzero(lost)
+        if won_envs.size:
+            self._win(won_envs)
+        if lost_envs.size:
+            self._reset_run(lost_envs)
+
+        rewards = won.astype(np.float32) - lost.astype(np.float32)
+        return self.observe(), rewards, won | lost, {'won': won, 'lost': lost}
+
+    def observe(self):
+        board = np.where(self.revealed, self.codes[self.puzzle], -1).astype(np.int8)
+        board[self.padding[self.puzzle]] = -2
+        return {
+            'board':         board,
+            'revealed':      self.revealed.copy(),
+            'guessed':       self.guessed.copy(),
+            'strikes':       self.strikes.copy(),
+            'max_strikes':   self.max_strikes.copy(),
+            'bonus_strikes': self.bonus_strikes.copy(),
+            'free_guess':    self.free_guess.copy(),
+            'money':         self.money.copy(),
+            'streak':        self.streak.copy(),
+            'category':      self.puzzle_category[self.puzzle],
+        }
+
+    def action_mask(self):
+        """(N, NUM_ACTIONS) bool mask of actions that would have an effect right now."""
+        mask = np.zeros((self.num_envs, NUM_ACTIONS), dtype=bool)
+        mask[:, :NUM_LETTERS] = ~self.guessed
+        everyone = np.arange(self.num_envs)
+        for i in range(len(CONSUMABLES)):
+            mask[:, CONSUMABLE_BASE + i] = self._consumable_allowed(i, everyone)
+        for i in range(len(UPGRADES)):
+            mask[:, UPGRADE_BASE + i] = self._upgrade_allowed(i, everyone)
+        return mask
+
+    # -------------------------------------------------------------------------
+    # Round lifecycle
+    # -------------------------------------------------------------------------
+
+    def _pool_masks(self, streak, seen):
+        """Vectorized GameManager._build_pool: unseen puzzles in the window, else any unseen, else every puzzle."""
+        lo, hi = _difficulty_bounds(streak)
+        unseen = ~seen
+        pool   = unseen & (self.pool_difficulty >= lo[:, None]) & (self.pool_difficulty <= hi[:, None])
+        pool   = np.where(pool.any(axis=1)[:, None], pool, unseen)
+        pool[~pool.any(axis=1)] = True
+        return pool
+
+    def _build_pools(self, envs):
+        """Rebuild the pools of envs for their current streak and seen puzzles."""
+        mask = self._pool_masks(self.streak[envs], self.seen[envs])
+        # A stable argsort of ~mask lists each row's pool indices first, in index order
+        self.pool[envs]      = np.argsort(~mask, axis=1, kind='stable')
+        self.pool_size[envs] = mask.sum(axis=1)
+        self.tier[envs]      = _difficulty_tier(self.streak[envs])
+
+    def _fresh_pools(self, envs):
+        """Give envs the pool of a run that has just started; see fresh_pool."""
+        self.pool[envs, :self.fresh_pool.size] = self.fresh_pool
+        self.pool_size[envs] = self.fresh_pool.size
+        self.tier[envs]      = 0
+
+    def _draw_puzzles(self, envs):
+        """Take one puzzle out of each environment's pool, uniformly at random. Pools must not be empty."""
+        slot   = self.rng.integers(0, self.pool_size[envs])
+        last   = self.pool_size[envs] - 1
+        chosen = self.pool[envs, slot]
+        self.pool[envs, slot]  = self.pool[envs, last]
+        self.pool_size[envs]   = last
+        return chosen
+
+    def _start_round(self, envs):
+        self.puzzle[envs]      = self._draw_puzzles(envs)
+        self.revealed[envs]    = False
+        self.guessed[envs]     = False
+        self.strikes[envs]     = 0
+        self.free_guess[envs]  = False
+        self.max_strikes[envs] = 3 + self.upgrades[envs, _UPGRADE_INDEX['extra_strike']]
+        self._apply_auto_guesses(envs)
+
+    def _apply_auto_guesses(self, envs):
+        """Vectorized GameManager.get_auto_guesses — one pass per upgrade slot."""
+        letters = self.puzzle_letters[self.puzzle[envs]]
+        for kind_mask, free_id, guaranteed_id in (
+            (CONSONANT_MASK, 'free_consonant', 'guaranteed_consonant'),
+            (VOWEL_MASK,     'free_vowel',     'guaranteed_vowel'),
+        ):
+            free_slots       = self.upgrades[envs, _UPGRADE_INDEX[free_id]]
+            guaranteed_slots = self.upgrades[envs, _UPGRADE_INDEX[guaranteed_id]]
+            for slot in range(int(free_slots.max(initial=0))):
+                active = np.flatnonzero(free_slots > slot)
+                rows   = envs[active]
+                open_letters = kind_mask & ~self.guessed[rows]
+                eligible     = np.where((guaranteed_slots[active] > slot)[:, None],
+                                        open_letters & letters[active], open_letters)
+                eligible     = np.where(eligible.any(axis=1)[:, None], eligible, open_letters)
+                picks, valid = self._random_letter(eligible)
+                self._reveal(rows[valid], picks[valid])
+
+    def _win(self, envs):
+        """Mirror of GameManager.win — record the puzzle, extend the streak, earn money, advance."""
+        self.seen[envs, self.puzzle[envs]] = True
+        self.streak[envs] += 1
+        difficulty   = self.difficulty[self.puzzle[envs]]
+        strikes_left = self.max_strikes[envs] - self.strikes[envs]
+        earned = np.round(difficulty / 10
+                          * np.maximum(self.streak[envs] / 10, 1)
+                          * (1 + 0.05 * strikes_left))
+        self.money[envs] += earned.astype(np.int64)
+
+        # As GameManager._advance_round: rebuild on a new tier, and an empty pool ends the run
+        rebuild = _difficulty_tier(self.streak[envs]) != self.tier[envs]
+        if rebuild.any():
+            self._build_pools(envs[rebuild])
+        complete = self.pool_size[envs] == 0
+        if complete.any():
+            self._reset_run(envs[complete])
+            envs = envs[~complete]
+        if envs.size:
+            self._start_round(envs)
+
+    def _reset_run(self, envs):
+        """Mirror of GameManager.lose — wipe run state and start a new round. Bonus strikes carry over."""
+        self.streak[envs]      = 0
+        self.money[envs]       = 0
+        self.upgrades[envs]    = 0
+        self.consumables[envs] = 0
+        self.seen[envs]        = False
+        self._fresh_pools(envs)
+        self._start_round(envs)
+
+    # -------------------------------------------------------------------------
+    # Guessing
+    # -------------------------------------------------------------------------
+
+    def _random_letter(self, eligible):
+        """Pick one eligible letter per row uniformly at random. Returns (letters, rows_with_any)."""
+        scores = self.rng.random(eligible.shape)
+        scores[~eligible] = -1.0
+        return scores.argmax(axis=1), eligible.any(axis=1)
+
+    def _reveal(self, envs, letters):
+        """Mark letters guessed and reveal their slots. Returns which environments matched."""
+        self.guessed[envs, letters] = True
+        hits = self.codes[self.puzzle[envs]] == letters[:, None]
+        self.revealed[envs] |= hits
+        return hits.any(axis=1)
+
+    def _solved(self, envs):
+        return (self.revealed[envs] | self.padding[self.puzzle[envs]]).all(axis=1)
+
+    def _guess(self, envs, letters, won, lost):
+        """Mirror of GameManager.guess. Already-guessed letters are no-ops."""
+        fresh   = ~self.guessed[envs, letters]
+        envs    = envs[fresh]
+        letters = letters[fresh]
+
+        free_used = self.free_guess[envs]
+        self.free_guess[envs] = False
+
+        matched = self._reveal(envs, letters)
+        won[envs[matched & self._solved(envs)]] = True
+
+        wrong    = envs[~matched & ~free_used]
+        absorbed = self.bonus_strikes[wrong] > 0
+        self.bonus_strikes[wrong[absorbed]] -= 1
+        struck = wrong[~absorbed]
+        self.strikes[struck] += 1
+        lost[struck[self.strikes[struck] >= self.max_strikes[struck]]] = True
+
+    # -------------------------------------------------------------------------
+    # Shop
+    # -------------------------------------------------------------------------
+
+    def _consumable_allowed(self, i, envs):
+        """Vectorized Shop._is_consumable_disabled plus the affordability check."""
+        item_id = CONSUMABLES[i]['id']
+        hidden  = self.puzzle_letters[self.puzzle[envs]] & ~self.guessed[envs]
+        if item_id == 'reveal_consonant':
+            allowed = (hidden & CONSONANT_MASK).any(axis=1)
+        elif item_id == 'reveal_vowel':
+            allowed = (hidden & VOWEL_MASK).any(axis=1)
+        elif item_id == 'eliminate_letters':
+            allowed = (~self.puzzle_letters[self.puzzle[envs]] & ~self.guessed[envs]).any(axis=1)
+        elif item_id == 'free_guess':
+            allowed = ~self.free_guess[envs]
+        elif item_id == 'bonus_strike':
+            allowed = (self.strikes[envs] > 0) | (self.bonus_strikes[envs] < 3)
+        else:
+            allowed = np.ones(envs.size, dtype=bool)
+        cost = self.consumable_costs[i, np.minimum(self.consumables[envs, i], _MAX_COST_STEPS - 1)]
+        return allowed & (self.money[envs] >= cost)
+
+    def _buy_consumable(self, i, envs, won):
+        envs = envs[self._consumable_allowed(i, envs)]
+        if not envs.size:
+            return
+        cost = self.consumable_costs[i, np.minimum(self.consumables[envs, i], _MAX_COST_STEPS - 1)]
+        self.money[envs]          -= cost
+        self.consumables[envs, i] += 1
+
+        item_id = CONSUMABLES[i]['id']
+        if item_id in ('reveal_consonant', 'reveal_vowel'):
+            kind = CONSONANT_MASK if item_id == 'reveal_consonant' else VOWEL_MASK
+            eligible = self.puzzle_letters[self.puzzle[envs]] & ~self.guessed[envs] & kind
+            picks, _ = self._random_letter(eligible)
+            self._reveal(envs, picks)
+            won[envs[self._solved(envs)]] = True
+        elif item_id == 'eliminate_letters':
+            for _ in range(3):
+                eligible = ~self.puzzle_letters[self.puzzle[envs]] & ~self.guessed[envs]
+                picks, valid = self._random_letter(eligible)
+                self.guessed[envs[valid], picks[valid]] = True
+        elif item_id == 'free_guess':
+            self.free_guess[envs] = True
+        elif item_id == 'bonus_strike':
+            recover = self.strikes[envs] > 0
+            self.strikes[envs[recover]]        -= 1
+            self.bonus_strikes[envs[~recover]] += 1
+
+    def _upgrade_allowed(self, i, envs):
+        """Vectorized Shop._item_available plus the affordability check."""
+        owned   = self.upgrades[envs, i]
+        allowed = owned < self.upgrade_max[i]
+        req     = self.upgrade_requires[i]
+        if req >= 0:
+            allowed &= self.upgrades[envs, req] > 0
+            if self.upgrade_per_purchase_prereq[i]:
+                allowed &= owned < self.upgrades[envs, req]
+        cost = self.upgrade_costs[i, np.minimum(owned, _MAX_COST_STEPS - 1)]
+        return allowed & (self.money[envs] >= cost)
+
+    def _buy_upgrade(self, i, envs):
+        """Upgrades take effect from the next round, as in GameManager._start_round."""
+        envs = envs[self._upgrade_allowed(i, envs)]
+        if not envs.size:
+            return
+        self.money[envs]       -= self.upgrade_costs[i, self.upgrades[envs, i]]
+        self.upgrades[envs, i] += 1
\ No newline at end of file